@@ -0,0 +1,88 @@
+# benchmarks/__main__.py
+
+
+"""
+Замеры производительности горячих участков кода.
+
+Запуск из папки experiments (работает без сети):
+
+    python -m benchmarks                          # все замеры
+    python -m benchmarks --max-size 10000         # быстрый прогон
+    python -m benchmarks --filter errors trainers # только выбранные группы
+    python -m benchmarks --save-baseline          # сохранить результаты как эталон
+    python -m benchmarks --compare                # сравнить с эталоном
+
+При сравнении замеры, ставшие медленнее эталона больше чем на --threshold,
+помечаются как 'замедление', и команда завершается с кодом 1. Эталон
+зависит от машины, поэтому сохраняйте и сравнивайте его на одном компьютере.
+"""
+
+import os
+import sys
+import json
+import argparse
+
+from .runner import (
+    BENCHMARKS, run_benchmarks, save_baseline, load_baseline,
+    compare_with_baseline, format_table, format_seconds
+)
+from . import suite  # noqa: F401 — регистрирует замеры
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры производительности")
+    parser.add_argument('--filter', nargs='+', metavar='ИМЯ', help="Подстроки имён замеров")
+    parser.add_argument('--sizes', nargs='+', type=int, help="Размеры данных (строк)")
+    parser.add_argument('--max-size', type=int, help="Пропускать размеры больше этого")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=5, help="Количество серий замера времени")
+    parser.add_argument('--min-time', type=float, default=0.05, help="Минимальная длительность серии, с")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Путь к файлу эталона")
+    parser.add_argument('--save-baseline', action='store_true', help="Сохранить результаты как эталон")
+    parser.add_argument('--compare', action='store_true', help="Сравнить с эталоном")
+    parser.add_argument('--threshold', type=float, default=0.10, help="Допустимое замедление (0.10 = 10%%)")
+    parser.add_argument('--json', metavar='ПУТЬ', help="Сохранить результаты в JSON")
+    parser.add_argument('--list', action='store_true', help="Показать список замеров")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, bench in sorted(BENCHMARKS.items()):
+            print(f"{name}: {', '.join(map(str, bench.sizes))}")
+        return 0
+
+    def progress(result):
+        print(f"  {result['name']}[{result['size']}]: {format_seconds(result['seconds'])}", file=sys.stderr)
+
+    results = run_benchmarks(
+        names=args.filter, sizes=args.sizes, max_size=args.max_size, seed=args.seed,
+        repeat=args.repeat, min_time=args.min_time, progress=progress
+    )
+
+    rows = results
+    if args.compare:
+        if not os.path.exists(args.baseline):
+            parser.error(f"эталон не найден: {args.baseline} (создайте его через --save-baseline)")
+        rows = compare_with_baseline(results, load_baseline(args.baseline), args.threshold)
+
+    print(format_table(rows))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        save_baseline(results, args.baseline)
+        print(f"Эталон сохранён: {args.baseline}", file=sys.stderr)
+
+    slowdowns = [row for row in rows if row.get('status') == 'замедление']
+    if slowdowns:
+        print(f"Замедление больше {args.threshold:.0%}: {len(slowdowns)} замер(ов)", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
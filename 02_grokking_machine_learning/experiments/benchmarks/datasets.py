@@ -0,0 +1,68 @@
+# benchmarks/datasets.py
+
+
+import numpy as np
+import pandas as pd
+
+
+def regression_data(n_rows, seed=0, noise=1.0):
+    """
+    Одномерная линейная зависимость y = 3x + 5 с шумом (как «цена от числа комнат»).
+
+    Возвращает:
+        tuple: (features (n_rows,), labels (n_rows,))
+    """
+    rng = np.random.default_rng(seed)
+    features = rng.uniform(1, 10, n_rows)
+    labels = 3 * features + 5 + rng.normal(0, noise, n_rows)
+    return features, labels
+
+
+def classification_data(n_rows, n_features=2, seed=0):
+    """
+    Два линейно разделимых (с небольшим перекрытием) облака точек.
+
+    Возвращает:
+        tuple: (features (n_rows, n_features), labels (n_rows,) из 0 и 1)
+    """
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, 2, n_rows)
+    centers = np.where(labels[:, None] == 1, 1.0, -1.0)
+    features = centers + rng.normal(0, 1.0, (n_rows, n_features))
+    return features, labels
+
+
+def scores_data(n_rows, seed=0):
+    """
+    Метки и «оценки модели» для метрик классификации.
+
+    Возвращает:
+        tuple: (labels (n_rows,), scores (n_rows,) в [0, 1])
+    """
+    rng = np.random.default_rng(seed)
+    labels = rng.integers(0, 2, n_rows)
+    scores = np.clip(0.5 + 0.25 * (2 * labels - 1) + rng.normal(0, 0.25, n_rows), 0, 1)
+    return labels, scores
+
+
+def threshold_frame(n_rows, seed=0, n_values=None):
+    """
+    Таблица для evaluate_thresholds: целочисленный признак и метка класса / цель регрессии.
+
+    Параметры:
+        n_rows (int): Количество строк.
+        seed (int): Seed генератора.
+        n_values (int, optional): Количество различных значений признака
+            (определяет число порогов). По умолчанию — не больше n_rows.
+
+    Возвращает:
+        pandas.DataFrame: Столбцы 'Признак', 'Класс', 'Цель'.
+    """
+    rng = np.random.default_rng(seed)
+    n_values = n_values or n_rows
+    feature = rng.integers(0, n_values, n_rows)
+    return pd.DataFrame({
+        'Признак': feature,
+        'Класс': (feature + rng.integers(0, n_values // 2 + 1, n_rows) > n_values // 2).astype(int),
+        'Цель': feature * 2.0 + rng.normal(0, 1, n_rows)
+    })
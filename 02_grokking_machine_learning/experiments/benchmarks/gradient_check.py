@@ -0,0 +1,57 @@
+# benchmarks/gradient_check.py
+
+
+"""
+Проверка градиентов NeuralNetwork для всех активаций, с dropout и без.
+
+Запуск из папки experiments:
+
+    python -m benchmarks.gradient_check
+
+Для каждой активации обратный проход сравнивается с численными
+градиентами (NeuralNetwork.gradient_check). Если расхождение больше
+TOLERANCE, команда завершается с кодом 1.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from models.neural_network import ACTIVATIONS, NeuralNetwork
+
+
+TOLERANCE = 1e-6
+DROPOUTS = (0.0, 0.5)
+
+
+def check_gradients(layer_sizes=(3, 5, 4, 3), n_samples=8, seed=0):
+    """
+    Возвращает:
+        pandas.DataFrame: Максимальное расхождение градиентов по активациям и долям dropout.
+    """
+    rng = np.random.default_rng(seed)
+    features = rng.normal(size=(n_samples, layer_sizes[0]))
+    labels = rng.integers(0, layer_sizes[-1], n_samples)
+
+    rows = []
+    for activation in ACTIVATIONS:
+        for dropout in DROPOUTS:
+            model = NeuralNetwork(layer_sizes, activation=activation, dropout=dropout, seed=seed)
+            # Ненулевые смещения: при нулевых смещениях и нулевом выходе relu предыдущего
+            # слоя z = 0 ровно в изломе relu, где численная производная не определена
+            model.biases = [rng.normal(0, 0.1, b.shape) for b in model.biases]
+            error = model.gradient_check(features, labels, seed=seed)
+            rows.append({'Активация': activation, 'Dropout': dropout, 'Расхождение': error,
+                         'OK': error < TOLERANCE})
+    return pd.DataFrame(rows)
+
+
+def main():
+    result = check_gradients()
+    print(result.to_string(index=False))
+    return 0 if result['OK'].all() else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
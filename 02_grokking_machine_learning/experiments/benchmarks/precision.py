@@ -0,0 +1,158 @@
+# benchmarks/precision.py
+
+
+"""
+Сравнение точности вычислений в float64 и float32 на датасетах из data/.
+
+Запуск из папки experiments:
+
+    python -m benchmarks.precision
+
+Каждая модель обучается дважды с одним и тем же seed — в float64 и в
+float32 (utils.dtype_policy) — и сравниваются метрика качества, итоговая
+ошибка обучения и максимальное расхождение весов.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.dtype_policy import using_dtype
+from utils.titanic_pipeline import titanic_pipeline
+from models.linear_regression import linear_regression
+from models.perceptron_algorithm import perceptron_algorithm
+from models.logistic_regression_algorithm import logistic_regression_algorithm
+from models.neural_network import NeuralNetwork
+
+
+def _accuracy(labels, predictions):
+    return float(np.mean(np.asarray(labels) == np.asarray(predictions)))
+
+
+def _linear_classifier(trainer, epochs):
+    """Обучение перцептрона / логистической регрессии и accuracy на тестовой части."""
+    def run(X_train, y_train, X_test, y_test):
+        result = trainer(X_train, y_train, epochs=epochs, rng=0)
+        weights = np.asarray(result['final_weights'], dtype=float)
+        scores = np.asarray(X_test, dtype=float) @ weights + float(result['final_bias'])
+        return {
+            'metric': _accuracy(y_test, (scores >= 0).astype(int)),
+            'train_error': float(result['errors_history'][-1]),
+            'weights': np.append(weights, float(result['final_bias']))
+        }
+    return run
+
+
+def _admission_regression(X_train, y_train, X_test, y_test):
+    """Линейная регрессия 'Chance of Admit' от CGPA; метрика — RMSE на тестовой части."""
+    slope, intercept, errors_list = linear_regression(
+        X_train, y_train, learning_rate=0.01, epochs=2000, rng=0
+    )
+    predictions = float(slope) * np.asarray(X_test, dtype=float) + float(intercept)
+    return {
+        'metric': float(np.sqrt(np.mean((np.asarray(y_test) - predictions) ** 2))),
+        'train_error': float(errors_list[-1]),
+        'weights': np.array([float(slope), float(intercept)])
+    }
+
+
+def _neural_network(X_train, y_train, X_test, y_test):
+    """Нейросеть [2, 32, 2] на датасете с окружностью; метрика — accuracy."""
+    model = NeuralNetwork([2, 32, 2], learning_rate=0.01, seed=0)
+    model.fit(X_train, y_train, epochs=100, batch_size=10)
+    return {
+        'metric': _accuracy(y_test, model.predict(X_test)),
+        'train_error': float(model.errors_history[-1]),
+        'weights': np.concatenate([w.astype(float).ravel() for w in model.weights])
+    }
+
+
+def _split(features, labels, seed=0, test_size=0.25):
+    order = np.random.default_rng(seed).permutation(len(features))
+    n_test = int(len(features) * test_size)
+    test, train = order[:n_test], order[n_test:]
+    return features[train], labels[train], features[test], labels[test]
+
+
+def load_datasets():
+    """
+    Датасеты для сравнения.
+
+    Возвращает:
+        list of tuple: (название, модель, метрика, функция обучения, признаки и метки train/test)
+    """
+    linear = pd.read_csv('data/linear.csv')
+    linear_split = _split(linear[['x_1', 'x_2']].to_numpy(), linear['y'].to_numpy())
+
+    circle = pd.read_csv('data/one_circle.csv')
+    circle_split = _split(circle[['x_1', 'x_2']].to_numpy(), circle['y'].to_numpy())
+
+    admission = pd.read_csv('data/Admission_Predict.csv')
+    admission_split = _split(admission['CGPA'].to_numpy(), admission['Chance of Admit'].to_numpy())
+
+    # Признаки Titanic стандартизуются по обучающей части: иначе большие значения Fare
+    # насыщают сигмоиду и логарифмическая потеря уходит в бесконечность
+    titanic = titanic_pipeline(use_cache=False).run(path='data/titanic.csv')
+    titanic_train = np.asarray(titanic['features_train'], dtype=float)
+    titanic_test = np.asarray(titanic['features_test'], dtype=float)
+    mean, std = titanic_train.mean(axis=0), titanic_train.std(axis=0) + 1e-12
+    titanic_split = (
+        (titanic_train - mean) / std, np.asarray(titanic['labels_train']),
+        (titanic_test - mean) / std, np.asarray(titanic['labels_test'])
+    )
+
+    return [
+        ('linear.csv', 'perceptron_algorithm', 'accuracy',
+         _linear_classifier(perceptron_algorithm, 1000), linear_split),
+        ('linear.csv', 'logistic_regression_algorithm', 'accuracy',
+         _linear_classifier(logistic_regression_algorithm, 1000), linear_split),
+        ('titanic.csv', 'logistic_regression_algorithm', 'accuracy',
+         _linear_classifier(logistic_regression_algorithm, 1000), titanic_split),
+        ('Admission_Predict.csv', 'linear_regression', 'rmse', _admission_regression, admission_split),
+        ('one_circle.csv', 'NeuralNetwork', 'accuracy', _neural_network, circle_split),
+    ]
+
+
+def compare_precision(datasets=None):
+    """
+    Обучает каждую модель в float64 и float32 и сравнивает результаты.
+
+    Возвращает:
+        pandas.DataFrame: По строке на пару (датасет, модель).
+    """
+    rows = []
+    for dataset, model, metric, run, data in datasets or load_datasets():
+        results = {}
+        for dtype in (np.float64, np.float32):
+            with using_dtype(dtype):
+                started = time.perf_counter()
+                results[dtype] = run(*data)
+                results[dtype]['seconds'] = time.perf_counter() - started
+
+        full, single = results[np.float64], results[np.float32]
+        rows.append({
+            'Датасет': dataset,
+            'Модель': model,
+            'Метрика': metric,
+            'float64': full['metric'],
+            'float32': single['metric'],
+            'Разница метрики': single['metric'] - full['metric'],
+            'Ошибка обучения float64': full['train_error'],
+            'Ошибка обучения float32': single['train_error'],
+            'Макс. расхождение весов': float(np.max(np.abs(single['weights'] - full['weights']))),
+            'Время float64, с': full['seconds'],
+            'Время float32, с': single['seconds']
+        })
+    return pd.DataFrame(rows)
+
+
+def main():
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(compare_precision().to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,252 @@
+# benchmarks/runner.py
+
+
+import gc
+import json
+import time
+import platform
+import tracemalloc
+
+import numpy as np
+
+
+SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+
+BENCHMARKS = {}  # Имя -> Benchmark
+
+
+class Benchmark:
+    """
+    Описание одного замера.
+
+    setup(size, seed) готовит данные заданного размера и возвращает функцию
+    без аргументов, которую и нужно замерять. Подготовка данных в замер не входит.
+    """
+
+    def __init__(self, name, setup, sizes=SIZES, rows_per_call=1):
+        """
+        Параметры:
+            name (str): Имя замера вида 'группа.функция'.
+            setup (callable): setup(size, seed) -> функция для замера.
+            sizes (tuple of int): Размеры данных (количество строк), на которых есть смысл замерять.
+            rows_per_call (int): Сколько раз функция проходит по данным за вызов
+                (например, число эпох тренера) — для расчёта пропускной способности.
+        """
+        self.name = name
+        self.setup = setup
+        self.sizes = tuple(sizes)
+        self.rows_per_call = rows_per_call
+
+
+def benchmark(name, sizes=SIZES, rows_per_call=1):
+    """Декоратор, регистрирующий функцию подготовки как замер."""
+    def register(setup):
+        BENCHMARKS[name] = Benchmark(name, setup, sizes, rows_per_call)
+        return setup
+    return register
+
+
+def time_call(func, repeat=5, min_time=0.05):
+    """
+    Замеряет время одного вызова функции.
+
+    Количество вызовов в серии подбирается так, чтобы серия шла не меньше
+    min_time секунд; результат — лучшая из repeat серий (наименее зашумлённая).
+
+    Возвращает:
+        float: Время одного вызова в секундах.
+    """
+    func()  # Прогрев: импорты, кеши, выделение памяти
+
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best
+
+
+def peak_memory(func):
+    """
+    Пиковый объём памяти, выделенной за один вызов функции (по tracemalloc;
+    NumPy сообщает tracemalloc о своих буферах).
+
+    Возвращает:
+        int: Пик в байтах сверх памяти, занятой до вызова.
+    """
+    gc.collect()
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        if not already_tracing:
+            tracemalloc.stop()
+
+
+def run_benchmarks(names=None, sizes=None, max_size=None, seed=0, repeat=5, min_time=0.05, progress=None):
+    """
+    Выполняет зарегистрированные замеры.
+
+    Параметры:
+        names (list of str, optional): Подстроки имён замеров для отбора. По умолчанию — все.
+        sizes (list of int, optional): Размеры данных. По умолчанию — размеры каждого замера.
+        max_size (int, optional): Пропускать размеры больше этого.
+        seed (int): Seed генерации данных (одинаковый для всех запусков).
+        repeat (int): Количество серий при замере времени.
+        min_time (float): Минимальная длительность серии в секундах.
+        progress (callable, optional): Вызывается с каждым готовым результатом.
+
+    Возвращает:
+        list of dict: {'name', 'size', 'seconds', 'rows_per_second', 'peak_bytes'}
+    """
+    results = []
+    for name, bench in sorted(BENCHMARKS.items()):
+        if names and not any(part in name for part in names):
+            continue
+        for size in bench.sizes:
+            if sizes and size not in sizes:
+                continue
+            if max_size and size > max_size:
+                continue
+
+            func = bench.setup(size, seed)
+            seconds = time_call(func, repeat=repeat, min_time=min_time)
+            result = {
+                'name': name,
+                'size': size,
+                'seconds': seconds,
+                'rows_per_second': size * bench.rows_per_call / seconds if seconds > 0 else float('inf'),
+                'peak_bytes': peak_memory(func)
+            }
+            results.append(result)
+            if progress is not None:
+                progress(result)
+            del func
+    return results
+
+
+def environment():
+    """Сведения о машине и версиях (сохраняются вместе с эталоном)."""
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor()
+    }
+
+
+def _key(result):
+    return f"{result['name']}[{result['size']}]"
+
+
+def save_baseline(results, path):
+    """Сохраняет результаты как эталон для последующих сравнений."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'environment': environment(),
+            'results': {_key(r): r for r in results}
+        }, f, ensure_ascii=False, indent=2)
+
+
+def load_baseline(path):
+    """Загружает эталон, сохранённый save_baseline."""
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_with_baseline(results, baseline, threshold=0.10):
+    """
+    Сравнивает результаты с эталоном.
+
+    Параметры:
+        results (list of dict): Результаты run_benchmarks.
+        baseline (dict): Эталон (load_baseline).
+        threshold (float): Допустимое относительное замедление (0.10 — на 10%).
+
+    Возвращает:
+        list of dict: Результаты с полями 'baseline_seconds', 'ratio' (текущее / эталон)
+                      и 'status': 'замедление', 'ускорение', 'ок' или 'нет эталона'.
+    """
+    reference = baseline.get('results', {})
+    rows = []
+    for result in results:
+        row = dict(result)
+        old = reference.get(_key(result))
+        if old is None:
+            row.update(baseline_seconds=None, ratio=None, status='нет эталона')
+        else:
+            ratio = result['seconds'] / old['seconds'] if old['seconds'] > 0 else float('inf')
+            if ratio > 1 + threshold:
+                status = 'замедление'
+            elif ratio < 1 / (1 + threshold):
+                status = 'ускорение'
+            else:
+                status = 'ок'
+            row.update(baseline_seconds=old['seconds'], ratio=ratio, status=status)
+        rows.append(row)
+    return rows
+
+
+def format_seconds(seconds):
+    """Время в удобных единицах: нс, мкс, мс или с."""
+    for unit, scale in (('с', 1), ('мс', 1e-3), ('мкс', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} нс"
+
+
+def format_bytes(n_bytes):
+    """Объём памяти в удобных единицах."""
+    for unit, scale in (('ГБ', 1 << 30), ('МБ', 1 << 20), ('КБ', 1 << 10)):
+        if n_bytes >= scale:
+            return f"{n_bytes / scale:.3g} {unit}"
+    return f"{n_bytes} Б"
+
+
+def format_table(rows):
+    """Текстовая таблица результатов (с колонками сравнения, если они есть)."""
+    header = ['Замер', 'Размер', 'Время', 'Строк/с', 'Пик памяти']
+    with_baseline = any('status' in row for row in rows)
+    if with_baseline:
+        header += ['Эталон', 'Отношение', 'Статус']
+
+    lines = []
+    for row in rows:
+        line = [
+            row['name'],
+            str(row['size']),
+            format_seconds(row['seconds']),
+            f"{row['rows_per_second']:.3g}",
+            format_bytes(row['peak_bytes'])
+        ]
+        if with_baseline:
+            line += [
+                format_seconds(row['baseline_seconds']) if row.get('baseline_seconds') else '-',
+                f"{row['ratio']:.2f}" if row.get('ratio') is not None else '-',
+                row.get('status', '')
+            ]
+        lines.append(line)
+
+    widths = [max(len(str(x)) for x in column) for column in zip(header, *lines)]
+
+    def render(cells):
+        return '  '.join(str(c).ljust(w) for c, w in zip(cells, widths))
+
+    return '\n'.join([render(header), render(['-' * w for w in widths])] + [render(line) for line in lines])
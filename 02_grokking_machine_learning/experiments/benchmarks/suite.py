@@ -0,0 +1,190 @@
+# benchmarks/suite.py
+
+
+import random
+
+import numpy as np
+import matplotlib
+
+matplotlib.use('Agg')  # Отрисовка без окна: замеры работают на сервере без дисплея
+import matplotlib.pyplot as plt  # noqa: E402
+
+from utils import errors  # noqa: E402
+from utils import metrics  # noqa: E402
+from utils.evaluate_thresholds import evaluate_thresholds  # noqa: E402
+from utils.plot_points import plot_points  # noqa: E402
+from utils.plot_decision_boundary import plot_decision_boundary  # noqa: E402
+from utils.plot_classifier_and_learning_history import plot_classifier  # noqa: E402
+from models.linear_regression import linear_regression  # noqa: E402
+from models.polynomial_regression import polynomial_regression, expand_polynomial_features  # noqa: E402
+from models.perceptron_algorithm import perceptron_algorithm  # noqa: E402
+from models.logistic_regression_algorithm import logistic_regression_algorithm  # noqa: E402
+
+from .runner import benchmark, SIZES  # noqa: E402
+from .datasets import regression_data, classification_data, scores_data, threshold_frame  # noqa: E402
+
+
+# Размеры для функций с поэлементными циклами Python (иначе прогон займёт минуты)
+LOOP_SIZES = SIZES[:4]
+SMALL_SIZES = SIZES[:3]
+
+TRAINER_EPOCHS = 5
+
+
+def _seeded(func, seed):
+    """Оборачивает вызов тренера: перед каждым вызовом фиксируются глобальные генераторы."""
+    def call():
+        random.seed(seed)
+        np.random.seed(seed)
+        return func()
+    return call
+
+
+def _figure(draw):
+    """Вызов функции рисования на новой фигуре с полной отрисовкой холста."""
+    def call():
+        fig, ax = plt.subplots()
+        draw(ax)
+        fig.canvas.draw()
+        plt.close(fig)
+    return call
+
+
+# === utils/errors ===
+
+@benchmark('errors.mae')
+def _mae(size, seed):
+    features, labels = regression_data(size, seed)
+    predictions = 3 * features + 5
+    return lambda: errors.mae(labels, predictions)
+
+
+@benchmark('errors.rmse')
+def _rmse(size, seed):
+    features, labels = regression_data(size, seed)
+    predictions = 3 * features + 5
+    return lambda: errors.rmse(labels, predictions)
+
+
+@benchmark('errors.score')
+def _score(size, seed):
+    features, _ = classification_data(size, n_features=10, seed=seed)
+    weights = np.ones(10)
+    return lambda: errors.score(weights, 0.5, features)
+
+
+@benchmark('errors.mean_perceptron_error', sizes=LOOP_SIZES)
+def _mean_perceptron_error(size, seed):
+    features, labels = classification_data(size, seed=seed)
+    return lambda: errors.mean_perceptron_error([1.0, 1.0], 0.0, features, labels)
+
+
+@benchmark('errors.total_log_loss', sizes=LOOP_SIZES)
+def _total_log_loss(size, seed):
+    features, labels = classification_data(size, seed=seed)
+    return lambda: errors.total_log_loss([1.0, 1.0], 0.0, features, labels)
+
+
+# === utils/metrics ===
+
+@benchmark('metrics.gini_index', sizes=LOOP_SIZES)
+def _gini_index(size, seed):
+    labels, _ = scores_data(size, seed)
+    groups = [labels[:size // 3], labels[size // 3:]]
+    return lambda: metrics.gini_index(groups)
+
+
+@benchmark('metrics.entropy', sizes=LOOP_SIZES)
+def _entropy(size, seed):
+    labels, _ = scores_data(size, seed)
+    groups = [labels[:size // 3], labels[size // 3:]]
+    return lambda: metrics.entropy(groups)
+
+
+@benchmark('metrics.mean_squared_deviation')
+def _mean_squared_deviation(size, seed):
+    _, labels = regression_data(size, seed)
+    return lambda: metrics.mean_squared_deviation(labels)
+
+
+# === utils/evaluate_thresholds ===
+
+@benchmark('evaluate_thresholds.classification', sizes=LOOP_SIZES)
+def _evaluate_thresholds_classification(size, seed):
+    # Число различных значений (а значит, и порогов) фиксировано: растёт только длина столбцов
+    df = threshold_frame(size, seed, n_values=50)
+    return lambda: evaluate_thresholds(df, 'Признак', 'Класс', task='classification')
+
+
+@benchmark('evaluate_thresholds.regression', sizes=LOOP_SIZES)
+def _evaluate_thresholds_regression(size, seed):
+    df = threshold_frame(size, seed, n_values=50)
+    return lambda: evaluate_thresholds(df, 'Признак', 'Цель', task='regression')
+
+
+# === Признаки ===
+
+@benchmark('features.expand_polynomial_features')
+def _expand_polynomial_features(size, seed):
+    features, _ = regression_data(size, seed)
+    return lambda: expand_polynomial_features(features, 5)
+
+
+# === Тренеры (TRAINER_EPOCHS эпох на вызов) ===
+
+@benchmark('trainers.linear_regression_batch', sizes=LOOP_SIZES, rows_per_call=TRAINER_EPOCHS)
+def _linear_regression_batch(size, seed):
+    features, labels = regression_data(size, seed)
+    return _seeded(lambda: linear_regression(
+        features, labels, learning_rate=1e-4, epochs=TRAINER_EPOCHS, mode='batch'
+    ), seed)
+
+
+@benchmark('trainers.polynomial_regression_batch', sizes=LOOP_SIZES, rows_per_call=TRAINER_EPOCHS)
+def _polynomial_regression_batch(size, seed):
+    features, labels = regression_data(size, seed)
+    return _seeded(lambda: polynomial_regression(
+        features, labels, degree=2, learning_rate=1e-6, epochs=TRAINER_EPOCHS, mode='batch'
+    ), seed)
+
+
+@benchmark('trainers.perceptron_algorithm', sizes=LOOP_SIZES, rows_per_call=TRAINER_EPOCHS)
+def _perceptron_algorithm(size, seed):
+    features, labels = classification_data(size, seed=seed)
+    return _seeded(lambda: perceptron_algorithm(features, labels, epochs=TRAINER_EPOCHS), seed)
+
+
+@benchmark('trainers.logistic_regression_algorithm', sizes=LOOP_SIZES, rows_per_call=TRAINER_EPOCHS)
+def _logistic_regression_algorithm(size, seed):
+    features, labels = classification_data(size, seed=seed)
+    return _seeded(lambda: logistic_regression_algorithm(features, labels, epochs=TRAINER_EPOCHS), seed)
+
+
+# === Графики ===
+
+@benchmark('plots.plot_points', sizes=LOOP_SIZES)
+def _plot_points(size, seed):
+    features, labels = classification_data(size, seed=seed)
+    return _figure(lambda ax: plot_points(features, labels, ax=ax))
+
+
+@benchmark('plots.plot_classifier_history', sizes=SMALL_SIZES)
+def _plot_classifier_history(size, seed):
+    # Размер — количество эпох в истории обучения; точек данных фиксированно 200
+    features, labels = classification_data(200, seed=seed)
+    rng = np.random.default_rng(seed)
+    weights_history = list(1 + 0.1 * rng.standard_normal((size, 2)).cumsum(axis=0))
+    bias_history = list(0.1 * rng.standard_normal(size).cumsum())
+    return _figure(lambda ax: plot_classifier(
+        weights_history[-1], bias_history[-1], features, labels,
+        weights_history=weights_history, bias_history=bias_history, ax=ax
+    ))
+
+
+@benchmark('plots.plot_decision_boundary', sizes=LOOP_SIZES)
+def _plot_decision_boundary(size, seed):
+    features, labels = classification_data(size, seed=seed)
+    return _figure(lambda ax: plot_decision_boundary(
+        features, labels, lambda x, y: (x + y > 0).astype(int),
+        ax=ax, use_sklearn_display=False, resolution=200
+    ))
@@ -4,6 +4,9 @@
 import random
 import numpy as np
 from utils.errors import mae, mse, rmse
+from utils.telemetry import make_hooks
+from utils.random_state import make_rng, epoch_indices, batch_indices
+from utils.dtype_policy import as_float
 
 
 def simple_trick(base_price, price_per_room, num_rooms, price, learning_rate):
@@ -108,7 +111,9 @@ def linear_regression(
         trick='square',  # Метод обновления весов: 'simple', 'absolute', 'square'
         error='rmse',  # Метрика оценки ошибки: 'mae', 'mse', 'rmse'
         mode='sgd',  # Режим обучения: 'sgd', 'batch', 'mini'
-        batch_size=2  # Размер подвыборки (только для режима 'mini')
+        batch_size=2,  # Размер подвыборки (только для режима 'mini')
+        callbacks=None,  # Обработчики событий обучения (utils.telemetry)
+        rng=None  # Seed или numpy.random.Generator (None — глобальные генераторы)
 ):
     """
     Обучает линейную модель с помощью различных режимов градиентного спуска и стратегий обновления весов.
@@ -122,6 +127,9 @@ def linear_regression(
         error (str): Метрика ошибки ('mae', 'mse', 'rmse').
         mode (str): Режим градиентного спуска ('sgd', 'batch', 'mini').
         batch_size (int): Размер мини-батча (используется только при mode='mini').
+        callbacks (list of Callback, optional): Обработчики событий обучения, например EpochProfiler.
+        rng (int, numpy.random.Generator, optional): Seed или генератор случайных чисел.
+            Если None — используются глобальные генераторы random / np.random (как раньше).
 
     Возвращает:
         tuple: (price_per_room, base_price, errors_list)
@@ -129,9 +137,17 @@ def linear_regression(
             base_price (float): Обученное смещение.
             errors_list (list): История ошибок на каждой эпохе.
     """
+    # Данные приводятся к типу вычислений (float64 или float32, см. utils.dtype_policy)
+    features = as_float(features)
+    labels = as_float(labels)
+
     # Инициализация параметров модели случайными значениями
-    price_per_room = random.random()
-    base_price = random.random()
+    if rng is None:
+        price_per_room = random.random()
+        base_price = random.random()
+    else:
+        rng = make_rng(rng)
+        price_per_room, base_price = (float(v) for v in rng.random(2))
 
     # Список для отслеживания ошибки на каждой итерации
     errors_list = []
@@ -159,40 +175,76 @@ def linear_regression(
     if mode not in {'sgd', 'batch', 'mini'}:
         raise ValueError("Режим должен быть: 'sgd', 'batch' или 'mini'")
 
+    # С явным генератором индексы примеров для всех эпох вытягиваются заранее одним вызовом
+    sampled = None
+    if rng is not None and mode == 'sgd':
+        sampled = epoch_indices(rng, len(features), epochs)
+    elif rng is not None and mode == 'mini':
+        sampled = batch_indices(rng, len(features), batch_size, epochs)
+
+    hooks = make_hooks(callbacks)
+    hooks.train_start({'trainer': 'linear_regression', 'learning_rate': learning_rate, 'epochs': epochs,
+                       'trick': trick, 'error': error, 'mode': mode, 'batch_size': batch_size,
+                       'params': {'price_per_room': price_per_room, 'base_price': base_price}})
+
     # Основной цикл обучения
     for epoch in range(epochs):
+        hooks.epoch_start(epoch)
+
         # Предсказание по всей выборке
-        predictions = price_per_room * features + base_price
+        with hooks.phase('predict'):
+            predictions = price_per_room * features + base_price
 
         # Сохраняем значение ошибки модели на текущей итерации
-        errors_list.append(errors[error](labels, predictions))
+        with hooks.phase('error'):
+            errors_list.append(errors[error](labels, predictions))
 
         # === Градиентный спуск по выбранному режиму ===
-        if mode == 'sgd':
-            # SGD: обновление на одной случайной точке
-            i = random.randint(0, len(features) - 1)
-            x_i, y_i = features[i], labels[i]
-            price_per_room, base_price = tricks[trick](
-                base_price, price_per_room, x_i, y_i, learning_rate
-            )
-
-        elif mode == 'batch':
-            # Batch GD: обновление на всех точках (классический режим)
-            for x_i, y_i in zip(features, labels):
-                predicted = price_per_room * x_i + base_price
-                error_i = y_i - predicted
-                # Обновляем параметры по градиенту
-                base_price += learning_rate * error_i
-                price_per_room += learning_rate * x_i * error_i
-
-        elif mode == 'mini':
-            # Mini-batch GD: обновление по подмножеству случайных точек
-            indices = np.random.choice(len(features), batch_size, replace=False)
-            for i in indices:
+        with hooks.phase('update'):
+            if mode == 'sgd':
+                # SGD: обновление на одной случайной точке
+                i = random.randint(0, len(features) - 1) if sampled is None else sampled[epoch]
                 x_i, y_i = features[i], labels[i]
                 price_per_room, base_price = tricks[trick](
                     base_price, price_per_room, x_i, y_i, learning_rate
                 )
+                n_updated = 1
+
+            elif mode == 'batch':
+                # Batch GD: обновление на всех точках (классический режим)
+                for x_i, y_i in zip(features, labels):
+                    predicted = price_per_room * x_i + base_price
+                    error_i = y_i - predicted
+                    # Обновляем параметры по градиенту
+                    base_price += learning_rate * error_i
+                    price_per_room += learning_rate * x_i * error_i
+                n_updated = len(features)
+
+            elif mode == 'mini':
+                # Mini-batch GD: обновление по подмножеству случайных точек
+                if sampled is None:
+                    indices = np.random.choice(len(features), batch_size, replace=False)
+                else:
+                    indices = sampled[epoch]
+                for i in indices:
+                    x_i, y_i = features[i], labels[i]
+                    price_per_room, base_price = tricks[trick](
+                        base_price, price_per_room, x_i, y_i, learning_rate
+                    )
+                n_updated = batch_size
+
+        hooks.batch(epoch, n_updated)
+        logs = {'error': errors_list[-1], 'samples': n_updated,
+                'params': {'price_per_room': price_per_room, 'base_price': base_price}}
+        if hooks.epoch_end(epoch, logs):
+            break
+
+    hooks.train_end({'epochs': len(errors_list), 'stop_reason': hooks.stop_reason or 'max_epochs'})
+
+    # Обработчик ранней остановки (utils.early_stopping) может вернуть лучшие веса вместо последних
+    restored = hooks.restored_params()
+    if restored is not None:
+        price_per_room, base_price = restored['price_per_room'], restored['base_price']
 
     # Возвращаем обученные параметры и историю ошибок
     return price_per_room, base_price, errors_list
@@ -0,0 +1,181 @@
+# chapter13/models/model_batch.py
+
+
+import numpy as np
+
+from utils.random_state import make_rng, epoch_indices, batch_indices
+from utils.dtype_policy import get_dtype
+
+
+def _batch_errors(kind, error, labels, scores):
+    """
+    Ошибка каждой из K моделей по матрице score (n_samples, K).
+
+    Для линейной регрессии — MAE/MSE/RMSE по столбцам, для логистической —
+    суммарная логарифмическая потеря (как total_log_loss), посчитанная
+    устойчиво через logaddexp: -y*log(p) - (1-y)*log(1-p) = log(1 + e^s) - y*s.
+    """
+    if kind == 'logistic':
+        return np.sum(np.logaddexp(0, scores) - labels[:, None] * scores, axis=0)
+
+    residuals = labels[:, None] - scores
+    if error == 'mae':
+        return np.mean(np.abs(residuals), axis=0)
+    squared = np.mean(residuals ** 2, axis=0)
+    return np.sqrt(squared) if error == 'rmse' else squared
+
+
+def fit_model_batch(
+        features,  # Матрица признаков (n_samples, n_features) или вектор (n_samples,)
+        labels,  # Целевые значения (регрессия) или метки 0/1 (логистическая регрессия)
+        learning_rates,  # Скорости обучения K моделей
+        epochs=1000,  # Количество эпох: одно число или по числу на модель
+        kind='linear',  # Тип моделей: 'linear' или 'logistic'
+        mode='sgd',  # Режим обучения: 'sgd', 'mini', 'batch'
+        batch_size=2,  # Размер мини-батча (для режима 'mini')
+        error='rmse',  # Метрика ошибки линейных моделей: 'mae', 'mse', 'rmse'
+        rng=None  # Seed или numpy.random.Generator
+):
+    """
+    Обучает K линейных или логистических моделей за один проход.
+
+    Веса K моделей хранятся матрицей (K, n_features), скорости обучения —
+    вектором (K,), поэтому на каждом шаге все модели обновляются одной
+    матричной операцией, а ошибка всех моделей считается одним умножением
+    матриц. Поиск по сетке скоростей обучения стоит примерно как одно обучение.
+
+    Все модели видят одни и те же примеры в одном порядке, поэтому различия
+    между ними объясняются только гиперпараметрами. Модель с меньшим числом
+    эпох перестаёт обновляться после своей последней эпохи.
+
+    Режимы:
+        'sgd'   — шаг по одному случайному примеру за эпоху (как в linear_regression
+                  и logistic_regression_algorithm);
+        'mini'  — шаг по среднему градиенту случайного мини-батча;
+        'batch' — шаг по среднему градиенту всей выборки.
+
+    Возвращает:
+        dict: Словарь с результатами обучения, содержащий:
+            - weights: Веса моделей (K, n_features)
+            - biases: Смещения моделей (K,)
+            - errors_history: Ошибки до обновления на каждой эпохе (max_epochs, K);
+              после последней эпохи модели — NaN
+            - learning_rates: Скорости обучения (K,)
+            - epochs: Количество эпох каждой модели (K,)
+    """
+    if kind not in {'linear', 'logistic'}:
+        raise ValueError("kind должен быть 'linear' или 'logistic'")
+
+    if mode not in {'sgd', 'mini', 'batch'}:
+        raise ValueError("Режим должен быть: 'sgd', 'batch' или 'mini'")
+
+    if error not in {'mae', 'mse', 'rmse'}:
+        raise ValueError("Ошибка должна быть одной из: 'mae', 'mse', 'rmse'")
+
+    # Все массивы — в типе вычислений (float64 или float32, см. utils.dtype_policy)
+    dtype = get_dtype()
+    X = np.asarray(features, dtype=dtype)
+    if X.ndim == 1:
+        X = X[:, None]
+    y = np.asarray(labels, dtype=dtype)
+    n_samples, n_features = X.shape
+
+    learning_rates = np.atleast_1d(np.asarray(learning_rates, dtype=dtype))
+    n_models = len(learning_rates)
+    epochs = np.broadcast_to(np.asarray(epochs, dtype=int), (n_models,)).copy()
+    max_epochs = int(epochs.max())
+
+    rng = make_rng(rng)
+
+    # Инициализация как в одиночных тренерах: случайные числа для регрессии,
+    # единичные веса и нулевое смещение для логистической регрессии
+    if kind == 'linear':
+        init = rng.random((n_models, n_features + 1), dtype=dtype)
+        W, b = init[:, :-1].copy(), init[:, -1].copy()
+    else:
+        W = np.ones((n_models, n_features), dtype=dtype)
+        b = np.zeros(n_models, dtype=dtype)
+
+    # Индексы примеров для всех эпох — одним вызовом генератора
+    if mode == 'sgd':
+        sampled = epoch_indices(rng, n_samples, max_epochs)
+    elif mode == 'mini':
+        sampled = batch_indices(rng, n_samples, batch_size, max_epochs)
+    else:
+        sampled = None
+
+    errors_history = np.full((max_epochs, n_models), np.nan, dtype=dtype)
+    scores = np.empty((n_samples, n_models), dtype=dtype)
+    step = learning_rates.copy()
+
+    for epoch in range(max_epochs):
+        # Модели, у которых эпохи закончились, получают нулевой шаг
+        if epoch in epochs:
+            step[epochs <= epoch] = 0.0
+
+        # Ошибка всех моделей по текущим весам: одно умножение (n, f) @ (f, K)
+        np.matmul(X, W.T, out=scores)
+        scores += b
+        errors_history[epoch] = _batch_errors(kind, error, y, scores)
+
+        if mode == 'sgd':
+            i = sampled[epoch]
+            x_i = X[i]
+            s = W @ x_i + b
+            residual = y[i] - (1 / (1 + np.exp(-s)) if kind == 'logistic' else s)
+            # Обновление всех K моделей: внешнее произведение (K,) x (f,)
+            W += np.outer(step * residual, x_i)
+            b += step * residual
+        else:
+            if mode == 'mini':
+                rows = sampled[epoch]
+                Xb, yb, s = X[rows], y[rows], scores[rows]
+            else:
+                Xb, yb, s = X, y, scores
+            residual = yb[:, None] - (1 / (1 + np.exp(-s)) if kind == 'logistic' else s)
+            # Средний градиент по батчу для всех моделей: (K, B) @ (B, f)
+            W += step[:, None] * (residual.T @ Xb) / len(Xb)
+            b += step * residual.mean(axis=0)
+
+    errors_history[np.arange(max_epochs)[:, None] >= epochs[None, :]] = np.nan
+
+    return {
+        'weights': W,
+        'biases': b,
+        'errors_history': errors_history,
+        'learning_rates': learning_rates,
+        'epochs': epochs
+    }
+
+
+def linear_regression_batch(features, labels, learning_rates, epochs=1000, mode='sgd',
+                            batch_size=2, error='rmse', rng=None):
+    """Пакет линейных регрессий с разными скоростями обучения (см. fit_model_batch)."""
+    return fit_model_batch(features, labels, learning_rates, epochs, kind='linear', mode=mode,
+                           batch_size=batch_size, error=error, rng=rng)
+
+
+def logistic_regression_batch(features, labels, learning_rates, epochs=1000, mode='sgd',
+                              batch_size=2, rng=None):
+    """Пакет логистических регрессий с разными скоростями обучения (см. fit_model_batch)."""
+    return fit_model_batch(features, labels, learning_rates, epochs, kind='logistic', mode=mode,
+                           batch_size=batch_size, rng=rng)
+
+
+def best_model(result):
+    """
+    Выбирает модель с наименьшей ошибкой на последней эпохе.
+
+    Возвращает:
+        dict: {'index', 'learning_rate', 'epochs', 'weights', 'bias', 'error'}
+    """
+    last = result['errors_history'][result['epochs'] - 1, np.arange(len(result['epochs']))]
+    k = int(np.nanargmin(last))
+    return {
+        'index': k,
+        'learning_rate': float(result['learning_rates'][k]),
+        'epochs': int(result['epochs'][k]),
+        'weights': result['weights'][k],
+        'bias': float(result['biases'][k]),
+        'error': float(last[k])
+    }
@@ -0,0 +1,332 @@
+# chapter10/models/neural_network.py
+
+
+import numpy as np
+
+from utils.dtype_policy import get_dtype
+
+
+# Функции активации скрытых слоёв и их производные.
+# Производная выражается через выход активации a, поэтому
+# для обратного прохода не нужно хранить входы z отдельно.
+ACTIVATIONS = {
+    'relu': (
+        lambda z, out: np.maximum(z, 0, out=out),
+        lambda a, out: np.greater(a, 0, out=out)
+    ),
+    'sigmoid': (
+        lambda z, out: np.divide(1, 1 + np.exp(-z, out=out), out=out),
+        lambda a, out: np.multiply(a, 1 - a, out=out)
+    ),
+    'tanh': (
+        lambda z, out: np.tanh(z, out=out),
+        lambda a, out: np.subtract(1, np.square(a, out=out), out=out)
+    ),
+}
+
+
+class NeuralNetwork:
+    """
+    Полносвязная нейронная сеть (многослойный перцептрон) на NumPy.
+
+    Скрытые слои используют активацию relu/sigmoid/tanh, выходной слой — softmax,
+    функция потерь — категориальная кросс-энтропия. Обучение мини-батчами
+    (SGD или Adam). Все буферы активаций, ошибок и градиентов выделяются
+    один раз при создании сети, а веса обновляются на месте, поэтому
+    внутри цикла обучения почти нет новых выделений памяти.
+
+    Метод predict возвращает номера классов, поэтому модель можно напрямую
+    передавать в plot_decision_boundary.
+
+    Пример (аналог Keras-модели из главы 10):
+        model = NeuralNetwork([2, 128, 64, 2], dropout=0.2, seed=0)
+        model.fit(x, y, epochs=200, batch_size=10)
+        plot_decision_boundary(x, y, model)
+    """
+
+    def __init__(
+            self,
+            layer_sizes,  # Размеры слоёв, включая входной и выходной: [2, 128, 64, 2]
+            activation='relu',  # Активация скрытых слоёв: 'relu', 'sigmoid', 'tanh'
+            learning_rate=0.001,  # Скорость обучения
+            optimizer='adam',  # Оптимизатор: 'adam' или 'sgd'
+            batch_size=10,  # Размер мини-батча (под него выделяются буферы)
+            dropout=0.0,  # Доля отключаемых нейронов скрытых слоёв при обучении
+            seed=None,  # Seed генератора случайных чисел
+            dtype=None  # Тип весов и буферов: float32 или float64 (по умолчанию — utils.dtype_policy)
+    ):
+        if activation not in ACTIVATIONS:
+            raise ValueError("activation должна быть 'relu', 'sigmoid' или 'tanh'")
+
+        if optimizer not in {'adam', 'sgd'}:
+            raise ValueError("optimizer должен быть 'adam' или 'sgd'")
+
+        if len(layer_sizes) < 2:
+            raise ValueError("Нужно указать как минимум входной и выходной слои")
+
+        self.layer_sizes = list(layer_sizes)
+        self.activation = activation
+        self.learning_rate = learning_rate
+        self.optimizer = optimizer
+        self.batch_size = batch_size
+        self.dropout = dropout
+        self.rng = np.random.default_rng(seed)
+        self.dtype = np.dtype(dtype) if dtype is not None else get_dtype()
+        self.errors_history = []
+
+        # Инициализация весов (He для relu, Xavier для остальных) и смещений
+        scale = 2.0 if activation == 'relu' else 1.0
+        self.weights = [
+            self.rng.normal(0, np.sqrt(scale / n_in), size=(n_in, n_out)).astype(self.dtype)
+            for n_in, n_out in zip(self.layer_sizes[:-1], self.layer_sizes[1:])
+        ]
+        self.biases = [np.zeros(n_out, dtype=self.dtype) for n_out in self.layer_sizes[1:]]
+
+        self._allocate_buffers(batch_size)
+
+    def _allocate_buffers(self, batch_size):
+        """Выделяет буферы активаций, ошибок, масок и градиентов для каждого слоя."""
+        sizes = self.layer_sizes[1:]
+        self._activations = [np.empty((batch_size, n), dtype=self.dtype) for n in sizes]
+        self._deltas = [np.empty((batch_size, n), dtype=self.dtype) for n in sizes]
+        self._derivatives = [np.empty((batch_size, n), dtype=self.dtype) for n in sizes[:-1]]
+        self._masks = [np.empty((batch_size, n), dtype=self.dtype) for n in sizes[:-1]]
+        self._grad_w = [np.empty_like(w) for w in self.weights]
+        self._grad_b = [np.empty_like(b) for b in self.biases]
+
+        # Моменты Adam (первый и второй) для весов и смещений
+        self._m_w = [np.zeros_like(w) for w in self.weights]
+        self._v_w = [np.zeros_like(w) for w in self.weights]
+        self._m_b = [np.zeros_like(b) for b in self.biases]
+        self._v_b = [np.zeros_like(b) for b in self.biases]
+        self._step = 0
+
+    def _forward(self, X, activations, masks=None, derivatives=None):
+        """
+        Прямой проход. Пишет выходы слоёв в переданные буферы activations.
+
+        Если переданы derivatives — в них пишутся производные активаций f'(a)
+        скрытых слоёв (для обратного прохода). Они считаются до dropout:
+        после умножения на маску выход слоя уже не равен f(z).
+        Если переданы masks — применяется dropout (только при обучении).
+        """
+        activate, derivative = ACTIVATIONS[self.activation]
+        a = X
+        last = len(self.weights) - 1
+
+        for layer, (W, b) in enumerate(zip(self.weights, self.biases)):
+            out = activations[layer]
+            np.matmul(a, W, out=out)
+            out += b
+
+            if layer < last:
+                activate(out, out)
+                if derivatives is not None:
+                    derivative(out, derivatives[layer])
+                if masks is not None:
+                    out *= masks[layer]
+            else:
+                # Softmax с вычитанием максимума для численной устойчивости
+                out -= out.max(axis=1, keepdims=True)
+                np.exp(out, out=out)
+                out /= out.sum(axis=1, keepdims=True)
+
+            a = out
+
+        return a
+
+    def _backward(self, X, Y, n):
+        """
+        Обратный проход: считает градиенты по мини-батчу из n примеров.
+
+        Производные активаций берутся из self._derivatives, заполненных в _forward.
+        """
+        acts = [a[:n] for a in self._activations]
+        deltas = [d[:n] for d in self._deltas]
+
+        # Ошибка выходного слоя для softmax + кросс-энтропии: (p - y) / n
+        np.subtract(acts[-1], Y, out=deltas[-1])
+        deltas[-1] /= n
+
+        for layer in range(len(self.weights) - 1, -1, -1):
+            a_prev = X if layer == 0 else acts[layer - 1]
+            np.matmul(a_prev.T, deltas[layer], out=self._grad_w[layer])
+            np.sum(deltas[layer], axis=0, out=self._grad_b[layer])
+
+            if layer > 0:
+                # Ошибка предыдущего слоя: delta @ W^T * f'(a) (* маска dropout)
+                prev = deltas[layer - 1]
+                np.matmul(deltas[layer], self.weights[layer].T, out=prev)
+                prev *= self._derivatives[layer - 1][:n]
+                if self.dropout > 0:
+                    prev *= self._masks[layer - 1][:n]
+
+    def _update(self):
+        """Обновляет веса на месте по посчитанным градиентам."""
+        lr = self.learning_rate
+
+        if self.optimizer == 'sgd':
+            for W, b, gW, gb in zip(self.weights, self.biases, self._grad_w, self._grad_b):
+                W -= lr * gW
+                b -= lr * gb
+            return
+
+        # Adam
+        beta1, beta2, eps = 0.9, 0.999, 1e-7
+        self._step += 1
+        # float, а не np.float64: иначе веса float32 пересчитывались бы во float64
+        lr_t = float(lr * np.sqrt(1 - beta2 ** self._step) / (1 - beta1 ** self._step))
+
+        params = zip(
+            self.weights + self.biases,
+            self._grad_w + self._grad_b,
+            self._m_w + self._m_b,
+            self._v_w + self._v_b
+        )
+        for param, grad, m, v in params:
+            m *= beta1
+            m += (1 - beta1) * grad
+            v *= beta2
+            v += (1 - beta2) * grad * grad
+            param -= lr_t * m / (np.sqrt(v) + eps)
+
+    def fit(self, features, labels, epochs=200, batch_size=None, shuffle=True):
+        """
+        Обучает сеть мини-батчами.
+
+        Параметры:
+            features (array-like): Матрица признаков (n_samples, n_features).
+            labels (array-like): Номера классов (n_samples,) или one-hot матрица.
+            epochs (int): Количество эпох.
+            batch_size (int, optional): Размер мини-батча. По умолчанию — заданный в конструкторе.
+            shuffle (bool): Перемешивать ли примеры перед каждой эпохой.
+
+        Возвращает:
+            NeuralNetwork: Обученная модель (история ошибок — в self.errors_history).
+        """
+        X = np.asarray(features, dtype=self.dtype)
+        labels = np.asarray(labels)
+        n_classes = self.layer_sizes[-1]
+
+        # Метки переводим в one-hot один раз
+        if labels.ndim == 1:
+            Y = np.zeros((len(labels), n_classes), dtype=self.dtype)
+            Y[np.arange(len(labels)), labels.astype(int)] = 1.0
+        else:
+            Y = labels.astype(self.dtype)
+
+        if batch_size is not None and batch_size != self.batch_size:
+            self.batch_size = batch_size
+            self._allocate_buffers(batch_size)
+
+        n_samples = len(X)
+        bs = self.batch_size
+        keep = 1.0 - self.dropout
+
+        for epoch in range(epochs):
+            order = self.rng.permutation(n_samples) if shuffle else np.arange(n_samples)
+            epoch_loss = 0.0
+
+            for start in range(0, n_samples, bs):
+                idx = order[start:start + bs]
+                n = len(idx)
+                X_batch = X[idx]
+                Y_batch = Y[idx]
+
+                masks = None
+                if self.dropout > 0:
+                    # Маски dropout с масштабированием 1 / keep (inverted dropout)
+                    masks = [m[:n] for m in self._masks]
+                    for m in masks:
+                        m[...] = self.rng.random(m.shape) < keep
+                        m /= keep
+
+                probs = self._forward(X_batch, [a[:n] for a in self._activations], masks,
+                                      [d[:n] for d in self._derivatives])
+                epoch_loss -= np.sum(Y_batch * np.log(np.clip(probs, 1e-12, 1.0)))
+
+                self._backward(X_batch, Y_batch, n)
+                self._update()
+
+            # Средняя кросс-энтропия за эпоху
+            self.errors_history.append(epoch_loss / n_samples)
+
+        return self
+
+    def gradient_check(self, features, labels, epsilon=1e-6, seed=0):
+        """
+        Сравнивает градиенты обратного прохода с численными (центральные разности).
+
+        Проверка идёт на копии сети в float64, с одной и той же случайной
+        маской dropout для всех вычислений потерь, поэтому dropout тоже проверяется.
+        Сама сеть не меняется.
+
+        Параметры:
+            features (array-like): Небольшая матрица признаков (n_samples, n_features).
+            labels (array-like): Номера классов (n_samples,).
+            epsilon (float): Шаг численного дифференцирования.
+            seed (int): Seed маски dropout.
+
+        Возвращает:
+            float: Максимальное абсолютное расхождение градиентов по всем весам и смещениям.
+        """
+        X = np.asarray(features, dtype=np.float64)
+        n = len(X)
+        Y = np.zeros((n, self.layer_sizes[-1]))
+        Y[np.arange(n), np.asarray(labels).astype(int)] = 1.0
+
+        probe = NeuralNetwork(self.layer_sizes, self.activation, dropout=self.dropout,
+                              batch_size=n, seed=seed, dtype=np.float64)
+        probe.weights = [W.astype(np.float64) for W in self.weights]
+        probe.biases = [b.astype(np.float64) for b in self.biases]
+
+        masks = None
+        if self.dropout > 0:
+            keep = 1.0 - self.dropout
+            masks = probe._masks
+            for m in masks:
+                m[...] = probe.rng.random(m.shape) < keep
+                m /= keep
+
+        def loss():
+            probs = probe._forward(X, probe._activations, masks, probe._derivatives)
+            return -np.sum(Y * np.log(np.clip(probs, 1e-12, 1.0))) / n
+
+        loss()
+        probe._backward(X, Y, n)
+        analytic = [g.copy() for g in probe._grad_w + probe._grad_b]
+
+        error = 0.0
+        for param, grad in zip(probe.weights + probe.biases, analytic):
+            for index in np.ndindex(param.shape):
+                original = param[index]
+                param[index] = original + epsilon
+                loss_plus = loss()
+                param[index] = original - epsilon
+                loss_minus = loss()
+                param[index] = original
+                error = max(error, abs((loss_plus - loss_minus) / (2 * epsilon) - grad[index]))
+        return error
+
+    def predict_proba(self, features):
+        """
+        Возвращает вероятности классов (n_samples, n_classes).
+
+        Большие входы обрабатываются частями, чтобы не выделять
+        огромные промежуточные матрицы (например, для сетки 500x500).
+        """
+        X = np.asarray(features, dtype=self.dtype)
+        result = np.empty((len(X), self.layer_sizes[-1]), dtype=self.dtype)
+        chunk = 8192
+        buffers = [np.empty((min(chunk, len(X)), n), dtype=self.dtype) for n in self.layer_sizes[1:]]
+
+        for start in range(0, len(X), chunk):
+            part = X[start:start + chunk]
+            n = len(part)
+            result[start:start + n] = self._forward(part, [b[:n] for b in buffers])
+
+        return result
+
+    def predict(self, features):
+        """Возвращает номера предсказанных классов (n_samples,)."""
+        return np.argmax(self.predict_proba(features), axis=1)
@@ -3,6 +3,9 @@
 
 import random
 from utils.errors import perceptron_prediction, mean_perceptron_error
+from utils.telemetry import make_hooks
+from utils.random_state import make_rng, epoch_indices
+from utils.dtype_policy import as_float
 
 
 def perceptron_trick(weights, bias, features, label, learning_rate=0.01):
@@ -34,7 +37,7 @@ def perceptron_trick(weights, bias, features, label, learning_rate=0.01):
     return weights, bias
 
 
-def perceptron_algorithm(features, labels, learning_rate=0.01, epochs=200):
+def perceptron_algorithm(features, labels, learning_rate=0.01, epochs=200, callbacks=None, rng=None):
     """
     Реализует алгоритм обучения персептрона.
 
@@ -43,6 +46,9 @@ def perceptron_algorithm(features, labels, learning_rate=0.01, epochs=200):
         labels (list): Вектор меток классов (0 или 1 для каждого примера)
         learning_rate (float, optional): Скорость обучения. По умолчанию 0.01.
         epochs (int, optional): Количество эпох обучения. По умолчанию 200.
+        callbacks (list of Callback, optional): Обработчики событий обучения, например EpochProfiler.
+        rng (int, numpy.random.Generator, optional): Seed или генератор случайных чисел.
+            Если None — используются глобальные генераторы random / np.random (как раньше).
 
     Возвращает:
         dict: Словарь с результатами обучения, содержащий:
@@ -51,6 +57,8 @@ def perceptron_algorithm(features, labels, learning_rate=0.01, epochs=200):
             - errors_history: История ошибок на каждой эпохе
             - weights_history: История весов на каждой эпохе
             - bias_history: История смещений на каждой эпохе
+            - stop_reason: Причина остановки ('max_epochs' или причина от обработчика, например 'plateau')
+            - stopped_epoch: Номер последней выполненной эпохи
     """
     # Инициализация весов и смещения:
     # Веса инициализируются единицами (можно использовать случайные небольшие числа)
@@ -58,30 +66,59 @@ def perceptron_algorithm(features, labels, learning_rate=0.01, epochs=200):
     weights = [1.0 for i in range(len(features[0]))]
     bias = 0.0
 
+    # Данные приводятся к типу вычислений (float64 или float32, см. utils.dtype_policy);
+    # веса и смещение затем остаются в том же типе без повышения точности
+    features = as_float(features)
+    labels = as_float(labels)
+
     # Инициализация массивов для хранения истории обучения:
     errors_list = []  # Будет хранить ошибку на каждой эпохе
     weights_history = []  # Будет хранить веса на каждой эпохе
     bias_history = []  # Будет хранить смещение на каждой эпохе
 
+    # С явным генератором индексы примеров для всех эпох вытягиваются заранее одним вызовом
+    sampled = None if rng is None else epoch_indices(make_rng(rng), len(features), epochs)
+
+    hooks = make_hooks(callbacks)
+    hooks.train_start({'trainer': 'perceptron_algorithm', 'learning_rate': learning_rate, 'epochs': epochs,
+                       'params': {'weights': weights, 'bias': bias}})
+
     # Основной цикл обучения:
     for epoch in range(epochs):
+        hooks.epoch_start(epoch)
+
         # Сохраняем текущие веса и смещение перед обновлением
         # Используем copy(), чтобы избежать ссылочной зависимости
-        weights_history.append(weights.copy())
-        bias_history.append(bias)
+        with hooks.phase('history'):
+            weights_history.append(weights.copy())
+            bias_history.append(bias)
 
         # Вычисляем среднюю ошибку на текущих весах и сохраняем ее
-        error = mean_perceptron_error(weights, bias, features, labels)
-        errors_list.append(error)
+        with hooks.phase('error'):
+            error = mean_perceptron_error(weights, bias, features, labels)
+            errors_list.append(error)
+
+        with hooks.phase('update'):
+            # Выбираем случайный пример из обучающего набора для обновления весов
+            i = random.randint(0, len(features) - 1) if sampled is None else sampled[epoch]
+
+            # Применяем правило персептрона для обновления весов и смещения
+            # на основе выбранного случайного примера
+            weights, bias = perceptron_trick(
+                weights, bias, features[i], labels[i], learning_rate
+            )
+
+        hooks.batch(epoch, 1)
+        logs = {'error': errors_list[-1], 'samples': 1, 'params': {'weights': weights, 'bias': bias}}
+        if hooks.epoch_end(epoch, logs):
+            break
 
-        # Выбираем случайный пример из обучающего набора для обновления весов
-        i = random.randint(0, len(features) - 1)
+    hooks.train_end({'epochs': len(errors_list), 'stop_reason': hooks.stop_reason or 'max_epochs'})
 
-        # Применяем правило персептрона для обновления весов и смещения
-        # на основе выбранного случайного примера
-        weights, bias = perceptron_trick(
-            weights, bias, features[i], labels[i], learning_rate
-        )
+    # Обработчик ранней остановки (utils.early_stopping) может вернуть лучшие веса вместо последних
+    restored = hooks.restored_params()
+    if restored is not None:
+        weights, bias = list(restored['weights']), restored['bias']
 
     # Возвращаем результаты обучения в виде словаря
     return {
@@ -89,5 +126,7 @@ def perceptron_algorithm(features, labels, learning_rate=0.01, epochs=200):
         'final_bias': bias,  # Финальное смещение модели
         'errors_history': errors_list,  # История ошибок
         'weights_history': weights_history,  # История весов
-        'bias_history': bias_history  # История смещений
+        'bias_history': bias_history,  # История смещений
+        'stop_reason': hooks.stop_reason or 'max_epochs',  # Причина остановки
+        'stopped_epoch': len(errors_list) - 1  # Последняя выполненная эпоха
     }
@@ -9,6 +9,9 @@ from sklearn.metrics import mean_absolute_error, mean_squared_error
 from sklearn.linear_model import LinearRegression, Lasso, Ridge
 
 from utils.errors import mae, mse, rmse
+from utils.telemetry import make_hooks
+from utils.random_state import make_rng, epoch_indices, batch_indices
+from utils.dtype_policy import as_float
 
 
 def square_trick_poly(weights, x, y, learning_rate):
@@ -39,9 +42,12 @@ def expand_polynomial_features(features, degree):
         degree (int): Степень полинома (например, 2 создаёт x^0, x^1, x^2).
 
     Returns:
-        np.ndarray: Массив формы (n_samples, degree + 1) с полиномиальными признаками.
+        np.ndarray: Массив формы (n_samples, degree + 1) с полиномиальными признаками
+            (в типе вычислений из utils.dtype_policy).
     """
-    return np.array([x ** np.arange(degree + 1) for x in features])
+    # Все степени всех x одной операцией: внешняя степень вектора x и вектора показателей
+    x = as_float(features).ravel()
+    return np.power.outer(x, np.arange(degree + 1, dtype=x.dtype))
 
 
 def polynomial_regression(
@@ -52,11 +58,18 @@ def polynomial_regression(
         epochs=1000,  # Количество итераций обучения
         error='rmse',  # Выбранная метрика ошибки: 'mae', 'mse', 'rmse'
         mode='sgd',  # Режим обучения: 'sgd', 'mini', 'batch'
-        batch_size=2  # Размер мини-батча (для режима 'mini')
+        batch_size=2,  # Размер мини-батча (для режима 'mini')
+        callbacks=None,  # Обработчики событий обучения (utils.telemetry)
+        rng=None  # Seed или numpy.random.Generator (None — глобальные генераторы)
 ):
     """
     Обучает модель полиномиальной регрессии с использованием градиентного спуска.
 
+    Parameters:
+        callbacks (list of Callback, optional): Обработчики событий обучения, например EpochProfiler.
+        rng (int, numpy.random.Generator, optional): Seed или генератор случайных чисел.
+            Если None — используются глобальные генераторы random / np.random (как раньше).
+
     Returns:
         tuple:
             - weights (np.ndarray): Обученные коэффициенты полинома.
@@ -66,7 +79,11 @@ def polynomial_regression(
     X_poly = expand_polynomial_features(features, degree)
 
     # Шаг 2: инициализация весов случайными значениями
-    weights = np.random.rand(degree + 1)
+    if rng is None:
+        weights = np.random.rand(degree + 1).astype(X_poly.dtype)
+    else:
+        rng = make_rng(rng)
+        weights = rng.random(degree + 1, dtype=X_poly.dtype)
 
     # Шаг 3: определение метрики ошибки
     errors = {
@@ -80,39 +97,75 @@ def polynomial_regression(
 
     # Список для отслеживания ошибки на каждой итерации
     errors_list = []
+    labels = as_float(labels)
+
+    # С явным генератором индексы примеров для всех эпох вытягиваются заранее одним вызовом
+    sampled = None
+    if rng is not None and mode == 'sgd':
+        sampled = epoch_indices(rng, len(features), epochs)
+    elif rng is not None and mode == 'mini':
+        sampled = batch_indices(rng, len(features), batch_size, epochs)
+
+    hooks = make_hooks(callbacks)
+    hooks.train_start({'trainer': 'polynomial_regression', 'degree': degree, 'learning_rate': learning_rate,
+                       'epochs': epochs, 'error': error, 'mode': mode, 'batch_size': batch_size,
+                       'params': {'weights': weights}})
 
     # Шаг 4: цикл обучения
     for epoch in range(epochs):
+        hooks.epoch_start(epoch)
+
         # Текущее предсказание модели по всей обучающей выборке
-        predictions = np.dot(X_poly, weights)
+        with hooks.phase('predict'):
+            predictions = np.dot(X_poly, weights)
 
         # Вычисляем и сохраняем ошибку по текущим весам
-        errors_list.append(errors[error](labels, predictions))
+        with hooks.phase('error'):
+            errors_list.append(errors[error](labels, predictions))
 
         # === Выбор режима обучения ===
-        if mode == 'sgd':
-            # Стохастический градиентный спуск: обновляем по одной случайной точке
-            i = random.randint(0, len(features) - 1)
-            x_i = X_poly[i]
-            y_i = labels[i]
-            weights = square_trick_poly(weights, x_i, y_i, learning_rate)
-
-        elif mode == 'mini':
-            # Мини-батч: выбираем случайную подгруппу точек и обновляем веса по ним
-            indices = np.random.choice(len(features), batch_size, replace=False)
-            for i in indices:
+        with hooks.phase('update'):
+            if mode == 'sgd':
+                # Стохастический градиентный спуск: обновляем по одной случайной точке
+                i = random.randint(0, len(features) - 1) if sampled is None else sampled[epoch]
                 x_i = X_poly[i]
                 y_i = labels[i]
                 weights = square_trick_poly(weights, x_i, y_i, learning_rate)
-
-        elif mode == 'batch':
-            # Пакетный градиентный спуск: проходим по всем точкам
-            for x_i, y_i in zip(X_poly, labels):
-                weights = square_trick_poly(weights, x_i, y_i, learning_rate)
-
-        else:
-            # Некорректный режим обучения
-            raise ValueError("mode должен быть 'sgd', 'batch' или 'mini'")
+                n_updated = 1
+
+            elif mode == 'mini':
+                # Мини-батч: выбираем случайную подгруппу точек и обновляем веса по ним
+                if sampled is None:
+                    indices = np.random.choice(len(features), batch_size, replace=False)
+                else:
+                    indices = sampled[epoch]
+                for i in indices:
+                    x_i = X_poly[i]
+                    y_i = labels[i]
+                    weights = square_trick_poly(weights, x_i, y_i, learning_rate)
+                n_updated = batch_size
+
+            elif mode == 'batch':
+                # Пакетный градиентный спуск: проходим по всем точкам
+                for x_i, y_i in zip(X_poly, labels):
+                    weights = square_trick_poly(weights, x_i, y_i, learning_rate)
+                n_updated = len(X_poly)
+
+            else:
+                # Некорректный режим обучения
+                raise ValueError("mode должен быть 'sgd', 'batch' или 'mini'")
+
+        hooks.batch(epoch, n_updated)
+        logs = {'error': errors_list[-1], 'samples': n_updated, 'params': {'weights': weights}}
+        if hooks.epoch_end(epoch, logs):
+            break
+
+    hooks.train_end({'epochs': len(errors_list), 'stop_reason': hooks.stop_reason or 'max_epochs'})
+
+    # Обработчик ранней остановки (utils.early_stopping) может вернуть лучшие веса вместо последних
+    restored = hooks.restored_params()
+    if restored is not None:
+        weights = restored['weights']
 
     # Возвращаем обученные веса и историю ошибок
     return weights, errors_list
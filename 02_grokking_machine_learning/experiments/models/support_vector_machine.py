@@ -0,0 +1,374 @@
+# chapter11/models/support_vector_machine.py
+
+
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+
+
+def linear_kernel(A, B, gamma=None, degree=None, coef0=None):
+    """Линейное ядро: K(a, b) = a · b."""
+    return A @ B.T
+
+
+def polynomial_kernel(A, B, gamma=1.0, degree=3, coef0=1.0):
+    """Полиномиальное ядро: K(a, b) = (gamma * a · b + coef0) ^ degree."""
+    return (gamma * (A @ B.T) + coef0) ** degree
+
+
+def rbf_kernel(A, B, gamma=1.0, degree=None, coef0=None):
+    """
+    Гауссово (RBF) ядро: K(a, b) = exp(-gamma * ||a - b||^2).
+
+    Квадрат расстояния считается через ||a||^2 + ||b||^2 - 2 a·b,
+    то есть одним матричным умножением для всего блока.
+    """
+    sq_dist = (
+            np.einsum('ij,ij->i', A, A)[:, None]
+            + np.einsum('ij,ij->i', B, B)[None, :]
+            - 2 * (A @ B.T)
+    )
+    np.maximum(sq_dist, 0, out=sq_dist)  # Убираем отрицательные значения из-за округления
+    return np.exp(-gamma * sq_dist)
+
+
+def kernel_diagonal(kernel, X, kernel_params):
+    """
+    Диагональ матрицы Грама K(x_i, x_i) одной векторной операцией.
+
+    Для известных ядер она выражается через квадраты норм строк
+    (для RBF — всегда 1); для остальных ядро вычисляется блоками,
+    а из каждого блока берётся его диагональ.
+    """
+    sq_norms = np.einsum('ij,ij->i', X, X)
+    if kernel is linear_kernel:
+        return sq_norms
+    if kernel is polynomial_kernel:
+        return (kernel_params['gamma'] * sq_norms + kernel_params['coef0']) ** kernel_params['degree']
+    if kernel is rbf_kernel:
+        return np.ones(len(X))
+
+    block = 1024
+    return np.concatenate([
+        np.diagonal(kernel(X[start:start + block], X[start:start + block], **kernel_params))
+        for start in range(0, len(X), block)
+    ])
+
+
+KERNELS = {
+    'linear': linear_kernel,
+    'poly': polynomial_kernel,
+    'rbf': rbf_kernel
+}
+
+
+class KernelCache:
+    """
+    LRU-кеш строк матрицы Грама K(X, X).
+
+    Хранит не больше строк, чем помещается в заданный бюджет памяти.
+    При переполнении вытесняется строка, к которой дольше всего не обращались.
+    Ведёт статистику попаданий и промахов.
+    """
+
+    def __init__(self, X, kernel, kernel_params, cache_size_mb=100):
+        """
+        Параметры:
+            X (numpy.ndarray): Обучающая выборка (n_samples, n_features).
+            kernel (callable): Функция ядра K(A, B).
+            kernel_params (dict): Параметры ядра (gamma, degree, coef0).
+            cache_size_mb (float): Бюджет памяти кеша в мегабайтах.
+        """
+        self.X = X
+        self.kernel = kernel
+        self.kernel_params = kernel_params
+        row_bytes = X.shape[0] * X.itemsize
+        self.max_rows = max(2, int(cache_size_mb * 1024 ** 2 // row_bytes))
+        self._rows = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+        # Диагональ матрицы Грама нужна постоянно, поэтому считается заранее
+        self.diagonal = kernel_diagonal(kernel, X, kernel_params)
+
+    def row(self, i):
+        """Возвращает i-ю строку матрицы Грама (из кеша или с вычислением)."""
+        row = self._rows.get(i)
+        if row is not None:
+            self.hits += 1
+            self._rows.move_to_end(i)
+            return row
+
+        self.misses += 1
+        row = self.kernel(self.X, self.X[i:i + 1], **self.kernel_params).ravel()
+        self._rows[i] = row
+        if len(self._rows) > self.max_rows:
+            self._rows.popitem(last=False)  # Вытесняем самую давно использованную строку
+        return row
+
+    def info(self):
+        """
+        Статистика кеша.
+
+        Возвращает:
+            dict: hits, misses, hit_rate, rows (занято строк), max_rows (ёмкость).
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'rows': len(self._rows),
+            'max_rows': self.max_rows
+        }
+
+
+class SupportVectorMachine:
+    """
+    Метод опорных векторов (бинарная классификация), обучаемый алгоритмом SMO.
+
+    На каждом шаге SMO выбирается пара переменных (выбор второго порядка,
+    как в LIBSVM) и оптимизируется аналитически. Нужные строки матрицы Грама
+    берутся из LRU-кеша с ограничением по памяти. Эвристика сжатия (shrinking)
+    временно исключает переменные, застрявшие на границах, чтобы выбор пары
+    и обновление градиента шли по меньшему активному множеству.
+
+    Пример:
+        svm = SupportVectorMachine(kernel='rbf', C=1, gamma=1, cache_size_mb=10)
+        svm.fit(x, y)
+        plot_decision_boundary(x, y, svm)
+        svm.cache_info()
+    """
+
+    def __init__(
+            self,
+            kernel='rbf',  # Ядро: 'rbf', 'poly' или 'linear'
+            C=1.0,  # Параметр регуляризации
+            gamma='scale',  # Параметр ядра: число или 'scale' (1 / (n_features * X.var()))
+            degree=3,  # Степень полиномиального ядра
+            coef0=1.0,  # Свободный член полиномиального ядра
+            tol=1e-3,  # Допуск на нарушение условий ККТ
+            max_iter=100000,  # Максимальное количество шагов SMO
+            cache_size_mb=100,  # Бюджет памяти кеша строк ядра
+            shrinking=True,  # Использовать ли сжатие активного множества
+            batch_size=4096  # Размер блока при вычислении decision_function
+    ):
+        if kernel not in KERNELS:
+            raise ValueError("kernel должен быть 'rbf', 'poly' или 'linear'")
+
+        self.kernel = kernel
+        self.C = C
+        self.gamma = gamma
+        self.degree = degree
+        self.coef0 = coef0
+        self.tol = tol
+        self.max_iter = max_iter
+        self.cache_size_mb = cache_size_mb
+        self.shrinking = shrinking
+        self.batch_size = batch_size
+
+    def _kernel_params(self, X):
+        """Параметры ядра с вычисленным значением gamma."""
+        gamma = self.gamma
+        if gamma == 'scale':
+            variance = X.var()
+            gamma = 1.0 / (X.shape[1] * variance) if variance > 0 else 1.0
+        return {'gamma': float(gamma), 'degree': self.degree, 'coef0': self.coef0}
+
+    def fit(self, features, labels):
+        """
+        Обучает модель.
+
+        Параметры:
+            features (array-like): Матрица признаков (n_samples, n_features).
+            labels (array-like): Метки двух классов (например, 0 и 1).
+
+        Возвращает:
+            SupportVectorMachine: Обученная модель.
+        """
+        X = np.asarray(features, dtype=float)
+        labels = np.asarray(labels)
+        self.classes_ = np.unique(labels)
+        if len(self.classes_) != 2:
+            raise ValueError("Поддерживается только бинарная классификация")
+
+        # Метки переводим в {-1, +1}
+        y = np.where(labels == self.classes_[1], 1.0, -1.0)
+        n = len(X)
+        C = self.C
+
+        self._params = self._kernel_params(X)
+        self._cache = KernelCache(X, KERNELS[self.kernel], self._params, self.cache_size_mb)
+        diagonal = self._cache.diagonal
+
+        alpha = np.zeros(n)
+        G = -np.ones(n)  # Градиент двойственной задачи: Q·alpha - 1
+        active = np.arange(n)  # Индексы активного (не сжатого) множества
+        shrink_every = min(n, 1000)
+        unshrunk = False
+        previous_gap = np.inf  # Нарушение ККТ при прошлом сжатии
+
+        iteration = 0
+        while iteration < self.max_iter:
+            iteration += 1
+
+            # Периодически сжимаем активное множество
+            if self.shrinking and iteration % shrink_every == 0:
+                gap = self._kkt_gap(alpha[active], y[active], G[active])
+                # Как в LIBSVM: близко к сходимости (gap <= 10 * tol) один раз возвращаем
+                # все переменные. Кроме того, возвращаем их, если за shrink_every шагов
+                # нарушение не уменьшилось: на вырожденной подзадаче (например,
+                # полиномиальное ядро малого ранга) SMO может ходить почти по кругу,
+                # а сдвинуть решение могут только сжатые переменные
+                if len(active) < n and ((not unshrunk and gap <= 10 * self.tol) or gap >= previous_gap):
+                    G = self._reconstruct_gradient(X, alpha, y)
+                    active = np.arange(n)
+                    unshrunk = True
+                    previous_gap = np.inf
+                else:
+                    active = self._shrink(active, alpha, y, G)
+                    previous_gap = gap
+
+            a_act, y_act, G_act = alpha[active], y[active], G[active]
+            v = -y_act * G_act  # -y_t * G_t
+
+            up = ((y_act > 0) & (a_act < C)) | ((y_act < 0) & (a_act > 0))
+            low = ((y_act < 0) & (a_act < C)) | ((y_act > 0) & (a_act > 0))
+
+            if not up.any() or not low.any():
+                break
+
+            # Первая переменная: максимальное нарушение среди I_up
+            i_local = np.flatnonzero(up)[np.argmax(v[up])]
+            v_max = v[i_local]
+            v_min = v[low].min()
+
+            if v_max - v_min < self.tol:
+                if len(active) < n:
+                    # Сошлись на активном множестве: восстанавливаем полный
+                    # градиент, возвращаем все переменные и проверяем ещё раз
+                    G = self._reconstruct_gradient(X, alpha, y)
+                    active = np.arange(n)
+                    unshrunk = True
+                    continue
+                break
+
+            i = active[i_local]
+            K_i = self._cache.row(i)
+
+            # Вторая переменная: выбор второго порядка среди I_low
+            b = v_max - v
+            candidates = low & (b > 0)
+            quad = diagonal[i] + diagonal[active] - 2 * K_i[active]
+            quad = np.where(quad > 0, quad, 1e-12)
+            gains = np.where(candidates, -(b ** 2) / quad, np.inf)
+            j_local = np.argmin(gains)
+            j = active[j_local]
+            K_j = self._cache.row(j)
+
+            # Аналитический шаг: alpha_i += y_i * t, alpha_j -= y_j * t
+            t = b[j_local] / quad[j_local]
+            t = min(t, C - alpha[i] if y[i] > 0 else alpha[i])
+            t = min(t, alpha[j] if y[j] > 0 else C - alpha[j])
+
+            alpha[i] += y[i] * t
+            alpha[j] -= y[j] * t
+
+            # Обновление градиента только на активном множестве
+            G[active] += t * y_act * (K_i[active] - K_j[active])
+
+        if iteration >= self.max_iter:
+            warnings.warn("SMO не сошёлся за max_iter шагов; попробуйте увеличить max_iter или tol")
+
+        if len(active) < n:
+            G = self._reconstruct_gradient(X, alpha, y)
+
+        self.n_iter_ = iteration
+        self.unshrunk_ = unshrunk
+
+        # Смещение: среднее y_t * G_t по свободным опорным векторам
+        free = (alpha > 0) & (alpha < C)
+        if free.any():
+            rho = np.mean(y[free] * G[free])
+        else:
+            v = -y * G
+            up = ((y > 0) & (alpha < C)) | ((y < 0) & (alpha > 0))
+            low = ((y < 0) & (alpha < C)) | ((y > 0) & (alpha > 0))
+            rho = -(v[up].max() + v[low].min()) / 2
+
+        support = alpha > 1e-8
+        self.support_ = np.flatnonzero(support)
+        self.support_vectors_ = X[support]
+        self.dual_coef_ = alpha[support] * y[support]
+        self.intercept_ = -rho
+
+        return self
+
+    def _kkt_gap(self, alpha, y, G):
+        """Максимальное нарушение условий ККТ: max по I_up минус min по I_low от -y * G."""
+        C = self.C
+        v = -y * G
+        up = ((y > 0) & (alpha < C)) | ((y < 0) & (alpha > 0))
+        low = ((y < 0) & (alpha < C)) | ((y > 0) & (alpha > 0))
+        if not up.any() or not low.any():
+            return 0.0
+        return v[up].max() - v[low].min()
+
+    def _shrink(self, active, alpha, y, G):
+        """
+        Убирает из активного множества переменные на границах,
+        которые не могут войти в нарушающую пару.
+        """
+        C = self.C
+        a_act, y_act = alpha[active], y[active]
+        v = -y_act * G[active]
+
+        up = ((y_act > 0) & (a_act < C)) | ((y_act < 0) & (a_act > 0))
+        low = ((y_act < 0) & (a_act < C)) | ((y_act > 0) & (a_act > 0))
+        if not up.any() or not low.any():
+            return active
+
+        v_max = v[up].max()
+        v_min = v[low].min()
+
+        only_up = up & ~low
+        only_low = low & ~up
+        shrink = (only_up & (v < v_min)) | (only_low & (v > v_max))
+        return active[~shrink]
+
+    def _reconstruct_gradient(self, X, alpha, y):
+        """Пересчитывает полный градиент Q·alpha - 1 по опорным векторам."""
+        support = np.flatnonzero(alpha > 0)
+        G = -np.ones(len(X))
+        kernel = KERNELS[self.kernel]
+        coef = alpha[support] * y[support]
+        for start in range(0, len(X), self.batch_size):
+            block = kernel(X[start:start + self.batch_size], X[support], **self._params)
+            G[start:start + self.batch_size] += y[start:start + self.batch_size] * (block @ coef)
+        return G
+
+    def decision_function(self, features):
+        """
+        Значения решающей функции f(x) = sum(alpha_i * y_i * K(x_i, x)) + b.
+
+        Считается блоками по batch_size строк: каждый блок — одно матричное
+        умножение с опорными векторами.
+        """
+        X = np.asarray(features, dtype=float)
+        kernel = KERNELS[self.kernel]
+        result = np.empty(len(X))
+
+        for start in range(0, len(X), self.batch_size):
+            block = kernel(X[start:start + self.batch_size], self.support_vectors_, **self._params)
+            result[start:start + self.batch_size] = block @ self.dual_coef_
+
+        return result + self.intercept_
+
+    def predict(self, features):
+        """Возвращает предсказанные метки классов."""
+        return np.where(self.decision_function(features) >= 0, self.classes_[1], self.classes_[0])
+
+    def cache_info(self):
+        """Статистика кеша строк ядра (hits, misses, hit_rate, rows, max_rows)."""
+        return self._cache.info()
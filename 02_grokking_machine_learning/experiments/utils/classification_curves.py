@@ -0,0 +1,281 @@
+# chapter07/utils/classification_curves.py
+
+
+import numpy as np
+
+
+def confusion_counts(labels, predictions):
+    """
+    Считает элементы матрицы неточностей для бинарной классификации.
+
+    Параметры:
+        labels (array-like): Истинные метки (0 или 1).
+        predictions (array-like): Предсказанные метки (0 или 1).
+
+    Возвращает:
+        dict: {'tp', 'fp', 'tn', 'fn'} — количество истинно/ложно положительных
+              и истинно/ложно отрицательных ответов.
+    """
+    labels = np.asarray(labels).astype(bool)
+    predictions = np.asarray(predictions).astype(bool)
+
+    tp = int(np.count_nonzero(labels & predictions))
+    fp = int(np.count_nonzero(~labels & predictions))
+    fn = int(np.count_nonzero(labels & ~predictions))
+    tn = len(labels) - tp - fp - fn
+
+    return {'tp': tp, 'fp': fp, 'tn': tn, 'fn': fn}
+
+
+def _sweep_from_counts(thresholds, positives, negatives):
+    """
+    Строит TP/FP/TN/FN для всех порогов по количеству положительных и
+    отрицательных примеров в каждой группе (группы упорядочены по убыванию score).
+
+    Первой точкой добавляется порог +inf (модель всё относит к классу 0).
+    """
+    tp = np.concatenate([[0], np.cumsum(positives)])
+    fp = np.concatenate([[0], np.cumsum(negatives)])
+    total_positive = tp[-1]
+    total_negative = fp[-1]
+
+    return {
+        'thresholds': np.concatenate([[np.inf], thresholds]),
+        'tp': tp,
+        'fp': fp,
+        'tn': total_negative - fp,
+        'fn': total_positive - tp
+    }
+
+
+def threshold_sweep(labels, scores):
+    """
+    Вычисляет TP/FP/TN/FN сразу для всех порогов за O(n log n).
+
+    Оценки сортируются один раз по убыванию, после чего количество
+    истинно и ложно положительных ответов для каждого порога получается
+    кумулятивной суммой. Порогом считается каждое уникальное значение score:
+    пример относится к классу 1, если score >= threshold.
+
+    Параметры:
+        labels (array-like): Истинные метки (0 или 1).
+        scores (array-like): Оценки модели (вероятности или значения score).
+
+    Возвращает:
+        dict: {'thresholds', 'tp', 'fp', 'tn', 'fn'} — массивы одинаковой длины,
+              пороги идут по убыванию (первый порог — +inf). Для пустых
+              labels и scores — только порог +inf с нулевыми количествами.
+    """
+    labels = np.asarray(labels).astype(bool)
+    scores = np.asarray(scores, dtype=float)
+
+    # Сортировка по убыванию score (устойчивая, чтобы результат был детерминированным)
+    order = np.argsort(-scores, kind='mergesort')
+    sorted_scores = scores[order]
+    sorted_labels = labels[order]
+
+    # Одинаковые score образуют один порог: берём последний индекс каждой группы
+    # (у пустой выборки групп нет — остаётся только порог +inf)
+    last_in_group = np.flatnonzero(np.diff(sorted_scores))
+    if len(scores):
+        last_in_group = np.r_[last_in_group, len(scores) - 1]
+
+    tp = np.cumsum(sorted_labels)[last_in_group]
+    fp = (last_in_group + 1) - tp
+
+    # Переводим накопленные значения в количества по группам
+    positives = np.diff(np.concatenate([[0], tp]))
+    negatives = np.diff(np.concatenate([[0], fp]))
+
+    return _sweep_from_counts(sorted_scores[last_in_group], positives, negatives)
+
+
+def _ratio(numerator, denominator, empty=0.0):
+    """Поэлементное деление с заданным значением для нулевого знаменателя."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    result = np.full(numerator.shape, empty, dtype=float)
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    return result
+
+
+def roc_curve(labels=None, scores=None, *, sweep=None):
+    """
+    ROC-кривая: доля ложно положительных (FPR) и истинно положительных (TPR) ответов.
+
+    Можно передать либо labels и scores, либо готовый результат threshold_sweep
+    (или streaming_threshold_sweep) через аргумент sweep.
+
+    Возвращает:
+        tuple: (fpr, tpr, thresholds)
+    """
+    if sweep is None:
+        sweep = threshold_sweep(labels, scores)
+
+    tpr = _ratio(sweep['tp'], sweep['tp'] + sweep['fn'])  # Чувствительность (recall)
+    fpr = _ratio(sweep['fp'], sweep['fp'] + sweep['tn'])  # 1 - специфичность
+    return fpr, tpr, sweep['thresholds']
+
+
+def pr_curve(labels=None, scores=None, *, sweep=None):
+    """
+    Кривая точность–полнота (precision–recall).
+
+    Для порога +inf (нет ни одного положительного ответа) точность считается равной 1.
+
+    Возвращает:
+        tuple: (precision, recall, thresholds)
+    """
+    if sweep is None:
+        sweep = threshold_sweep(labels, scores)
+
+    precision = _ratio(sweep['tp'], sweep['tp'] + sweep['fp'], empty=1.0)
+    recall = _ratio(sweep['tp'], sweep['tp'] + sweep['fn'])
+    return precision, recall, sweep['thresholds']
+
+
+def fbeta_curve(labels=None, scores=None, beta=1.0, *, sweep=None):
+    """
+    F-бета мера для каждого порога.
+
+    F_beta = (1 + beta^2) * TP / ((1 + beta^2) * TP + beta^2 * FN + FP)
+
+    Возвращает:
+        tuple: (fbeta, thresholds)
+    """
+    if sweep is None:
+        sweep = threshold_sweep(labels, scores)
+
+    beta2 = beta ** 2
+    numerator = (1 + beta2) * sweep['tp']
+    denominator = numerator + beta2 * sweep['fn'] + sweep['fp']
+    return _ratio(numerator, denominator), sweep['thresholds']
+
+
+def accuracy_curve(labels=None, scores=None, *, sweep=None):
+    """
+    Достоверность (accuracy) для каждого порога.
+
+    Возвращает:
+        tuple: (accuracy, thresholds)
+    """
+    if sweep is None:
+        sweep = threshold_sweep(labels, scores)
+
+    total = sweep['tp'] + sweep['fp'] + sweep['tn'] + sweep['fn']
+    return _ratio(sweep['tp'] + sweep['tn'], total), sweep['thresholds']
+
+
+def auc(x, y):
+    """
+    Площадь под кривой методом трапеций.
+
+    Параметры:
+        x (array-like): Абсциссы точек кривой (монотонные).
+        y (array-like): Ординаты точек кривой.
+
+    Возвращает:
+        float: Площадь под кривой.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    return float(abs(np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2)))
+
+
+def roc_auc(labels=None, scores=None, *, sweep=None):
+    """Площадь под ROC-кривой (ROC AUC)."""
+    fpr, tpr, _ = roc_curve(labels, scores, sweep=sweep)
+    return auc(fpr, tpr)
+
+
+def pr_auc(labels=None, scores=None, *, sweep=None):
+    """Площадь под кривой точность–полнота (PR AUC)."""
+    precision, recall, _ = pr_curve(labels, scores, sweep=sweep)
+    return auc(recall, precision)
+
+
+def score_histogram(labels, scores, bins=1000, score_range=(0.0, 1.0)):
+    """
+    Гистограммы score отдельно для положительных и отрицательных примеров.
+
+    Гистограммы разных частей (чанков) данных складываются поэлементно,
+    поэтому их можно считать независимо и затем объединить через merge_histograms.
+
+    Параметры:
+        labels (array-like): Истинные метки (0 или 1).
+        scores (array-like): Оценки модели.
+        bins (int): Количество корзин.
+        score_range (tuple): Диапазон оценок (значения вне диапазона попадают в крайние корзины).
+
+    Возвращает:
+        tuple: (positives, negatives) — массивы длины bins с количествами примеров.
+    """
+    labels = np.asarray(labels).astype(bool)
+    scores = np.asarray(scores, dtype=float)
+    low, high = score_range
+
+    # Индекс корзины для каждого score (с обрезкой по краям диапазона)
+    index = np.floor((scores - low) / (high - low) * bins).astype(np.int64)
+    np.clip(index, 0, bins - 1, out=index)
+
+    positives = np.bincount(index[labels], minlength=bins)
+    negatives = np.bincount(index[~labels], minlength=bins)
+    return positives, negatives
+
+
+def merge_histograms(*histograms):
+    """
+    Объединяет гистограммы, посчитанные по разным частям данных.
+
+    Параметры:
+        *histograms: Пары (positives, negatives), полученные из score_histogram.
+
+    Возвращает:
+        tuple: (positives, negatives) — суммарные гистограммы.
+    """
+    positives = np.sum([h[0] for h in histograms], axis=0)
+    negatives = np.sum([h[1] for h in histograms], axis=0)
+    return positives, negatives
+
+
+def sweep_from_histograms(positives, negatives, score_range=(0.0, 1.0)):
+    """
+    Строит TP/FP/TN/FN по гистограммам score.
+
+    Порогами служат левые границы корзин: пример относится к классу 1,
+    если его score не меньше левой границы корзины. Результат совпадает
+    по формату с threshold_sweep и подходит для roc_curve, pr_curve и т.д.
+    """
+    bins = len(positives)
+    low, high = score_range
+    left_edges = low + (high - low) * np.arange(bins) / bins
+
+    # Проходим корзины от старших score к младшим
+    return _sweep_from_counts(left_edges[::-1], positives[::-1], negatives[::-1])
+
+
+def streaming_threshold_sweep(chunks, bins=1000, score_range=(0.0, 1.0)):
+    """
+    Потоковый вариант threshold_sweep для данных, не помещающихся в память.
+
+    Каждая часть данных превращается в пару гистограмм, которые затем
+    суммируются, поэтому память не зависит от общего количества примеров.
+    Точность порогов ограничена шириной корзины (score_range / bins).
+
+    Параметры:
+        chunks (iterable): Итератор пар (labels, scores) для каждой части данных.
+        bins (int): Количество корзин гистограммы.
+        score_range (tuple): Диапазон оценок.
+
+    Возвращает:
+        dict: {'thresholds', 'tp', 'fp', 'tn', 'fn'} — как у threshold_sweep.
+    """
+    positives = np.zeros(bins, dtype=np.int64)
+    negatives = np.zeros(bins, dtype=np.int64)
+
+    for labels, scores in chunks:
+        chunk_positives, chunk_negatives = score_histogram(labels, scores, bins, score_range)
+        positives += chunk_positives
+        negatives += chunk_negatives
+
+    return sweep_from_histograms(positives, negatives, score_range)
@@ -1,4 +1,5 @@
 from fractions import Fraction  # класс Fraction из fractions для работы с дробями
+from functools import lru_cache
 import numpy as np
 import math
 
@@ -71,3 +72,229 @@ def decimal_to_fraction(decimal_num, tolerance=1e-9):
         # Если не удалось найти период (число не периодическое),
         # используем стандартное преобразование Fraction с ограничением знаменателя
         return Fraction(decimal_num).limit_denominator()
+
+
+@lru_cache(maxsize=65536)
+def continued_fraction(decimal_num, max_denominator=10 ** 6, tolerance=None):
+    """
+    Преобразует десятичную дробь в обыкновенную через цепную дробь.
+
+    Число с плавающей точкой точно равно дроби m / 2^k (float.as_integer_ratio),
+    поэтому разложение в цепную дробь идёт в целых числах без ошибок округления.
+    Подходящие дроби p/q — наилучшие приближения числа; разложение
+    останавливается, когда знаменатель следующей подходящей дроби превысил бы
+    max_denominator, и из последней подходящей и промежуточной дроби выбирается
+    более близкая (как Fraction.limit_denominator). Знаменатели подходящих
+    дробей растут не медленнее чисел Фибоначчи, поэтому шагов O(log max_denominator).
+
+    Результаты запоминаются (lru_cache), повторяющиеся значения считаются один раз.
+
+    Параметры:
+    - decimal_num: float - десятичное число для преобразования
+    - max_denominator: int - наибольший допустимый знаменатель (по умолчанию 10^6)
+    - tolerance: float - если задана, возвращается первая (самая простая) подходящая
+      дробь, отличающаяся от числа не больше чем на tolerance
+
+    Возвращает:
+    - Fraction object - обыкновенная дробь (0 для NaN, как в decimal_to_fraction)
+    """
+
+    if math.isnan(decimal_num):
+        return Fraction(0)
+
+    # Точное представление числа: numerator / denominator
+    numerator, denominator = float(decimal_num).as_integer_ratio()
+    x_numerator, x_denominator = numerator, denominator
+    if tolerance is not None:
+        tolerance_numerator, tolerance_denominator = float(tolerance).as_integer_ratio()
+
+    # Две последние подходящие дроби: p0/q0 и p1/q1
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    while True:
+        # Очередной элемент цепной дроби — целая часть остатка
+        a = numerator // denominator
+        q2 = q0 + a * q1
+        if q2 > max_denominator:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+
+        # Остаток: numerator / denominator -> denominator / (numerator - a * denominator)
+        numerator, denominator = denominator, numerator - a * denominator
+
+        # Разложение закончилось — дробь равна числу точно
+        if denominator == 0:
+            return Fraction(p1, q1)
+
+        # |p1/q1 - x| <= tolerance в целых числах, без округлений float
+        if tolerance is not None and (abs(p1 * x_denominator - x_numerator * q1) * tolerance_denominator
+                                      <= tolerance_numerator * q1 * x_denominator):
+            return Fraction(p1, q1)
+
+    # Промежуточная дробь с наибольшим допустимым знаменателем может быть ближе подходящей
+    k = (max_denominator - q0) // q1
+    semiconvergent = Fraction(p0 + k * p1, q0 + k * q1)
+    convergent = Fraction(p1, q1)
+    exact = Fraction(decimal_num)
+    return convergent if abs(convergent - exact) <= abs(semiconvergent - exact) else semiconvergent
+
+
+# Границы векторного разложения: при знаменателях меньше 2^21 и |x| < 2^31
+# произведения q * x считаются в float64 без округления (см. _residuals)
+VECTOR_MAX_DENOMINATOR = 1 << 21
+VECTOR_MAX_VALUE = 1 << 31
+
+INT64_MAX = np.iinfo(np.int64).max
+
+
+def _residuals(x_high, x_low, p, q):
+    """
+    Невязки q * x - p для массивов целых p, q.
+
+    x разложено на x_high (31 значащий бит) и x_low (остальные биты), поэтому
+    q * x_high и q * x_low при q < 2^21 точны, и невязка получается
+    с относительной ошибкой порядка одного округления, даже когда q * x и p
+    почти равны.
+    """
+    p = p.astype(float)
+    q = q.astype(float)
+    return (q * x_high - p) + q * x_low
+
+
+def _continued_fractions_vectorized(x, max_denominator, tolerance):
+    """
+    Разложение в цепную дробь сразу для всего массива x (конечные, |x| < 2^31).
+
+    Тот же алгоритм, что в continued_fraction, но подходящие дроби p/q
+    хранятся в массивах int64, а очередной элемент цепной дроби считается
+    через невязки e = q * x - p: a = floor(-e_prev / e_last). Каждый шаг —
+    несколько операций NumPy над всеми ещё не закончившими значениями;
+    шагов не больше O(log max_denominator).
+
+    Возвращает:
+        tuple (numerators, denominators, uncertain): Массивы int64 и маска значений,
+        для которых выбор между подходящей и промежуточной дробью неоднозначен
+        в float64 (их нужно пересчитать точно).
+    """
+    # Разбиение Вельткампа: x = x_high + x_low без ошибок округления
+    t = x * float((1 << 22) + 1)
+    x_high = t - (t - x)
+    x_low = x - x_high
+
+    n = len(x)
+    p0, q0 = np.zeros(n, dtype=np.int64), np.ones(n, dtype=np.int64)
+    p1, q1 = np.ones(n, dtype=np.int64), np.zeros(n, dtype=np.int64)
+    e0, e1 = x.copy(), -np.ones(n)
+    active = np.ones(n, dtype=bool)  # Разложение ещё идёт
+    uncertain = np.zeros(n, dtype=bool)  # Результат в float64 неоднозначен
+    bounded = np.zeros(n, dtype=bool)  # Остановлено ограничением на знаменатель
+
+    while active.any():
+        idx = np.flatnonzero(active)
+        # Элемент цепной дроби. Первый — целая часть x, остальные не меньше 1;
+        # заведомо слишком большие обрезаются, чтобы не переполнить int64
+        # (знаменатель с ними всё равно превысит предел)
+        ratio = -e0[idx] / e1[idx]
+        first = q1[idx] == 0
+        a = np.floor(np.where(first, ratio, np.clip(ratio, 1, max_denominator + 1.0))).astype(np.int64)
+
+        # Частное -e0 / e1 посчитано с округлением и могло ошибиться на 1.
+        # Проверка по точной невязке новой дроби: она должна быть другого
+        # знака, чем e1, и меньше по модулю
+        e2 = _residuals(x_high[idx], x_low[idx], p0[idx] + a * p1[idx], q0[idx] + a * q1[idx])
+        a -= (e2 != 0) & (np.sign(e2) == np.sign(e1[idx]))
+        a += np.abs(e2) >= np.abs(e1[idx])
+        q2 = q0[idx] + a * q1[idx]
+
+        over = q2 > max_denominator
+        bounded[idx[over]] = True
+        active[idx[over]] = False
+
+        step = idx[~over]
+        a, q2 = a[~over], q2[~over]
+        p2 = p0[step] + a * p1[step]
+        p0[step], q0[step], p1[step], q1[step] = p1[step], q1[step], p2, q2
+        e0[step], e1[step] = e1[step], _residuals(x_high[step], x_low[step], p2, q2)
+
+        # Дробь равна числу точно или уже достаточно близка к нему
+        done = e1[step] == 0
+        if tolerance is not None:
+            error, limit = np.abs(e1[step]), tolerance * q2
+            done |= error <= limit
+            uncertain[step[np.abs(error - limit) <= 1e-12 * limit]] = True
+        active[step[done]] = False
+
+    numerators, denominators = p1.copy(), q1.copy()
+
+    # Промежуточная дробь с наибольшим допустимым знаменателем может быть ближе подходящей
+    idx = np.flatnonzero(bounded)
+    k = (max_denominator - q0[idx]) // q1[idx]
+    p_semi = p0[idx] + k * p1[idx]
+    q_semi = q0[idx] + k * q1[idx]
+    e_semi = _residuals(x_high[idx], x_low[idx], p_semi, q_semi)
+    distance_semi = np.abs(e_semi) * q1[idx]
+    distance = np.abs(e1[idx]) * q_semi
+    use_semi = distance_semi < distance
+    numerators[idx[use_semi]] = p_semi[use_semi]
+    denominators[idx[use_semi]] = q_semi[use_semi]
+
+    # Почти равные расстояния в float64 не различить — такие значения пересчитываются точно
+    uncertain[idx] |= np.abs(distance_semi - distance) <= 1e-12 * distance
+    return numerators, denominators, uncertain
+
+
+def fractions_from_array(values, max_denominator=10 ** 6, tolerance=None, exact=False):
+    """
+    Преобразует массив десятичных дробей в массивы числителей и знаменателей.
+
+    Каждое различное значение (np.unique) раскладывается в цепную дробь один
+    раз, и все различные значения — одновременно операциями NumPy
+    (_continued_fractions_vectorized), а результаты раскладываются обратно
+    по позициям одной выборкой по индексам. Значения вне границ векторного
+    разложения (|x| >= 2^31 или max_denominator >= 2^21) и все значения
+    при exact=True считаются точной скалярной функцией continued_fraction.
+
+    Параметры:
+    - values: array-like - массив чисел любой формы
+    - max_denominator: int - наибольший допустимый знаменатель
+    - tolerance: float - см. continued_fraction
+    - exact: bool - считать всё через continued_fraction (медленнее, для проверки)
+
+    Возвращает:
+    - tuple (numerators, denominators) - массивы int64 той же формы, что и values
+      (NaN превращается в 0/1, как в decimal_to_fraction)
+
+    Исключения:
+    - ValueError - если в массиве есть ±inf или значение, числитель дроби
+      которого не помещается в int64 (например, |x| >= 2^63)
+    """
+
+    values = np.asarray(values, dtype=float)
+    unique, inverse = np.unique(values.ravel(), return_inverse=True)
+
+    infinite = np.isinf(unique)
+    if infinite.any():
+        raise ValueError(f"Бесконечное значение нельзя представить дробью: {unique[infinite][0]}")
+
+    finite = ~np.isnan(unique)
+    numerators = np.zeros(len(unique), dtype=np.int64)
+    denominators = np.ones(len(unique), dtype=np.int64)
+
+    if exact or max_denominator >= VECTOR_MAX_DENOMINATOR:
+        scalar = finite
+    else:
+        scalar = finite & (np.abs(unique) >= VECTOR_MAX_VALUE)
+        vector = np.flatnonzero(finite & ~scalar)
+        numerators[vector], denominators[vector], uncertain = _continued_fractions_vectorized(
+            unique[vector], max_denominator, tolerance
+        )
+        scalar[vector[uncertain]] = True
+
+    for i in np.flatnonzero(scalar).tolist():
+        fraction = continued_fraction(unique[i], max_denominator, tolerance)
+        if abs(fraction.numerator) > INT64_MAX or fraction.denominator > INT64_MAX:
+            raise ValueError(f"Дробь для значения {unique[i]} не помещается в int64: {fraction}")
+        numerators[i] = fraction.numerator
+        denominators[i] = fraction.denominator
+
+    inverse = inverse.ravel()
+    return numerators[inverse].reshape(values.shape), denominators[inverse].reshape(values.shape)
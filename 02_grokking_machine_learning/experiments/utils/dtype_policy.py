@@ -0,0 +1,77 @@
+# chapter13/utils/dtype_policy.py
+
+
+from contextlib import contextmanager
+
+import numpy as np
+
+
+SUPPORTED_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+_policy = {'dtype': np.dtype(np.float64)}
+
+
+def get_dtype():
+    """Текущий тип вычислений (по умолчанию float64)."""
+    return _policy['dtype']
+
+
+def set_dtype(dtype):
+    """
+    Устанавливает тип вычислений для тренеров, score/sigmoid и построителей признаков.
+
+    float32 вдвое уменьшает объём данных, которые читаются из памяти на
+    каждой эпохе; для линейных моделей этой точности обычно достаточно
+    (см. python -m benchmarks.precision).
+
+    Параметры:
+        dtype: np.float32 или np.float64 (также 'float32' / 'float64').
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in SUPPORTED_DTYPES:
+        raise ValueError("dtype должен быть float32 или float64")
+    _policy['dtype'] = dtype
+
+
+@contextmanager
+def using_dtype(dtype):
+    """
+    Временно меняет тип вычислений.
+
+    Пример:
+        with using_dtype(np.float32):
+            result = logistic_regression_algorithm(features, labels)
+    """
+    previous = get_dtype()
+    set_dtype(dtype)
+    try:
+        yield
+    finally:
+        set_dtype(previous)
+
+
+def as_float(values, dtype=None):
+    """
+    Переводит данные в массив текущего типа вычислений.
+
+    Массив нужного типа возвращается без копирования.
+
+    Параметры:
+        values (array-like): Данные.
+        dtype (optional): Тип вместо текущего.
+
+    Возвращает:
+        numpy.ndarray
+    """
+    return np.asarray(values, dtype=get_dtype() if dtype is None else dtype)
+
+
+def float_dtype_of(values):
+    """
+    Тип с плавающей точкой, в котором нужно считать для данных values:
+    тип самих данных, если это float32/float64, иначе текущий тип вычислений.
+    """
+    dtype = getattr(values, 'dtype', None)
+    if dtype is not None and np.dtype(dtype) in SUPPORTED_DTYPES:
+        return np.dtype(dtype)
+    return get_dtype()
@@ -0,0 +1,155 @@
+# chapter13/utils/early_stopping.py
+
+
+from collections import deque
+
+import numpy as np
+
+from .errors import mae, mse, rmse, mean_perceptron_error, total_log_loss
+from .telemetry import Callback
+from .dtype_policy import float_dtype_of
+
+
+def _copy_params(params):
+    """
+    Копия весов модели (тренеры меняют списки весов на месте)
+    в их собственном типе: веса float32 не превращаются в float64.
+    """
+    copies = {}
+    for name, value in params.items():
+        value = np.asarray(value)
+        copies[name] = np.array(value, dtype=float_dtype_of(value))
+    return copies
+
+
+def _flatten(params):
+    return np.concatenate([np.atleast_1d(value) for value in params.values()])
+
+
+def _regression_error(info):
+    return {'mae': mae, 'mse': mse, 'rmse': rmse}[info.get('error', 'rmse')]
+
+
+# Ошибка модели на валидационной выборке по весам — в той же метрике, что и errors_history тренера
+VALIDATION_ERRORS = {
+    'linear_regression': lambda info, p, X, y: _regression_error(info)(
+        y, p['price_per_room'] * X + p['base_price']
+    ),
+    'polynomial_regression': lambda info, p, X, y: _regression_error(info)(
+        y, np.power.outer(np.asarray(X, dtype=float), np.arange(len(p['weights']))) @ p['weights']
+    ),
+    'perceptron_algorithm': lambda info, p, X, y: mean_perceptron_error(p['weights'], p['bias'], X, y),
+    'logistic_regression_algorithm': lambda info, p, X, y: total_log_loss(p['weights'], p['bias'], X, y),
+}
+
+
+class EarlyStopping(Callback):
+    """
+    Ранняя остановка обучения для тренеров linear_regression,
+    polynomial_regression, perceptron_algorithm и logistic_regression_algorithm.
+
+    Критерии (срабатывает первый выполненный):
+        'plateau'   — за последние patience эпох ошибка ни разу не стала меньше
+                      лучшей более чем на min_delta (относительно);
+        'grad_norm' — средняя за patience эпох норма шага весов, делённая на
+                      скорость обучения (оценка нормы градиента), меньше grad_tol.
+
+    Ошибка берётся из errors_history тренера или, если задана validation_data,
+    считается на валидационной выборке. При restore_best=True тренер
+    возвращает веса эпохи с наименьшей ошибкой.
+
+    Пример:
+        stopper = EarlyStopping(patience=50, min_delta=1e-3, restore_best=True)
+        result = logistic_regression_algorithm(features, labels, callbacks=[stopper])
+        result['stop_reason'], result['stopped_epoch'], stopper.best_epoch
+    """
+
+    def __init__(self, patience=20, min_delta=1e-4, grad_tol=None, validation_data=None,
+                 restore_best=False, min_epochs=0):
+        """
+        Параметры:
+            patience (int): Размер окна в эпохах.
+            min_delta (float): Минимальное относительное улучшение ошибки за окно.
+            grad_tol (float, optional): Порог нормы градиента (None — не проверять).
+            validation_data (tuple, optional): (features, labels) валидационной выборки.
+            restore_best (bool): Вернуть веса с наименьшей ошибкой вместо последних.
+            min_epochs (int): Не останавливаться раньше этой эпохи.
+        """
+        self.patience = patience
+        self.min_delta = min_delta
+        self.grad_tol = grad_tol
+        self.validation_data = validation_data
+        self.restore_best = restore_best
+        self.min_epochs = min_epochs
+        self._reset({})
+
+    def _reset(self, info):
+        self.info = info
+        self.best_error = np.inf
+        self.best_epoch = None
+        self.best_params = None
+        self.stop_reason = None
+        self.stopped_epoch = None
+        self.validation_history = []
+        self._reference = np.inf
+        self._since_best = 0
+        self._steps = deque(maxlen=self.patience)
+        self._previous = _copy_params(info['params']) if 'params' in info else None
+
+    def on_train_start(self, info):
+        if self.validation_data is not None and info.get('trainer') not in VALIDATION_ERRORS:
+            raise ValueError(f"Валидация не поддерживается для тренера {info.get('trainer')!r}")
+        self._reset(info)
+
+    def on_epoch_end(self, epoch, logs):
+        # Ошибка эпохи посчитана по весам до обновления, то есть по весам предыдущей эпохи
+        before = self._previous
+        after = _copy_params(logs['params'])
+        self._previous = after
+
+        if self.validation_data is not None:
+            X, y = self.validation_data
+            error = float(VALIDATION_ERRORS[self.info['trainer']](self.info, before, X, y))
+            self.validation_history.append(error)
+        else:
+            error = float(logs['error'])
+
+        # Лучшие веса запоминаются при любом улучшении, а окно плато сбрасывается
+        # только при значимом (больше min_delta относительно опорного уровня)
+        if self.best_epoch is None or error < self.best_error:
+            self.best_error = error
+            self.best_epoch = epoch
+            self.best_params = before
+
+        if np.isinf(self._reference) or error < self._reference - self.min_delta * abs(self._reference):
+            self._reference = error
+            self._since_best = 0
+        else:
+            self._since_best += 1
+
+        if self.grad_tol is not None:
+            learning_rate = self.info.get('learning_rate') or 1.0
+            self._steps.append(np.linalg.norm(_flatten(after) - _flatten(before)) / learning_rate)
+
+        if epoch + 1 < self.min_epochs:
+            return None
+
+        if self._since_best >= self.patience:
+            self.stop_reason = 'plateau'
+        elif (self.grad_tol is not None and len(self._steps) == self.patience
+              and np.mean(self._steps) < self.grad_tol):
+            self.stop_reason = 'grad_norm'
+
+        if self.stop_reason is not None:
+            self.stopped_epoch = epoch
+        return self.stop_reason
+
+    def restored_params(self):
+        if not self.restore_best or self.best_params is None:
+            return None
+        params = dict(self.best_params)
+        for name in ('price_per_room', 'base_price', 'bias'):
+            if name in params:
+                # Скаляр NumPy того же типа, что у тренера (float32 или float64)
+                params[name] = params[name][()]
+        return params
@@ -3,6 +3,8 @@
 
 import numpy as np
 
+from .dtype_policy import float_dtype_of
+
 
 def mae(labels, predictions):
     """MAE — Средняя абсолютная ошибка.
@@ -46,10 +48,18 @@ def score(weights, bias, features):
         weights (numpy.ndarray): Вектор весов модели
         bias (float): Смещение (bias) модели
         features (numpy.ndarray): Вектор признаков одного примера
+            (или матрица признаков — тогда score считается для всех строк сразу)
 
     Возвращает:
         float: Взвешенная сумма признаков плюс смещение
     """
+    # Веса и смещение приводятся к типу признаков (float32 или float64 по dtype_policy),
+    # чтобы float32-данные не пересчитывались молча в float64
+    features = np.asarray(features)
+    if features.dtype == np.float32:
+        weights = np.asarray(weights, dtype=np.float32)
+        bias = np.float32(bias)
+
     # np.dot вычисляет скалярное произведение векторов weights и features
     # к результату добавляется смещение bias
     return np.dot(features, weights) + bias
@@ -146,18 +156,25 @@ def sigmoid(x):
     Вычисляет значение сигмоидной функции.
 
     Параметры:
-        x (float): Входное значение
+        x (float или numpy.ndarray): Входное значение или массив значений
 
     Возвращает:
-        float: Значение сигмоидной функции в точке x
+        float или numpy.ndarray: Значение сигмоидной функции в точке x
+            (для массива — поэлементно, в том же типе float32/float64)
     """
-    # Численно стабильная реализация сигмоиды:
-    # Если x >= 0, используем стандартную формулу 1 / (1 + e^(-x))
-    if x >= 0:
-        return 1 / (1 + np.exp(-x))
-    else:
-        # Если x < 0, используем эквивалентную форму для избежания переполнения
-        return np.exp(x) / (1 + np.exp(x))
+    if not isinstance(x, np.ndarray) or x.ndim == 0:
+        # Численно стабильная реализация сигмоиды:
+        # Если x >= 0, используем стандартную формулу 1 / (1 + e^(-x))
+        if x >= 0:
+            return 1 / (1 + np.exp(-x))
+        else:
+            # Если x < 0, используем эквивалентную форму для избежания переполнения
+            return np.exp(x) / (1 + np.exp(x))
+
+    # Для массива: те же две ветви, выбранные маской, с одной экспонентой на элемент
+    x = np.asarray(x, dtype=float_dtype_of(x))
+    e = np.exp(-np.abs(x))
+    return np.where(x >= 0, 1 / (1 + e), e / (1 + e))
 
 
 def log_reg_prediction(weights, bias, features):
@@ -192,6 +209,14 @@ def log_loss(weights, bias, features, label):
     # Вычисляем предсказанную вероятность
     pred = log_reg_prediction(weights, bias, features)
 
+    # При насыщении сигмоиды (в float32 — уже при |score| около 17) вероятность
+    # округляется ровно до 1 или 0, и логарифм даёт бесконечность. Заменяем её
+    # ближайшим представимым числом, чтобы потеря оставалась конечной
+    if pred >= 1:
+        pred = np.nextafter(pred, type(pred)(0))
+    elif pred <= 0:
+        pred = np.finfo(type(pred)).tiny
+
     # Применяем формулу логарифмической потери:
     # -y * log(p) - (1 - y) * log(1 - p)
     return - label * np.log(pred) - (1 - label) * np.log(1 - pred)
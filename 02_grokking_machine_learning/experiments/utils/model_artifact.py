@@ -0,0 +1,190 @@
+# chapter13/utils/model_artifact.py
+
+
+import struct
+
+import numpy as np
+
+
+# Формат файла модели (все числа little-endian):
+#
+#   Заголовок, 64 байта:
+#     magic            8s   b'GMLART\0\0'
+#     version          H    версия формата
+#     dtype_code       B    1 = float32, 2 = float64
+#     kind_code        B    1 = linear, 2 = perceptron, 3 = logistic
+#     n_features       I    количество весов
+#     n_epochs         I    длина истории обучения (0, если истории нет)
+#     flags            I    зарезервировано
+#     bias             d    смещение
+#     weights_offset          Q  смещение блока весов
+#     weights_history_offset  Q  смещение блока истории весов (0 — нет)
+#     bias_history_offset     Q  смещение блока истории смещений (0 — нет)
+#     errors_history_offset   Q  смещение блока истории ошибок (0 — нет)
+#
+#   Далее блоки данных, каждый выровнен на 64 байта (размер строки кеша),
+#   поэтому при загрузке их можно отдавать как представления NumPy без копирования.
+
+MAGIC = b'GMLART\0\0'
+VERSION = 1
+HEADER = struct.Struct('<8sHBBIIIdQQQQ')
+ALIGNMENT = 64
+
+DTYPE_CODES = {np.dtype(np.float32): 1, np.dtype(np.float64): 2}
+DTYPES = {code: dtype for dtype, code in DTYPE_CODES.items()}
+
+KIND_CODES = {'linear': 1, 'perceptron': 2, 'logistic': 3}
+KINDS = {code: kind for kind, code in KIND_CODES.items()}
+
+
+def _align(offset):
+    """Округляет смещение вверх до кратного ALIGNMENT."""
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def save_artifact(path, kind, weights, bias, *, weights_history=None, bias_history=None,
+                  errors_history=None, dtype=np.float64):
+    """
+    Сохраняет линейную модель в бинарный файл.
+
+    Параметры:
+        path (str): Путь к файлу.
+        kind (str): Тип модели: 'linear', 'perceptron' или 'logistic'.
+        weights (array-like): Веса модели.
+        bias (float): Смещение модели.
+        weights_history (array-like, optional): История весов (n_epochs, n_features).
+        bias_history (array-like, optional): История смещений (n_epochs,).
+        errors_history (array-like, optional): История ошибок (n_epochs,).
+        dtype: np.float32 или np.float64 — тип хранения весов и истории.
+    """
+    dtype = np.dtype(dtype)
+    if dtype not in DTYPE_CODES:
+        raise ValueError("dtype должен быть float32 или float64")
+    if kind not in KIND_CODES:
+        raise ValueError("kind должен быть 'linear', 'perceptron' или 'logistic'")
+
+    weights = np.atleast_1d(np.asarray(weights, dtype=dtype))
+    n_features = len(weights)
+
+    # Блоки данных в порядке записи: (массив или None)
+    blocks = [weights]
+    n_epochs = 0
+    for history in (weights_history, bias_history, errors_history):
+        if history is None:
+            blocks.append(None)
+            continue
+        history = np.asarray(history, dtype=dtype)
+        n_epochs = len(history)
+        blocks.append(history)
+
+    if weights_history is not None:
+        blocks[1] = blocks[1].reshape(n_epochs, n_features)
+
+    for block in blocks[1:]:
+        if block is not None and len(block) != n_epochs:
+            raise ValueError("Все истории обучения должны иметь одинаковую длину")
+
+    # Раскладываем блоки по выровненным смещениям
+    offsets = []
+    offset = _align(HEADER.size)
+    for block in blocks:
+        if block is None:
+            offsets.append(0)
+        else:
+            offsets.append(offset)
+            offset = _align(offset + block.nbytes)
+
+    header = HEADER.pack(
+        MAGIC, VERSION, DTYPE_CODES[dtype], KIND_CODES[kind],
+        n_features, n_epochs, 0, float(bias), *offsets
+    )
+
+    with open(path, 'wb') as f:
+        f.write(header)
+        for block, block_offset in zip(blocks, offsets):
+            if block is None:
+                continue
+            f.write(b'\0' * (block_offset - f.tell()))
+            f.write(np.ascontiguousarray(block).astype(dtype.newbyteorder('<'), copy=False).tobytes())
+
+
+def save_training_result(path, kind, result, include_history=False, dtype=np.float64):
+    """
+    Сохраняет результат тренера (словарь с final_weights и final_bias).
+
+    Пример:
+        result = perceptron_algorithm(features, labels)
+        save_training_result('perceptron.gmla', 'perceptron', result, include_history=True)
+    """
+    history = {}
+    if include_history:
+        history = {
+            'weights_history': result.get('weights_history'),
+            'bias_history': result.get('bias_history'),
+            'errors_history': result.get('errors_history')
+        }
+    save_artifact(path, kind, result['final_weights'], result['final_bias'], dtype=dtype, **history)
+
+
+def is_artifact(path):
+    """Проверяет, является ли файл бинарным артефактом модели (по сигнатуре)."""
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def load_artifact(path, mmap=True):
+    """
+    Загружает модель из бинарного файла.
+
+    При mmap=True файл отображается в память, и веса возвращаются как
+    представления NumPy прямо над отображением — без копирования и без
+    выполнения какого-либо кода из файла (в отличие от pickle). Страницы
+    файла подгружаются операционной системой только при обращении.
+
+    Параметры:
+        path (str): Путь к файлу.
+        mmap (bool): Отображать ли файл в память (иначе файл читается целиком).
+
+    Возвращает:
+        dict: {'kind', 'weights', 'bias', 'dtype', 'weights_history',
+               'bias_history', 'errors_history'} — истории равны None, если не сохранялись.
+    """
+    if mmap:
+        buffer = np.memmap(path, dtype=np.uint8, mode='r')
+    else:
+        with open(path, 'rb') as f:
+            buffer = np.frombuffer(f.read(), dtype=np.uint8)
+
+    if len(buffer) < HEADER.size:
+        raise ValueError(f"{path}: файл слишком короткий для артефакта модели")
+
+    (magic, version, dtype_code, kind_code, n_features, n_epochs, _flags, bias,
+     weights_offset, weights_history_offset, bias_history_offset,
+     errors_history_offset) = HEADER.unpack_from(buffer)
+
+    if magic != MAGIC:
+        raise ValueError(f"{path}: неверная сигнатура артефакта модели")
+    if version > VERSION:
+        raise ValueError(f"{path}: версия формата {version} не поддерживается (максимум {VERSION})")
+    if dtype_code not in DTYPES or kind_code not in KINDS:
+        raise ValueError(f"{path}: неизвестный тип данных или тип модели")
+
+    dtype = DTYPES[dtype_code].newbyteorder('<')
+
+    def view(offset, shape):
+        if offset == 0:
+            return None
+        count = int(np.prod(shape))
+        if offset + count * dtype.itemsize > len(buffer):
+            raise ValueError(f"{path}: блок данных выходит за пределы файла")
+        return np.frombuffer(buffer, dtype=dtype, count=count, offset=offset).reshape(shape)
+
+    return {
+        'kind': KINDS[kind_code],
+        'weights': view(weights_offset, (n_features,)),
+        'bias': bias,
+        'dtype': np.dtype(DTYPES[dtype_code]),
+        'weights_history': view(weights_history_offset, (n_epochs, n_features)),
+        'bias_history': view(bias_history_offset, (n_epochs,)),
+        'errors_history': view(errors_history_offset, (n_epochs,))
+    }
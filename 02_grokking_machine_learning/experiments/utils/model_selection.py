@@ -0,0 +1,194 @@
+# chapter13/utils/model_selection.py
+
+
+import os
+import math
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from .classification_curves import confusion_counts
+
+
+def kfold_indices(n_samples, n_folds=5, seed=0):
+    """
+    Разбивает индексы выборки на k фолдов (один раз для всех моделей).
+
+    Параметры:
+        n_samples (int): Количество примеров.
+        n_folds (int): Количество фолдов.
+        seed (int): Seed для перемешивания.
+
+    Возвращает:
+        list of tuple: Пары (train_idx, validation_idx) для каждого фолда.
+    """
+    order = np.random.default_rng(seed).permutation(n_samples)
+    folds = np.array_split(order, n_folds)
+    return [
+        (np.concatenate(folds[:k] + folds[k + 1:]), folds[k])
+        for k in range(n_folds)
+    ]
+
+
+def classification_scores(labels, predictions):
+    """
+    Accuracy и F1-мера по матрице неточностей.
+
+    Возвращает:
+        dict: {'accuracy', 'f1'}
+    """
+    c = confusion_counts(labels, predictions)
+    total = c['tp'] + c['fp'] + c['tn'] + c['fn']
+    f1_denominator = 2 * c['tp'] + c['fp'] + c['fn']
+    return {
+        'accuracy': (c['tp'] + c['tn']) / total if total else 0.0,
+        'f1': 2 * c['tp'] / f1_denominator if f1_denominator else 0.0
+    }
+
+
+# === Общая память для процессов-воркеров ===
+
+_shared = {}  # Имя массива -> numpy-представление общей памяти в воркере
+
+
+def _to_shared(array):
+    """Копирует массив в общую память и возвращает (блок памяти, описание для воркеров)."""
+    array = np.ascontiguousarray(array)
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _attach(descriptions):
+    """Инициализатор воркера: подключает массивы из общей памяти без копирования."""
+    for key, (name, shape, dtype) in descriptions.items():
+        shm = shared_memory.SharedMemory(name=name)
+        _shared[key] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+        _shared[key + '_shm'] = shm  # Держим ссылку, чтобы память не освободилась
+
+
+def _fit_fold(task):
+    """Обучает одну конфигурацию на одном фолде и возвращает метрики."""
+    candidate_id, fold_id, factory, params, train_idx, validation_idx = task
+    X, y = _shared['X'], _shared['y']
+
+    model = factory(**params)
+    model.fit(X[train_idx], y[train_idx])
+    scores = classification_scores(y[validation_idx], model.predict(X[validation_idx]))
+    return candidate_id, fold_id, scores
+
+
+def cross_validate_models(
+        features,
+        labels,
+        candidates,
+        n_folds=5,
+        metric='f1',
+        eta=2,
+        n_jobs=None,
+        seed=0
+):
+    """
+    Параллельный выбор модели кросс-валидацией с последовательным отсевом
+    (successive halving).
+
+    Матрица признаков и метки один раз копируются в общую память и
+    подключаются воркерами без копирования. Разбиение на фолды одно для всех
+    моделей. На первом раунде каждая конфигурация оценивается на одном фолде,
+    затем лучшая 1/eta часть получает больше фолдов, и так далее, пока
+    оставшиеся конфигурации не будут оценены на всех фолдах. Уже посчитанные
+    фолды не пересчитываются.
+
+    Параметры:
+        features (array-like): Матрица признаков.
+        labels (array-like): Вектор меток (0 или 1).
+        candidates (list of tuple): Конфигурации (имя, класс или фабрика модели, словарь параметров),
+            например ('SVM', SVC, {'C': 1, 'gamma': 0.1}). Модель должна иметь fit и predict.
+        n_folds (int): Количество фолдов.
+        metric (str): Метрика отбора: 'f1' или 'accuracy'.
+        eta (int): Во сколько раз сокращается число конфигураций на каждом раунде.
+        n_jobs (int, optional): Количество процессов. По умолчанию — все ядра; 1 — без пула.
+        seed (int): Seed для разбиения на фолды.
+
+    Возвращает:
+        pandas.DataFrame: Таблица лидеров, отсортированная по средней метрике.
+    """
+    if metric not in {'f1', 'accuracy'}:
+        raise ValueError("metric должна быть 'f1' или 'accuracy'")
+
+    X = np.asarray(features, dtype=float)
+    y = np.asarray(labels)
+    folds = kfold_indices(len(X), n_folds, seed)
+    n_jobs = n_jobs or os.cpu_count()
+
+    # Результаты: candidate_id -> {fold_id: scores}
+    results = {i: {} for i in range(len(candidates))}
+    alive = list(range(len(candidates)))
+
+    # Количество фолдов на раунде: 1, eta, eta^2, ... , n_folds
+    n_rounds = max(1, math.ceil(math.log(len(candidates), eta))) if len(candidates) > 1 else 1
+    budgets = [min(n_folds, eta ** r) for r in range(n_rounds)] + [n_folds]
+
+    def tasks_for(budget):
+        return [
+            (i, f, candidates[i][1], candidates[i][2], folds[f][0], folds[f][1])
+            for i in alive
+            for f in range(budget)
+            if f not in results[i]
+        ]
+
+    def mean_score(i):
+        return np.mean([s[metric] for s in results[i].values()])
+
+    segments = []
+    try:
+        if n_jobs == 1:
+            _shared['X'], _shared['y'] = X, y
+            executor = None
+        else:
+            shm_X, desc_X = _to_shared(X)
+            shm_y, desc_y = _to_shared(y)
+            segments = [shm_X, shm_y]
+            executor = ProcessPoolExecutor(
+                max_workers=n_jobs,
+                initializer=_attach,
+                initargs=({'X': desc_X, 'y': desc_y},)
+            )
+
+        for round_id, budget in enumerate(budgets):
+            tasks = tasks_for(budget)
+            outputs = map(_fit_fold, tasks) if executor is None else executor.map(_fit_fold, tasks)
+            for candidate_id, fold_id, scores in outputs:
+                results[candidate_id][fold_id] = scores
+
+            # Отсев: оставляем лучшую 1/eta часть (кроме последнего раунда)
+            if round_id < len(budgets) - 1:
+                alive.sort(key=mean_score, reverse=True)
+                alive = alive[:max(1, math.ceil(len(alive) / eta))]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        for shm in segments:
+            shm.close()
+            shm.unlink()
+        _shared.clear()
+
+    rows = []
+    for i, (name, _, params) in enumerate(candidates):
+        accuracy = [s['accuracy'] for s in results[i].values()]
+        f1 = [s['f1'] for s in results[i].values()]
+        chosen = f1 if metric == 'f1' else accuracy
+        rows.append({
+            'Модель': name,
+            'Параметры': params,
+            'Фолдов': len(results[i]),
+            'Accuracy': np.mean(accuracy),
+            'F1-score': np.mean(f1),
+            'Стд. отклонение': np.std(chosen)
+        })
+
+    leaderboard = pd.DataFrame(rows)
+    key = 'F1-score' if metric == 'f1' else 'Accuracy'
+    return leaderboard.sort_values(by=['Фолдов', key], ascending=False).reset_index(drop=True)
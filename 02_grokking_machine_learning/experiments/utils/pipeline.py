@@ -0,0 +1,297 @@
+# chapter13/utils/pipeline.py
+
+
+import os
+import pickle
+import hashlib
+import inspect
+
+import numpy as np
+import pandas as pd
+
+from .dtype_policy import get_dtype
+
+
+def fingerprint(obj):
+    """
+    Вычисляет хеш содержимого объекта.
+
+    Поддерживаются DataFrame/Series (по значениям и индексу), массивы NumPy,
+    пути к существующим файлам (по содержимому файла) и любые объекты,
+    которые можно сериализовать через pickle.
+
+    Параметры:
+        obj: Объект для хеширования.
+
+    Возвращает:
+        str: Шестнадцатеричная строка-хеш.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    if isinstance(obj, (pd.DataFrame, pd.Series)):
+        digest.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+        if isinstance(obj, pd.DataFrame):
+            digest.update(repr(list(obj.columns)).encode())
+    elif isinstance(obj, np.ndarray):
+        digest.update(str((obj.dtype, obj.shape)).encode())
+        digest.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (str, os.PathLike)) and os.path.isfile(obj):
+        # Для путей к файлам важно содержимое, а не только имя
+        digest.update(os.fspath(obj).encode())
+        with open(obj, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+    else:
+        digest.update(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+
+    return digest.hexdigest()
+
+
+class Step:
+    """
+    Шаг конвейера предобработки.
+
+    Шаг объявляет, какие артефакты он читает (inputs) и какие создаёт (outputs).
+    Функция шага получает входы как именованные аргументы вместе с параметрами
+    config и возвращает кортеж (или одно значение) в порядке outputs.
+    """
+
+    def __init__(self, name, func, inputs, outputs, config=None):
+        """
+        Параметры:
+            name (str): Имя шага (используется в имени файла кеша).
+            func (callable): Функция шага: func(**inputs, **config).
+            inputs (list of str): Имена входных артефактов.
+            outputs (list of str): Имена выходных артефактов.
+            config (dict, optional): Параметры шага (входят в отпечаток).
+        """
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.config = dict(config or {})
+
+    def code_fingerprint(self):
+        """Хеш исходного кода функции шага (при изменении кода кеш сбрасывается)."""
+        try:
+            source = inspect.getsource(self.func)
+        except (OSError, TypeError):
+            source = getattr(self.func, '__qualname__', repr(self.func))
+        return hashlib.blake2b(source.encode(), digest_size=16).hexdigest()
+
+    def run(self, artifacts):
+        """Выполняет шаг и возвращает словарь {имя выхода: значение}."""
+        kwargs = {name: artifacts[name] for name in self.inputs}
+        result = self.func(**kwargs, **self.config)
+        if len(self.outputs) == 1:
+            result = (result,)
+        return dict(zip(self.outputs, result))
+
+
+class Pipeline:
+    """
+    Конвейер шагов с кешированием результатов на диске.
+
+    Отпечаток шага складывается из его имени, исходного кода, параметров
+    config и отпечатков входов. Отпечатки выходов выводятся из отпечатка
+    шага, поэтому при попадании в кеш большие результаты не нужно хешировать
+    повторно. Если ни данные, ни код, ни параметры не менялись, после
+    перезапуска ядра результат шага просто читается с диска.
+
+    Пример:
+        pipeline = Pipeline([Step('load', load_csv, ['path'], ['raw']), ...])
+        artifacts = pipeline.run(path='data/titanic.csv')
+    """
+
+    def __init__(self, steps, cache_dir='.pipeline_cache', use_cache=True):
+        """
+        Параметры:
+            steps (list of Step): Шаги в порядке выполнения.
+            cache_dir (str): Папка для кеша результатов.
+            use_cache (bool): Использовать ли дисковый кеш.
+        """
+        self.steps = list(steps)
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.last_run = []  # Журнал последнего запуска: (имя шага, 'cache' или 'run')
+
+    def _cache_path(self, step, step_fingerprint):
+        return os.path.join(self.cache_dir, f"{step.name}-{step_fingerprint}.pkl")
+
+    def run(self, **inputs):
+        """
+        Выполняет все шаги (или читает их результаты из кеша).
+
+        Параметры:
+            **inputs: Исходные артефакты (например, path='data/titanic.csv').
+
+        Возвращает:
+            dict: Все артефакты — исходные и созданные шагами.
+        """
+        artifacts = dict(inputs)
+        fingerprints = {name: fingerprint(value) for name, value in inputs.items()}
+        self.last_run = []
+
+        if self.use_cache:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+        for step in self.steps:
+            missing = [name for name in step.inputs if name not in artifacts]
+            if missing:
+                raise KeyError(f"Шагу '{step.name}' не хватает входов: {missing}")
+
+            step_fingerprint = fingerprint((
+                step.name,
+                step.code_fingerprint(),
+                sorted(step.config.items()),
+                [fingerprints[name] for name in step.inputs]
+            ))
+            path = self._cache_path(step, step_fingerprint)
+
+            if self.use_cache and os.path.exists(path):
+                with open(path, 'rb') as f:
+                    outputs = pickle.load(f)
+                self.last_run.append((step.name, 'cache'))
+            else:
+                outputs = step.run(artifacts)
+                if self.use_cache:
+                    # Запись через временный файл, чтобы не оставить битый кеш
+                    tmp_path = path + '.tmp'
+                    with open(tmp_path, 'wb') as f:
+                        pickle.dump(outputs, f, protocol=pickle.HIGHEST_PROTOCOL)
+                    os.replace(tmp_path, path)
+                self.last_run.append((step.name, 'run'))
+
+            artifacts.update(outputs)
+            for name in step.outputs:
+                fingerprints[name] = f"{step_fingerprint}:{name}"
+
+        return artifacts
+
+
+class FeaturePlan:
+    """
+    Скомпилированный план преобразования «сырых» строк в вектор признаков.
+
+    План хранит только индексы столбцов, значения для заполнения пропусков,
+    словари категорий и границы интервалов. Преобразование идёт по массивам
+    NumPy без создания DataFrame, поэтому подходит для быстрого применения
+    к новым строкам (например, в сервисе предсказаний).
+    """
+
+    def __init__(self, raw_columns, numeric=(), one_hot=(), binned=(), fill_values=None):
+        """
+        Параметры:
+            raw_columns (list of str): Порядок столбцов во входных строках.
+            numeric (list of str): Числовые столбцы, копируемые как есть.
+            one_hot (list of tuple): Пары (столбец, список категорий) для one-hot кодирования.
+            binned (list of tuple): Пары (столбец, границы интервалов) для one-hot кодирования
+                интервалов вида (a, b]. Третьим элементом можно задать префикс имён признаков.
+            fill_values (dict, optional): Значения для заполнения пропусков по столбцам.
+        """
+        self.raw_columns = list(raw_columns)
+        self.fill_values = dict(fill_values or {})
+        index = {name: i for i, name in enumerate(self.raw_columns)}
+
+        self.feature_names = []
+
+        # Числовые столбцы: массивы индексов «откуда» и «куда»
+        self.numeric_src = np.array([index[c] for c in numeric], dtype=np.intp)
+        self.numeric_dst = np.arange(len(numeric), dtype=np.intp)
+        self.numeric_fill = np.array([self.fill_values.get(c, np.nan) for c in numeric], dtype=float)
+        self.feature_names += list(numeric)
+
+        # One-hot: (индекс столбца, словарь категория -> позиция в выходе, значение по умолчанию)
+        self.one_hot = []
+        for column, categories in one_hot:
+            offset = len(self.feature_names)
+            lookup = {value: offset + k for k, value in enumerate(categories)}
+            self.one_hot.append((index[column], lookup, self.fill_values.get(column)))
+            self.feature_names += [f"{column}_{value}" for value in categories]
+
+        # Интервалы: (индекс столбца, границы, смещение в выходе, значение по умолчанию)
+        self.binned = []
+        for column, edges, *prefix in binned:
+            prefix = prefix[0] if prefix else column
+            offset = len(self.feature_names)
+            edges = np.asarray(edges, dtype=float)
+            self.binned.append((index[column], edges, offset, self.fill_values.get(column, np.nan)))
+            self.feature_names += [
+                f"{prefix}_({_format_edge(a)}, {_format_edge(b)}]" for a, b in zip(edges[:-1], edges[1:])
+            ]
+
+        self.n_features = len(self.feature_names)
+
+    def rows_from_dicts(self, records):
+        """Переводит список словарей {столбец: значение} в массив строк в порядке raw_columns."""
+        return np.array(
+            [[record.get(column) for column in self.raw_columns] for record in records],
+            dtype=object
+        )
+
+    def transform(self, rows, dtype=None):
+        """
+        Преобразует строки в матрицу признаков.
+
+        Параметры:
+            rows (array-like или list of dict): Массив (n_rows, len(raw_columns))
+                или список словарей.
+            dtype: Тип элементов результата. По умолчанию — тип вычислений из utils.dtype_policy.
+
+        Возвращает:
+            numpy.ndarray: Матрица признаков (n_rows, n_features).
+        """
+        if len(rows) and isinstance(rows[0], dict):
+            rows = self.rows_from_dicts(rows)
+        rows = np.asarray(rows, dtype=object)
+        if rows.ndim == 1:
+            rows = rows[None, :]
+
+        n = len(rows)
+        out = np.zeros((n, self.n_features), dtype=get_dtype() if dtype is None else dtype)
+        row_index = np.arange(n)
+
+        # Числовые признаки: одна операция копирования и заполнение пропусков
+        if len(self.numeric_src):
+            values = _to_float(rows[:, self.numeric_src])
+            missing = np.isnan(values)
+            if missing.any():
+                values[missing] = np.broadcast_to(self.numeric_fill, values.shape)[missing]
+            out[:, self.numeric_dst] = values
+
+        # One-hot категории: словарный поиск позиции и одно присваивание
+        for src, lookup, fill in self.one_hot:
+            positions = np.fromiter(
+                (lookup.get(fill if _is_missing(v) else v, -1) for v in rows[:, src]),
+                dtype=np.intp,
+                count=n
+            )
+            known = positions >= 0
+            out[row_index[known], positions[known]] = 1
+
+        # Интервалы (a, b]: номер интервала через бинарный поиск по границам
+        for src, edges, offset, fill in self.binned:
+            values = _to_float(rows[:, src])
+            values[np.isnan(values)] = fill
+            bins = np.searchsorted(edges, values, side='left') - 1
+            inside = (bins >= 0) & (bins < len(edges) - 1)
+            out[row_index[inside], offset + bins[inside]] = 1
+
+        return out
+
+
+def _format_edge(value):
+    """Форматирует границу интервала так же, как pandas.cut для целых границ."""
+    return str(int(value)) if float(value).is_integer() else str(value)
+
+
+def _is_missing(value):
+    """Проверяет, является ли значение пропуском (None или NaN)."""
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _to_float(values):
+    """Переводит массив объектов в float, заменяя None на NaN."""
+    values = np.asarray(values, dtype=object)
+    values = np.where(values == None, np.nan, values)  # noqa: E711 — поэлементное сравнение
+    return values.astype(float)
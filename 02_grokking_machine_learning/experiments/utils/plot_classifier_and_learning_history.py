@@ -1,7 +1,50 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 from .plot_points import plot_points
+from .plot_context import PlotContext
+
+
+def _thin_history(y_values, every=1, min_change=0.0):
+    """
+    Выбирает эпохи истории обучения для отрисовки.
+
+    Сначала берётся каждая every-я эпоха, затем из них остаются только те,
+    у которых концы линии сдвинулись больше чем на min_change относительно
+    последней оставленной линии. Сдвиг накапливается, поэтому граница,
+    которая за эпоху смещается меньше min_change, всё равно рисуется
+    каждый раз, когда уйдёт от последней линии дальше min_change.
+    Если сдвиг не определён (вертикальные линии, w1 == 0), линия остаётся.
+
+    Параметры:
+        y_values (numpy.ndarray): Концы линий формы (n_epochs, 2).
+        every (int): Шаг по эпохам.
+        min_change (float): Минимальный сдвиг концов линии.
+
+    Возвращает:
+        numpy.ndarray: Булева маска оставляемых эпох формы (n_epochs,).
+    """
+    keep = np.zeros(len(y_values), dtype=bool)
+    candidates = np.arange(0, len(y_values), max(int(every), 1))
+
+    if min_change > 0:
+        # Последовательный проход: каждая линия сравнивается с последней оставленной.
+        # Числа Python вместо NumPy: inf - inf даёт nan без предупреждений
+        ends = y_values.tolist()
+        last = ends[candidates[0]]
+        keep[candidates[0]] = True
+        for i in candidates[1:].tolist():
+            shifts = [abs(a - b) for a, b in zip(ends[i], last)]
+            shifts = [shift for shift in shifts if shift == shift]  # Без nan
+            if not shifts or max(shifts) > min_change:
+                keep[i] = True
+                last = ends[i]
+    else:
+        keep[candidates] = True
+
+    keep[-1] = True  # Финальную линию оставляем всегда
+    return keep
 
 
 def plot_learning_history(
@@ -10,17 +53,30 @@ def plot_learning_history(
         features, labels,
         xlim=None,
         ylim=None,
-        ax=None
+        ax=None,
+        context=None,
+        every=1,
+        min_change=0.0
 ):
     """
     Визуализирует историю обучения, отображая все промежуточные разделяющие линии.
 
+    Все линии рисуются одним объектом LineCollection, поэтому время отрисовки
+    почти не зависит от количества эпох. Для очень длинных историй можно
+    дополнительно проредить линии параметрами every и min_change.
+
     Параметры:
         weights_history (list): Список векторов весов на каждом шаге обучения
         bias_history (list): Список значений смещения на каждом шаге обучения
         features (numpy.ndarray): Матрица признаков (используется для определения границ графика)
         ax (matplotlib.axes.Axes, optional): Объект осей для рисования. Если None, используется текущие оси.
         zorder (int, optional): Порядок отрисовки. По умолчанию 0.
+        context (PlotContext, optional): Контекст с заранее посчитанными границами графика.
+        every (int, optional): Рассматривать только каждую every-ю эпоху. По умолчанию 1 (все).
+        min_change (float, optional): Из эпох, отобранных every, рисовать только те, на которых
+            концы линии сдвинулись больше чем на min_change относительно последней нарисованной
+            линии (а не предыдущей эпохи), поэтому медленный дрейф границы тоже виден.
+            По умолчанию 0.0 (без фильтра). Финальная линия рисуется всегда.
     """
 
     X = np.array(features)
@@ -30,47 +86,50 @@ def plot_learning_history(
     if ax is None:
         ax = plt.gca()
 
-    # Определяем границы по оси X для рисования линий
-    if xlim is None:
-        if X.ndim == 1 or (X.ndim == 2 and X.shape[1] == 1):
-            x_min = (min(X) - 1)  # Левая граница с отступом 1
-            x_max = (max(X) + 1)  # Правая граница с отступом 1
-        else:
-            x_min = min(X[:, 0]) - 1  # Левая граница с отступом 1
-            x_max = max(X[:, 0]) + 1  # Правая граница с отступом 1
-    else:
-        x_min, x_max = xlim[0], xlim[1]
-
-    if ylim is None:
-        y_min = (min(y) - 1)  # Левая граница с отступом 1
-        y_max = (max(y) + 1)  # Правая граница с отступом 1
-    else:
-        y_min, y_max = ylim[0], ylim[1]
-
-    # Рисуем все промежуточные классификаторы из истории обучения
-    for i, (weights, bias) in enumerate(zip(weights_history, bias_history)):
-        # Вычисляем координаты для разделяющей линии
-        # Уравнение линии: w0*x + w1*y + bias = 0 => y = -(w0*x + bias)/w1
-        x_values = np.array([x_min, x_max])  # Точки на краях графика
-        y_values = -(weights[0] * x_values + bias) / weights[1]
-
-        # Рисуем линию с полупрозрачным серым цветом и тонкой линией
-        ax.plot(x_values, y_values,
-                color='gray',  # Серый цвет
-                alpha=0.1,  # Прозрачность 10%
-                linewidth=1,  # Толщина линии 1
-                zorder=1)  # Порядок отрисовки
-
-    # Последнюю линию рисуем более заметной (если история не пустая)
-    if len(weights_history) > 0:
-        final_weights = weights_history[-1]  # Последние веса
-        final_bias = bias_history[-1]  # Последнее смещение
-        y_values = -(final_weights[0] * x_values + final_bias) / final_weights[1]
-        ax.plot(x_values, y_values,
-                color='gray',  # Серый цвет
-                alpha=0.3,  # Прозрачность 30%
-                linewidth=2,  # Толщина линии 2
-                label='История обучения')  # Подпись для легенды
+    # Границы считаются один раз на набор данных (или берутся из контекста)
+    if context is None:
+        context = PlotContext(X, y, xlim=xlim, ylim=ylim)
+
+    x_min, x_max = context.xlim  # Границы по X с отступом 1
+    y_min, y_max = context.label_lim  # Границы по Y с отступом 1
+
+    # Пустую историю рисовать нечего (reshape пустого массива к (0, -1) невозможен)
+    if len(weights_history) == 0:
+        return ax
+
+    # Собираем историю в массивы: W — (n_epochs, n_features), b — (n_epochs,)
+    W = np.asarray(weights_history, dtype=float).reshape(len(weights_history), -1)
+    b = np.asarray(bias_history, dtype=float)
+
+    # Концы всех разделяющих линий считаются одной векторной операцией.
+    # Уравнение линии: w0*x + w1*y + bias = 0 => y = -(w0*x + bias)/w1
+    x_values = np.array([x_min, x_max])  # Точки на краях графика
+    with np.errstate(divide='ignore', invalid='ignore'):
+        y_values = -(W[:, [0]] * x_values + b[:, None]) / W[:, [1]]  # (n_epochs, 2)
+
+    keep = _thin_history(y_values, every, min_change)
+
+    # Сегменты формы (n_lines, 2 точки, 2 координаты)
+    segments = np.stack([
+        np.broadcast_to(x_values, y_values[keep].shape),
+        y_values[keep]
+    ], axis=-1)
+
+    # Все промежуточные линии — один артист LineCollection вместо тысяч Line2D
+    ax.add_collection(LineCollection(
+        segments,
+        colors='gray',  # Серый цвет
+        alpha=0.1,  # Прозрачность 10%
+        linewidths=1,  # Толщина линии 1
+        zorder=1  # Порядок отрисовки
+    ))
+
+    # Последнюю линию рисуем более заметной
+    ax.plot(x_values, y_values[-1],
+            color='gray',  # Серый цвет
+            alpha=0.3,  # Прозрачность 30%
+            linewidth=2,  # Толщина линии 2
+            label='История обучения')  # Подпись для легенды
 
     return ax
 
@@ -90,7 +149,8 @@ def plot_classifier(
         ylabel=None,
         xlim=None,
         ylim=None,
-        ax=None
+        ax=None,
+        context=None
 ):
     """
     Основная функция для визуализации классификатора и данных.
@@ -105,6 +165,7 @@ def plot_classifier(
         weights_history (list, optional): История весов в процессе обучения. По умолчанию None.
         bias_history (list, optional): История смещений в процессе обучения. По умолчанию None.
         ax (matplotlib.axes.Axes, optional): Объект осей для рисования. По умолчанию None.
+        context (PlotContext, optional): Контекст с заранее посчитанными границами графика.
     """
 
     X = np.array(features)
@@ -114,26 +175,16 @@ def plot_classifier(
     if ax is None:
         ax = plt.gca()
 
-    # Определяем границы по оси X для рисования линий
-    if xlim is None:
-        if X.ndim == 1 or (X.ndim == 2 and X.shape[1] == 1):
-            x_min = (min(X) - 1)  # Левая граница с отступом 1
-            x_max = (max(X) + 1)  # Правая граница с отступом 1
-        else:
-            x_min = min(X[:, 0]) - 1  # Левая граница с отступом 1
-            x_max = max(X[:, 0]) + 1  # Правая граница с отступом 1
-    else:
-        x_min, x_max = xlim[0], xlim[1]
+    # Границы считаются один раз на набор данных (или берутся из контекста)
+    if context is None:
+        context = PlotContext(X, y, xlim=xlim, ylim=ylim)
 
-    if ylim is None:
-        y_min = (min(y) - 1)  # Левая граница с отступом 1
-        y_max = (max(y) + 1)  # Правая граница с отступом 1
-    else:
-        y_min, y_max = ylim[0], ylim[1]
+    x_min, x_max = context.xlim  # Границы по X с отступом 1
+    y_min, y_max = context.label_lim  # Границы по Y с отступом 1
 
     # 1. Сначала рисуем историю линий (если передана)
     if weights_history is not None and bias_history is not None:
-        plot_learning_history(weights_history, bias_history, X, y, xlim, ylim, ax=ax)
+        plot_learning_history(weights_history, bias_history, X, y, xlim, ylim, ax=ax, context=context)
 
     # 2. Затем рисуем точки данных (чтобы они были поверх линий истории)
     plot_points(X, y,
@@ -0,0 +1,326 @@
+import types
+import pickle
+import hashlib
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.colors import ListedColormap
+
+
+def axis_bounds(values, lim=None, padding=1):
+    """
+    Вычисляет границы оси по массиву значений с отступом.
+
+    Параметры:
+        values (array-like): Значения вдоль оси.
+        lim (tuple, optional): Явно заданные границы. Если переданы — возвращаются как есть.
+        padding (float): Отступ от минимального и максимального значения. По умолчанию 1.
+
+    Возвращает:
+        tuple: (min, max) — границы оси.
+    """
+    if lim is not None:
+        return lim[0], lim[1]
+
+    # Один векторизованный проход вместо встроенных min()/max() по элементам
+    values = np.asarray(values)
+    return values.min() - padding, values.max() + padding
+
+
+def model_fingerprint(model_or_func):
+    """
+    Строит «отпечаток» модели — хеш её обученных параметров.
+
+    Хешируются все данные, от которых зависят предсказания: атрибуты объектов
+    (coef_, support_vectors_, веса) рекурсивно, вложенные объекты без __dict__
+    (например, tree_ у деревьев sklearn) — через pickle, веса Keras — через
+    get_weights(). У связанного метода (model.predict) хешируется сам объект
+    модели, у функции — байт-код, значения по умолчанию, замыкания и
+    используемые глобальные переменные. Если модель дообучили, отпечаток
+    меняется, и закешированные предсказания становятся неактуальными.
+
+    Параметры:
+        model_or_func (object или callable): Модель с методом .predict или функция f(x, y).
+
+    Возвращает:
+        str или None: Шестнадцатеричная строка-хеш; None, если часть состояния
+        модели захешировать не удалось — тогда предсказания не кешируются.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    seen = set()
+    opaque = []
+
+    def update(value):
+        if value is None or isinstance(value, (int, float, str, bool, bytes, np.number)):
+            digest.update(repr(value).encode())
+            return
+        if isinstance(value, np.ndarray):
+            digest.update(f"{value.dtype}{value.shape}".encode())
+            if value.dtype.hasobject:
+                for item in value.ravel():
+                    update(item)
+            else:
+                digest.update(np.ascontiguousarray(value).tobytes())
+            return
+        if isinstance(value, (types.ModuleType, type)):
+            digest.update(getattr(value, '__qualname__', value.__name__).encode())
+            return
+
+        # Повторный объект (в том числе циклические ссылки) хешируется один раз
+        if id(value) in seen:
+            digest.update(b'<seen>')
+            return
+        seen.add(id(value))
+        digest.update(type(value).__qualname__.encode())
+
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                update(item)
+        elif isinstance(value, dict):
+            for key in sorted(value, key=repr):
+                update(key)
+                update(value[key])
+        elif isinstance(value, types.MethodType):
+            # model.predict: код метода и сам объект модели с весами
+            update(value.__func__)
+            update(value.__self__)
+        elif isinstance(value, types.CodeType):
+            digest.update(value.co_code)
+            update(value.co_consts)
+            update(value.co_names)
+        elif isinstance(value, types.FunctionType):
+            update(value.__code__)
+            update(value.__defaults__)
+            for cell in value.__closure__ or ():
+                update(cell.cell_contents)
+            # Глобальные переменные, которые использует функция (например, обученная модель)
+            for name in value.__code__.co_names:
+                if name in value.__globals__:
+                    update(value.__globals__[name])
+        elif hasattr(value, "get_weights"):
+            # Keras: веса хранятся в тензорах, а не в обычных атрибутах
+            for w in value.get_weights():
+                update(np.asarray(w))
+        elif hasattr(value, "__dict__"):
+            attributes = vars(value)
+            for name in sorted(attributes):
+                digest.update(name.encode())
+                update(attributes[name])
+        else:
+            try:
+                digest.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            except Exception:
+                opaque.append(value)
+
+    try:
+        update(model_or_func)
+    except RecursionError:
+        return None
+    if opaque:
+        return None
+    return digest.hexdigest()
+
+
+def predict_on_grid(model_or_func, grid):
+    """
+    Вычисляет предсказания модели или функции f(x, y) в точках сетки.
+
+    Параметры:
+        model_or_func (object или callable): Модель с методом .predict или функция f(x, y).
+        grid (numpy.ndarray): Точки сетки формы (n_points, 2).
+
+    Возвращает:
+        numpy.ndarray: Вектор предсказанных классов формы (n_points,).
+    """
+    if hasattr(model_or_func, "predict"):
+        Z = np.asarray(model_or_func.predict(grid))
+        if Z.ndim > 1:  # Keras → вероятности классов
+            Z = np.argmax(Z, axis=1)
+        return Z.ravel()
+
+    # Кастомная f(x, y): пробуем вызвать её сразу на массивах,
+    # и только если не получилось — по точкам
+    try:
+        Z = np.asarray(model_or_func(grid[:, 0], grid[:, 1]))
+        if Z.shape == (len(grid),):
+            return Z
+    except Exception:
+        pass
+    return np.array([model_or_func(p[0], p[1]) for p in grid])
+
+
+class PlotContext:
+    """
+    Контекст отрисовки для одного набора данных.
+
+    Один раз считает границы графика, кеширует сетки (meshgrid) для каждого
+    разрешения и предсказания моделей на этих сетках (по отпечатку модели).
+    В интерактивной сессии повторная отрисовка той же модели на тех же
+    данных не пересчитывает ни сетку, ни предсказания.
+
+    Пример:
+        ctx = PlotContext(features, labels)
+        plot_decision_boundary(features, labels, model, context=ctx)
+        ctx.render_decision_regions(model, ax=ax, resolutions=(50, 500))
+    """
+
+    def __init__(self, features, labels, *, xlim=None, ylim=None, padding=1):
+        """
+        Параметры:
+            features (array-like): Матрица признаков (1D или 2D).
+            labels (array-like): Вектор меток.
+            xlim (tuple, optional): Явные границы по оси X.
+            ylim (tuple, optional): Явные границы по оси Y.
+            padding (float): Отступ от крайних точек. По умолчанию 1.
+        """
+        self.X = np.asarray(features)
+        self.y = np.asarray(labels)
+
+        one_dimensional = self.X.ndim == 1 or (self.X.ndim == 2 and self.X.shape[1] == 1)
+        first = self.X.ravel() if one_dimensional else self.X[:, 0]
+        second = self.X.ravel() if one_dimensional else self.X[:, 1]
+
+        # Границы признаков (для сетки) и меток (для графиков регрессии/истории)
+        self.xlim = axis_bounds(first, xlim, padding)
+        self.ylim = axis_bounds(second, ylim, padding)
+        self.label_lim = axis_bounds(self.y, ylim, padding) if self.y.size else self.ylim
+
+        self._grids = {}  # resolution -> (xx, yy, grid)
+        self._predictions = {}  # (fingerprint, resolution) -> Z
+        self.hits = 0  # Количество попаданий в кеш предсказаний
+        self.misses = 0  # Количество пересчётов предсказаний
+
+    def check_limits(self, xlim=None, ylim=None):
+        """
+        Проверяет, что явно заданные границы совпадают с границами контекста.
+
+        Сетки и предсказания контекста построены по его границам, поэтому
+        другие xlim/ylim при отрисовке с этим контекстом учесть нельзя.
+
+        Исключения:
+            ValueError: Если xlim или ylim отличаются от границ контекста.
+        """
+        for name, lim, own in (("xlim", xlim, self.xlim), ("ylim", ylim, self.ylim)):
+            if lim is not None and not np.allclose(lim, own):
+                raise ValueError(
+                    f"{name}={tuple(lim)} не совпадает с границами контекста {tuple(own)}: "
+                    f"создайте PlotContext с {name}={tuple(lim)}"
+                )
+
+    def meshgrid(self, resolution):
+        """
+        Возвращает сетку заданного разрешения (с кешированием).
+
+        Возвращает:
+            tuple: (xx, yy, grid), где grid — точки сетки формы (resolution**2, 2).
+        """
+        if resolution not in self._grids:
+            xx, yy = np.meshgrid(
+                np.linspace(self.xlim[0], self.xlim[1], resolution),
+                np.linspace(self.ylim[0], self.ylim[1], resolution)
+            )
+            grid = np.column_stack([xx.ravel(), yy.ravel()])
+            self._grids[resolution] = (xx, yy, grid)
+        return self._grids[resolution]
+
+    def predict(self, model_or_func, resolution):
+        """
+        Возвращает предсказания модели на сетке формы (resolution, resolution).
+
+        Результат кешируется по отпечатку модели, поэтому после дообучения
+        модели предсказания пересчитываются автоматически. Модели, для которых
+        отпечаток построить нельзя, не кешируются.
+        """
+        fingerprint = model_fingerprint(model_or_func)
+        if fingerprint is None:
+            self.misses += 1
+            xx, yy, grid = self.meshgrid(resolution)
+            return predict_on_grid(model_or_func, grid).reshape(xx.shape)
+
+        key = (fingerprint, resolution)
+        if key in self._predictions:
+            self.hits += 1
+        else:
+            self.misses += 1
+            xx, yy, grid = self.meshgrid(resolution)
+            self._predictions[key] = predict_on_grid(model_or_func, grid).reshape(xx.shape)
+        return self._predictions[key]
+
+    def clear(self):
+        """Очищает кеш сеток и предсказаний."""
+        self._grids.clear()
+        self._predictions.clear()
+
+    def render_decision_regions(
+            self,
+            model_or_func,
+            *,
+            resolutions=(50, 500),
+            colors=("cyan", "magenta"),
+            alpha=0.3,
+            ax=None,
+            plot_method="contourf"
+    ):
+        """
+        Прогрессивно рисует области решений модели.
+
+        Сначала выполняется быстрый проход с грубой сеткой, затем каждый
+        следующий проход заменяет предыдущий более точным. В интерактивном
+        режиме (plt.ion(), ipympl) между проходами холст перерисовывается,
+        поэтому грубая картинка появляется почти сразу.
+
+        Параметры:
+            model_or_func (object или callable): Модель с .predict или функция f(x, y).
+            resolutions (tuple of int): Разрешения проходов по возрастанию.
+            colors (tuple): Цвета классов.
+            alpha (float): Прозрачность заливки.
+            ax (matplotlib.axes.Axes, optional): Оси для отрисовки.
+            plot_method (str): "contourf" — заливка с линией границы;
+                "pcolormesh" — заливка ячейками сетки, как у sklearn DecisionBoundaryDisplay.
+
+        Возвращает:
+            matplotlib.axes.Axes: Оси с нарисованными областями.
+        """
+        if ax is None:
+            ax = plt.gca()
+
+        custom_cmap = ListedColormap(colors)
+        artists = []
+
+        for resolution in resolutions:
+            xx, yy, _ = self.meshgrid(resolution)
+            Z = self.predict(model_or_func, resolution)
+            if Z.dtype.kind not in "iuf":
+                # Метки-строки или bool → номера классов в порядке сортировки
+                Z = np.unique(Z, return_inverse=True)[1].reshape(xx.shape)
+
+            # Убираем результат предыдущего (более грубого) прохода
+            for artist in artists:
+                artist.remove()
+
+            if plot_method == "pcolormesh":
+                artists = [ax.pcolormesh(
+                    xx, yy, Z,
+                    vmin=0,
+                    vmax=len(colors) - 1,
+                    alpha=alpha,
+                    cmap=custom_cmap
+                )]
+            else:
+                filled = ax.contourf(
+                    xx, yy, Z,
+                    levels=np.arange(len(colors) + 1) - 0.5,
+                    alpha=alpha,
+                    cmap=custom_cmap
+                )
+                lines = ax.contour(xx, yy, Z, levels=[0.5], colors="k", linewidths=1.5)
+                artists = [filled, lines]
+
+            if plt.isinteractive() and ax.figure.canvas is not None:
+                ax.figure.canvas.draw_idle()
+                ax.figure.canvas.flush_events()
+
+        ax.set_xlim(*self.xlim)
+        ax.set_ylim(*self.ylim)
+
+        return ax
@@ -1,9 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.colors import ListedColormap
-from sklearn.inspection import DecisionBoundaryDisplay
 
 from .plot_points import plot_points
+from .plot_context import PlotContext
 
 
 def plot_decision_boundary(
@@ -19,7 +18,11 @@ def plot_decision_boundary(
         xlim=None,
         ylim=None,
         ax=None,
-        use_sklearn_display: bool = True
+        use_sklearn_display: bool = True,
+        resolution: int = 500,
+        grid_resolution: int = 300,
+        progressive: bool = False,
+        context=None
 ):
     """
     Универсальная функция для отрисовки границы классификации
@@ -33,8 +36,24 @@ def plot_decision_boundary(
         Вектор меток классов.
     model_or_func : object или callable
         - Если объект имеет метод .predict → используется для предсказаний (SVM, sklearn, Keras).
-        - Если объект совместим с sklearn.inspection.DecisionBoundaryDisplay и use_sklearn_display=True → используется он.
         - Если передана функция f(x, y) → используется напрямую.
+    use_sklearn_display : bool
+        Если True и у модели есть .predict — области рисуются ячейками сетки
+        (pcolormesh) разрешения grid_resolution, как у
+        sklearn.inspection.DecisionBoundaryDisplay, но по закешированным
+        в context предсказаниям. Если False или передана функция — contourf
+        разрешения resolution. По умолчанию True.
+    resolution : int
+        Разрешение сетки для contourf (по умолчанию 500).
+    grid_resolution : int
+        Разрешение сетки для use_sklearn_display=True (по умолчанию 300).
+    progressive : bool
+        Если True — сначала быстрый грубый проход, затем точный с разрешением resolution.
+    context : PlotContext, optional
+        Контекст с закешированными границами, сетками и предсказаниями.
+        Передавайте один и тот же контекст при повторных вызовах для тех же данных.
+        Если вместе с ним заданы xlim/ylim, они должны совпадать с границами
+        контекста (сетки построены по ним), иначе — ValueError.
     """
 
     X = np.array(features)
@@ -43,72 +62,31 @@ def plot_decision_boundary(
     if ax is None:
         ax = plt.gca()
 
-    # Определяем границы
-    if xlim is None:
-        if X.ndim == 1 or (X.ndim == 2 and X.shape[1] == 1):
-            x_min = (min(X) - 1)  # Левая граница с отступом 1
-            x_max = (max(X) + 1)  # Правая граница с отступом 1
-        else:
-            x_min = min(X[:, 0]) - 1  # Левая граница с отступом 1
-            x_max = max(X[:, 0]) + 1  # Правая граница с отступом 1
+    # Границы, сетки и предсказания считаются один раз на набор данных
+    if context is None:
+        context = PlotContext(X, y, xlim=xlim, ylim=ylim)
     else:
-        x_min, x_max = xlim[0], xlim[1]
+        context.check_limits(xlim, ylim)
 
-    if ylim is None:
-        if X.ndim == 1 or (X.ndim == 2 and X.shape[1] == 1):
-            y_min = min(X) - 1
-            y_max = max(X) + 1
-        else:
-            y_min = min(X[:, 1]) - 1
-            y_max = max(X[:, 1]) + 1
-    else:
-        y_min, y_max = ylim[0], ylim[1]
-
-    custom_cmap = ListedColormap(colors)
+    x_min, x_max = context.xlim
+    y_min, y_max = context.ylim
 
-    # Ветка 1: sklearn-овские модели через DecisionBoundaryDisplay
+    # Обе ветки рисуют закешированные в контексте предсказания на закешированных сетках
     if use_sklearn_display and hasattr(model_or_func, "predict"):
-        try:
-            DecisionBoundaryDisplay.from_estimator(
-                model_or_func,
-                X,
-                response_method="predict",
-                plot_method="pcolormesh",
-                alpha=0.3,
-                cmap=custom_cmap,
-                ax=ax,
-                grid_resolution=300,
-                plot_range=[(x_min, x_max), (y_min, y_max)]
-            )
-        except Exception:
-            # Если модель не совместима — fallback к ручной реализации
-            use_sklearn_display = False
-
-    # Ветка 2: универсальный fallback (SVM, Keras, функции)
-    if not (use_sklearn_display and hasattr(model_or_func, "predict")):
-        resolution = 500
-        xx, yy = np.meshgrid(
-            np.linspace(x_min, x_max, resolution),
-            np.linspace(y_min, y_max, resolution)
-        )
-        grid = np.c_[xx.ravel(), yy.ravel()]
-
-        if hasattr(model_or_func, "predict"):
-            Z = model_or_func.predict(grid)
-            if Z.ndim > 1:  # Keras → вероятности
-                Z = np.argmax(Z, axis=1)
-        else:  # кастомная f(x, y)
-            Z = np.array([model_or_func(p[0], p[1]) for p in grid])
-
-        Z = Z.reshape(xx.shape)
+        # Как sklearn DecisionBoundaryDisplay: заливка ячейками сетки grid_resolution
+        plot_method, top_resolution = "pcolormesh", grid_resolution
+    else:
+        plot_method, top_resolution = "contourf", resolution
 
-        ax.contourf(
-            xx, yy, Z,
-            levels=np.arange(len(colors) + 1) - 0.5,
-            alpha=0.3,
-            cmap=custom_cmap
-        )
-        ax.contour(xx, yy, Z, levels=[0.5], colors="k", linewidths=1.5)
+    # Грубый проход (top_resolution / 10) нужен только в прогрессивном режиме
+    resolutions = (max(top_resolution // 10, 10), top_resolution) if progressive else (top_resolution,)
+    context.render_decision_regions(
+        model_or_func,
+        resolutions=resolutions,
+        colors=colors,
+        ax=ax,
+        plot_method=plot_method
+    )
 
     # Рисуем сами точки
     plot_points(
@@ -0,0 +1,397 @@
+# chapter13/utils/prediction_server.py
+
+
+"""
+Локальный сервер пакетных предсказаний для обученных линейных моделей
+(линейная регрессия, перцептрон, логистическая регрессия).
+
+Запуск из папки experiments:
+
+    python -m utils.prediction_server --model titanic=models/titanic.json --port 8000
+    python -m utils.prediction_server --model titanic=models/titanic.json --stdin
+    python -m utils.prediction_server --model titanic=models/titanic.gmla --port 8000
+
+HTTP:
+    POST /predict  {"model": "titanic", "features": [[...], [...]]}
+                   -> {"predictions": [...]}
+    GET  /stats    -> {"requests": ..., "p50_ms": ..., "p99_ms": ..., ...}
+
+stdin/stdout (по одному JSON на строку):
+    {"id": 1, "model": "titanic", "features": [...]}
+    -> {"id": 1, "predictions": [...]}
+"""
+
+import sys
+import json
+import time
+import asyncio
+import argparse
+from collections import deque
+
+import numpy as np
+
+from utils.errors import score
+from utils.model_artifact import is_artifact, load_artifact
+
+
+MODEL_KINDS = {'linear', 'perceptron', 'logistic'}
+
+
+def save_model_json(path, kind, weights, bias):
+    """
+    Сохраняет параметры линейной модели в JSON.
+
+    Пример:
+        result = logistic_regression_algorithm(features, labels)
+        save_model_json('models/titanic.json', 'logistic',
+                        result['final_weights'], result['final_bias'])
+
+    Параметры:
+        path (str): Путь к файлу.
+        kind (str): Тип модели: 'linear', 'perceptron' или 'logistic'.
+        weights (list или numpy.ndarray): Веса модели.
+        bias (float): Смещение модели.
+    """
+    if kind not in MODEL_KINDS:
+        raise ValueError("kind должен быть 'linear', 'perceptron' или 'logistic'")
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'kind': kind,
+            'weights': np.atleast_1d(np.asarray(weights, dtype=float)).tolist(),
+            'bias': float(bias)
+        }, f)
+
+
+def load_model(path):
+    """
+    Загружает модель из JSON-файла или бинарного артефакта (utils.model_artifact).
+
+    Бинарный артефакт отображается в память, и веса не копируются.
+
+    Возвращает:
+        dict: {'kind', 'weights' (numpy.ndarray), 'bias' (float)}
+    """
+    if is_artifact(path):
+        artifact = load_artifact(path)
+        return {'kind': artifact['kind'], 'weights': artifact['weights'], 'bias': artifact['bias']}
+
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+
+    if data.get('kind') not in MODEL_KINDS:
+        raise ValueError(f"Неизвестный тип модели в {path}: {data.get('kind')!r}")
+
+    return {
+        'kind': data['kind'],
+        'weights': np.asarray(data['weights'], dtype=float),
+        'bias': float(data['bias'])
+    }
+
+
+def predict_batch(model, features):
+    """
+    Векторизованное предсказание для матрицы признаков.
+
+    score считается одним матричным умножением для всего пакета,
+    затем применяется выход модели: значение (linear), класс (perceptron)
+    или вероятность класса 1 (logistic).
+    """
+    scores = score(model['weights'], model['bias'], features)
+
+    if model['kind'] == 'perceptron':
+        return (scores >= 0).astype(int)
+    if model['kind'] == 'logistic':
+        # Численно устойчивая векторная сигмоида
+        return 0.5 * (1 + np.tanh(scores / 2))
+    return scores
+
+
+class LatencyStats:
+    """Скользящая статистика задержек (последние window запросов)."""
+
+    def __init__(self, window=100000):
+        self.latencies = deque(maxlen=window)
+        self.requests = 0
+        self.predictions = 0
+        self.batches = 0
+        self.started = time.perf_counter()
+
+    def record(self, latency, n_predictions):
+        self.latencies.append(latency)
+        self.requests += 1
+        self.predictions += n_predictions
+
+    def summary(self):
+        """
+        Возвращает:
+            dict: количество запросов и предсказаний, p50/p99 задержки в мс,
+                  средний размер пакета и предсказаний в секунду.
+        """
+        elapsed = time.perf_counter() - self.started
+        latencies = np.array(self.latencies) * 1000 if self.latencies else np.zeros(1)
+        return {
+            'requests': self.requests,
+            'predictions': self.predictions,
+            'batches': self.batches,
+            'mean_batch_requests': self.requests / self.batches if self.batches else 0.0,
+            'p50_ms': float(np.percentile(latencies, 50)),
+            'p99_ms': float(np.percentile(latencies, 99)),
+            'predictions_per_second': self.predictions / elapsed if elapsed > 0 else 0.0
+        }
+
+
+class MicroBatcher:
+    """
+    Собирает одновременные запросы в пакеты.
+
+    Запросы складываются в очередь; фоновая задача забирает всё, что
+    накопилось (но не больше max_batch строк и не дольше max_delay секунд
+    ожидания), группирует по моделям и делает один вызов predict_batch
+    на модель.
+    """
+
+    def __init__(self, models, max_batch=4096, max_delay=0.001):
+        """
+        Параметры:
+            models (dict): Имя модели -> параметры (результат load_model).
+            max_batch (int): Максимальное количество строк в пакете.
+            max_delay (float): Максимальное ожидание пополнения пакета в секундах.
+        """
+        self.models = models
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.queue = asyncio.Queue()
+        self.stats = LatencyStats()
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def predict(self, model_name, features):
+        """
+        Ставит запрос в очередь и ждёт результат.
+
+        Параметры:
+            model_name (str): Имя модели.
+            features (list): Один вектор признаков или список векторов.
+
+        Возвращает:
+            list: Предсказания для каждой строки.
+        """
+        if model_name not in self.models:
+            raise KeyError(f"Неизвестная модель: {model_name!r}")
+
+        rows = np.asarray(features, dtype=float)
+        if rows.ndim == 1:
+            rows = rows[None, :]
+
+        n_features = len(self.models[model_name]['weights'])
+        if rows.ndim != 2 or rows.shape[1] != n_features:
+            raise ValueError(f"Модель {model_name!r} ожидает {n_features} признаков")
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((model_name, rows, future, time.perf_counter()))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            # Ждём первый запрос, затем добираем пакет
+            pending = [await self.queue.get()]
+            n_rows = len(pending[0][1])
+            deadline = loop.time() + self.max_delay
+
+            while n_rows < self.max_batch:
+                if self.queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self.queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    item = self.queue.get_nowait()
+                pending.append(item)
+                n_rows += len(item[1])
+
+            self._process(pending)
+
+    def _process(self, pending):
+        """Группирует пакет по моделям и делает по одному векторному вызову на модель."""
+        by_model = {}
+        for item in pending:
+            by_model.setdefault(item[0], []).append(item)
+
+        for model_name, items in by_model.items():
+            try:
+                X = np.concatenate([rows for _, rows, _, _ in items]) if len(items) > 1 else items[0][1]
+                predictions = predict_batch(self.models[model_name], X)
+            except Exception as error:
+                # Ошибка одной модели получают только её запросы; цикл пакетов продолжает работать
+                for _, _, future, _ in items:
+                    if not future.done():
+                        future.set_exception(error)
+                continue
+
+            offset = 0
+            now = time.perf_counter()
+            for _, rows, future, started in items:
+                part = predictions[offset:offset + len(rows)].tolist()
+                offset += len(rows)
+                if not future.done():
+                    future.set_result(part)
+                self.stats.record(now - started, len(rows))
+
+        self.stats.batches += 1
+
+
+# === HTTP ===
+
+async def _handle_http(batcher, reader, writer):
+    """Минимальный HTTP/1.1 обработчик с поддержкой keep-alive."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, path, _ = request_line.decode('latin-1').split(' ', 2)
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                headers[name.strip().lower()] = value.strip()
+
+            body = await reader.readexactly(int(headers.get('content-length', 0)))
+            status, payload = await _route(batcher, method, path, body)
+
+            data = json.dumps(payload).encode()
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+            )
+            await writer.drain()
+
+            if headers.get('connection', '').lower() == 'close':
+                break
+    except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _route(batcher, method, path, body):
+    """Обрабатывает запрос и возвращает (статус, тело ответа)."""
+    if method == 'GET' and path == '/stats':
+        return '200 OK', batcher.stats.summary()
+
+    if method == 'POST' and path == '/predict':
+        try:
+            request = json.loads(body)
+            predictions = await batcher.predict(request['model'], request['features'])
+            return '200 OK', {'predictions': predictions}
+        except (KeyError, ValueError, TypeError) as error:
+            return '400 Bad Request', {'error': str(error)}
+        except Exception as error:
+            return '500 Internal Server Error', {'error': str(error)}
+
+    return '404 Not Found', {'error': 'not found'}
+
+
+async def serve_http(models, host='127.0.0.1', port=8000, **batcher_options):
+    """Запускает HTTP-сервер предсказаний."""
+    batcher = MicroBatcher(models, **batcher_options)
+    batcher.start()
+    server = await asyncio.start_server(
+        lambda r, w: _handle_http(batcher, r, w), host, port
+    )
+    print(f"Сервер предсказаний: http://{host}:{port} (модели: {', '.join(models)})", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+# === stdin/stdout ===
+
+async def serve_stdin(models, input_stream=None, output_stream=None, **batcher_options):
+    """
+    Обрабатывает JSON-запросы построчно из stdin и пишет ответы в stdout.
+
+    Строки читаются без ожидания ответов, поэтому подряд идущие запросы
+    попадают в один пакет. Ответы приходят по мере готовности и содержат id
+    запроса. В конце печатается статистика задержек (в stderr).
+    """
+    input_stream = input_stream or sys.stdin
+    output_stream = output_stream or sys.stdout
+    loop = asyncio.get_running_loop()
+
+    batcher = MicroBatcher(models, **batcher_options)
+    batcher.start()
+    tasks = []
+
+    async def answer(request):
+        try:
+            predictions = await batcher.predict(request['model'], request['features'])
+            response = {'id': request.get('id'), 'predictions': predictions}
+        except Exception as error:
+            response = {'id': request.get('id'), 'error': str(error)}
+        output_stream.write(json.dumps(response) + '\n')
+
+    while True:
+        line = await loop.run_in_executor(None, input_stream.readline)
+        if not line:
+            break
+        if not line.strip():
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as error:
+            output_stream.write(json.dumps({'error': str(error)}) + '\n')
+            continue
+        tasks.append(loop.create_task(answer(request)))
+
+    await asyncio.gather(*tasks)
+    await batcher.stop()
+    output_stream.flush()
+    print(json.dumps(batcher.stats.summary()), file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Сервер пакетных предсказаний")
+    parser.add_argument('--model', action='append', required=True, metavar='ИМЯ=ПУТЬ',
+                        help="Модель для загрузки (можно указать несколько раз)")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--stdin', action='store_true', help="Читать запросы из stdin вместо HTTP")
+    parser.add_argument('--max-batch', type=int, default=4096)
+    parser.add_argument('--max-delay-ms', type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    # Модели загружаются один раз при старте
+    models = {}
+    for spec in args.model:
+        name, _, path = spec.partition('=')
+        models[name] = load_model(path)
+
+    options = {'max_batch': args.max_batch, 'max_delay': args.max_delay_ms / 1000}
+
+    if args.stdin:
+        asyncio.run(serve_stdin(models, **options))
+    else:
+        asyncio.run(serve_http(models, args.host, args.port, **options))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# chapter13/utils/random_state.py
+
+
+import numpy as np
+
+
+def make_rng(seed=None):
+    """
+    Создаёт генератор случайных чисел numpy.random.Generator.
+
+    Параметры:
+        seed (int, numpy.random.SeedSequence, numpy.random.Generator или None):
+            Seed, последовательность seed'ов или уже готовый генератор
+            (возвращается как есть, чтобы вызывающий код мог передавать свой поток).
+
+    Возвращает:
+        numpy.random.Generator
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def spawn_rngs(seed, n):
+    """
+    Создаёт n независимых дочерних генераторов — по одному на воркер.
+
+    Дочерние потоки выводятся через SeedSequence.spawn, поэтому они не
+    пересекаются между собой и не зависят от порядка запуска воркеров:
+    результат i-го воркера определяется только seed и номером i.
+
+    Пример:
+        rngs = spawn_rngs(42, len(configs))
+        with ProcessPoolExecutor() as pool:
+            results = pool.map(train_one, configs, rngs)
+
+    Параметры:
+        seed (int, SeedSequence или Generator): Родительский seed или генератор.
+        n (int): Количество дочерних генераторов.
+
+    Возвращает:
+        list of numpy.random.Generator
+    """
+    if isinstance(seed, np.random.Generator):
+        return seed.spawn(n)
+    if not isinstance(seed, np.random.SeedSequence):
+        seed = np.random.SeedSequence(seed)
+    return [np.random.default_rng(child) for child in seed.spawn(n)]
+
+
+def epoch_indices(rng, n_samples, epochs):
+    """
+    Индексы примеров для стохастического спуска: по одному на эпоху,
+    вытянутые одним вызовом генератора.
+
+    Возвращает:
+        numpy.ndarray: Массив (epochs,) целых чисел из [0, n_samples).
+    """
+    return rng.integers(0, n_samples, size=epochs)
+
+
+def batch_indices(rng, n_samples, batch_size, epochs, chunk_size=1 << 22):
+    """
+    Индексы мини-батчей без повторений внутри батча для всех эпох сразу.
+
+    Небольшие батчи выбираются алгоритмом Флойда сразу для всех эпох:
+    batch_size шагов, на каждом — один вызов генератора на все эпохи и
+    проверка повторов по уже выбранным столбцам; затем порядок внутри
+    каждого батча перемешивается. Это O(epochs · batch_size²) времени
+    и O(epochs · batch_size) памяти — не зависит от n_samples.
+
+    Если батч сравним с выборкой (batch_size² > n_samples), дешевле взять
+    batch_size наименьших из n_samples случайных ключей (argpartition):
+    O(epochs · n_samples). Эпохи обрабатываются блоками так, чтобы
+    промежуточная матрица не превышала chunk_size элементов.
+
+    Возвращает:
+        numpy.ndarray: Массив (epochs, batch_size) индексов.
+    """
+    if batch_size > n_samples:
+        raise ValueError("batch_size не может быть больше количества примеров")
+
+    result = np.empty((epochs, batch_size), dtype=np.int64)
+    floyd = batch_size * batch_size <= n_samples
+    row_size = batch_size if floyd else n_samples
+    rows_per_chunk = max(1, chunk_size // max(row_size, 1))
+
+    for start in range(0, epochs, rows_per_chunk):
+        stop = min(epochs, start + rows_per_chunk)
+        rows = stop - start
+        if floyd:
+            # Алгоритм Флойда: для j = n - k, ..., n - 1 берём t из [0, j];
+            # если t уже выбран, берём сам j (его ещё не могли выбрать)
+            chosen = result[start:stop]
+            for column, j in enumerate(range(n_samples - batch_size, n_samples)):
+                t = rng.integers(0, j + 1, size=rows)
+                repeated = (chosen[:, :column] == t[:, None]).any(axis=1)
+                chosen[:, column] = np.where(repeated, j, t)
+            # Флойд выбирает равновероятное множество, но не порядок в нём
+            chosen[:] = rng.permuted(chosen, axis=1)
+        else:
+            keys = rng.random((rows, n_samples))
+            if batch_size < n_samples:
+                keys = np.argpartition(keys, batch_size - 1, axis=1)[:, :batch_size]
+            else:
+                keys = np.argsort(keys, axis=1)
+            result[start:stop] = keys
+    return result
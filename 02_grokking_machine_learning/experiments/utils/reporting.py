@@ -1,8 +1,14 @@
 # chapter03/utils/reporting.py
 
 
+import os
+import csv
+
 import numpy as np
-from models.polynomial_regression import predict_polynomial
+from models.polynomial_regression import predict_polynomial, expand_polynomial_features
+
+
+REPORT_CHUNK_SIZE = 10_000  # Строк отчёта, форматируемых и записываемых за один раз
 
 
 def format_equation(slope, intercept, precision=2):
@@ -136,3 +142,181 @@ def print_weights(weights, bias, feature_names, decision=2):
 
     # Выводим смещение с табуляцией для выравнивания с другими строками
     print(f'Смещение:\t{bias_str}')
+
+
+# --- Пакетное форматирование: много моделей за один вызов ---
+
+def _round_strings(values, precision):
+    """
+    Округляет массив одной операцией и переводит его в строки.
+
+    Строки совпадают с str(round(x, precision)) у одиночных функций
+    (кратчайшая запись числа: 2.0, 2.35, -0.1).
+    """
+    return np.round(np.asarray(values, dtype=float), precision).astype(str)
+
+
+def format_equations(slopes, intercepts, precision=2):
+    """
+    Форматирует уравнения прямых y = mx + b для многих моделей сразу.
+
+    Parameters:
+        slopes (array-like): Наклоны, по одному на модель.
+        intercepts (array-like): Смещения, по одному на модель.
+        precision (int): Количество знаков после запятой.
+
+    Returns:
+        list: Строки в том же виде, что у format_equation.
+    """
+    b = np.round(np.asarray(intercepts, dtype=float), precision)
+    sign = np.where(b >= 0, " + ", " - ")
+    equations = np.char.add(np.char.add("y = ", _round_strings(slopes, precision)), " * x")
+    return np.char.add(np.char.add(equations, sign), np.abs(b).astype(str)).tolist()
+
+
+def format_polynomial_equations(weights, precision=2):
+    """
+    Форматирует уравнения полиномов для многих моделей сразу.
+
+    Все коэффициенты округляются одной операцией, а термы собираются
+    по столбцам (степеням), а не по моделям: число операций равно
+    степени полинома, а не числу моделей.
+
+    Параметры:
+    weights (np.ndarray): Веса моделей формы (n_models, degree + 1),
+                          одна модель — одна строка.
+    precision (int): Количество знаков после запятой.
+
+    Возвращает:
+    list: Строки в том же виде, что у format_polynomial_equation.
+    """
+    terms = _round_strings(np.atleast_2d(weights), precision)
+    equations = np.char.add("y = ", terms[:, 0])
+    for i in range(1, terms.shape[1]):
+        equations = np.char.add(equations, np.char.add(np.char.add(" + (", terms[:, i]), f" * x^{i})"))
+    return equations.tolist()
+
+
+def format_predictions_poly(weights, degree, x_values, precision=2):
+    """
+    Предсказания многих полиномиальных моделей во многих точках и их строки.
+
+    Полиномиальные признаки точек x строятся один раз, а предсказания всех
+    моделей считаются одним матричным умножением (а не вызовом
+    print_prediction_poly на каждую пару модель–точка).
+
+    Parameters:
+        weights (np.ndarray): Веса моделей формы (n_models, degree + 1).
+        degree (int): Степень полинома.
+        x_values (array-like): Значения x.
+        precision (int): Кол-во знаков после запятой для результата.
+
+    Returns:
+        list: Список по моделям, в каждом — строки как у print_prediction_poly по точкам x.
+    """
+    if not isinstance(x_values, (list, tuple)):
+        x_values = np.atleast_1d(x_values).tolist()
+    X_poly = expand_polynomial_features(np.asarray(x_values, dtype=float), degree)
+    y_pred = np.atleast_2d(weights) @ X_poly.T  # Форма (n_models, n_x)
+
+    # Подписи x — как f"{x_value}" у print_prediction_poly (целые остаются целыми)
+    x_labels = np.array([str(x) for x in x_values])
+    prefixes = np.char.add(np.char.add("Для x = ", x_labels), " → Предсказанное значение: ")
+    return np.char.add(prefixes, np.char.mod(f"%.{precision}f", y_pred)).tolist()
+
+
+def format_weights(weights, bias, feature_names, decision=2):
+    """
+    Форматирует веса и смещения многих моделей так же, как их выводит print_weights.
+
+    Параметры:
+        weights (numpy.ndarray): Веса формы (n_models, n_features).
+        bias (array-like): Смещения, по одному на модель.
+        feature_names (list): Список названий признаков.
+        decision (int, optional): Количество знаков после запятой. По умолчанию 2.
+
+    Возвращает:
+        list: По строке на модель (строки print_weights, соединённые через перевод строки).
+    """
+    weights = np.atleast_2d(np.asarray(weights, dtype=float))
+    values = np.char.mod(f"%.{decision}f", weights)
+    # Пробел перед неотрицательными весами выравнивает их со знаком "-" у отрицательных
+    values = np.char.add(np.where(weights >= 0, "\t ", "\t"), values)
+
+    lines = np.full(weights.shape[0], "")
+    for j, name in enumerate(feature_names):
+        lines = np.char.add(lines, np.char.add(f"Вес «{name.lower()}»:", values[:, j]))
+        lines = np.char.add(lines, "\n")
+    bias_values = np.char.mod(f"%.{decision}f", np.asarray(bias, dtype=float).reshape(-1))
+    return np.char.add(np.char.add(lines, "Смещение:\t"), bias_values).tolist()
+
+
+def _infer_report_format(path, fmt):
+    if fmt is None:
+        fmt = 'markdown' if os.path.splitext(str(path))[1].lower() in {'.md', '.markdown'} else 'csv'
+    if fmt not in {'csv', 'markdown'}:
+        raise ValueError("fmt должен быть 'csv' или 'markdown'")
+    return fmt
+
+
+def write_report(path, columns, precision=None, fmt=None, chunk_size=REPORT_CHUNK_SIZE):
+    """
+    Записывает таблицу отчёта (например, по тысячам моделей перебора) в CSV или Markdown.
+
+    Строки форматируются и пишутся в файл блоками по chunk_size: числа каждого
+    блока переводятся в строки одной операцией на столбец, блок собирается
+    одним join и записывается одним вызовом write — весь отчёт целиком
+    в памяти в виде строк не держится.
+
+    Пример:
+        write_report('sweep.md', {
+            'Степень': degrees,
+            'Уравнение': format_polynomial_equations(weights),
+            'RMSE': rmses
+        }, precision=3)
+
+    Параметры:
+        path (str): Путь к файлу.
+        columns (dict): Название столбца → массив значений (все одной длины).
+        precision (int, optional): Знаков после запятой для столбцов с
+            дробными числами (по умолчанию — кратчайшая запись числа).
+        fmt (str, optional): 'csv' или 'markdown'; по умолчанию определяется
+            по расширению файла (.md — Markdown, иначе CSV).
+        chunk_size (int): Строк в одном блоке.
+
+    Возвращает:
+        int: Количество записанных строк (без заголовка).
+    """
+    fmt = _infer_report_format(path, fmt)
+    names = list(columns)
+    values = [np.asarray(column) for column in columns.values()]
+    n_rows = len(values[0]) if values else 0
+    if any(len(column) != n_rows for column in values):
+        raise ValueError("Все столбцы отчёта должны быть одной длины")
+
+    def to_strings(column):
+        if precision is not None and column.dtype.kind == 'f':
+            return np.char.mod(f"%.{precision}f", column)
+        return column.astype(str)
+
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        if fmt == 'csv':
+            writer = csv.writer(f)
+            writer.writerow(names)
+        else:
+            f.write("| " + " | ".join(name.replace("|", "\\|") for name in names) + " |\n")
+            f.write("|" + "|".join("---" for _ in names) + "|\n")
+
+        for start in range(0, n_rows, chunk_size):
+            cells = [to_strings(column[start:start + chunk_size]) for column in values]
+            if fmt == 'csv':
+                # csv.writer сам экранирует запятые и кавычки в ячейках
+                writer.writerows(zip(*[column.tolist() for column in cells]))
+            else:
+                # "|" внутри ячейки разорвал бы строку таблицы
+                rows = np.char.replace(cells[0], "|", "\\|")
+                for column in cells[1:]:
+                    rows = np.char.add(np.char.add(rows, " | "), np.char.replace(column, "|", "\\|"))
+                f.write("".join(np.char.add(np.char.add("| ", rows), " |\n").tolist()))
+
+    return n_rows
@@ -0,0 +1,311 @@
+# chapter13/utils/telemetry.py
+
+
+import csv
+import json
+import time
+import tracemalloc
+
+
+class Callback:
+    """
+    Базовый класс обработчика событий обучения.
+
+    Тренеры (linear_regression, polynomial_regression, perceptron_algorithm,
+    logistic_regression_algorithm) вызывают эти методы в ключевых точках
+    цикла обучения. Переопределяйте только нужные методы.
+    """
+
+    def on_train_start(self, info):
+        """Начало обучения. info — словарь с именем тренера, гиперпараметрами и начальными весами ('params')."""
+
+    def on_epoch_start(self, epoch):
+        """Начало эпохи."""
+
+    def on_batch(self, epoch, batch_size):
+        """Выполнено обновление весов по batch_size примерам."""
+
+    def on_phase_end(self, name, seconds):
+        """Завершилась фаза эпохи name ('predict', 'error', 'history', 'update'), заняв seconds секунд."""
+
+    def on_epoch_end(self, epoch, logs):
+        """
+        Конец эпохи. logs — словарь с ошибкой до обновления ('error'), количеством
+        примеров ('samples') и весами после обновления ('params').
+
+        Чтобы остановить обучение, верните непустую строку с причиной остановки.
+        """
+
+    def on_train_end(self, logs):
+        """Конец обучения. logs — словарь с количеством выполненных эпох и причиной остановки."""
+
+    def restored_params(self):
+        """Веса, которые нужно вернуть вместо последних (например, лучшие), или None."""
+        return None
+
+
+class _NullPhase:
+    """Пустой контекстный менеджер фазы (когда обработчиков нет)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _Phase:
+    """Контекстный менеджер, замеряющий время фазы и сообщающий его обработчикам."""
+
+    __slots__ = ('callbacks', 'name', 'started')
+
+    def __init__(self, callbacks, name):
+        self.callbacks = callbacks
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        seconds = time.perf_counter() - self.started
+        for callback in self.callbacks:
+            callback.on_phase_end(self.name, seconds)
+        return False
+
+
+class _NullHooks:
+    """
+    Заглушка событий для обучения без обработчиков.
+
+    Все методы ничего не делают, а phase() возвращает один и тот же пустой
+    контекстный менеджер, поэтому накладные расходы — один вызов метода.
+    """
+
+    _phase = _NullPhase()
+    stop_reason = None
+
+    def __bool__(self):
+        return False
+
+    def train_start(self, info):
+        pass
+
+    def epoch_start(self, epoch):
+        pass
+
+    def batch(self, epoch, batch_size):
+        pass
+
+    def phase(self, name):
+        return self._phase
+
+    def epoch_end(self, epoch, logs):
+        return None
+
+    def train_end(self, logs):
+        pass
+
+    def restored_params(self):
+        return None
+
+
+class Hooks:
+    """Рассылает события обучения списку обработчиков."""
+
+    def __init__(self, callbacks):
+        self.callbacks = list(callbacks)
+        self._phases = {}
+        self.stop_reason = None
+
+    def __bool__(self):
+        return True
+
+    def train_start(self, info):
+        for callback in self.callbacks:
+            callback.on_train_start(info)
+
+    def epoch_start(self, epoch):
+        for callback in self.callbacks:
+            callback.on_epoch_start(epoch)
+
+    def batch(self, epoch, batch_size):
+        for callback in self.callbacks:
+            callback.on_batch(epoch, batch_size)
+
+    def phase(self, name):
+        # Менеджеры фаз создаются один раз на имя и переиспользуются
+        if name not in self._phases:
+            self._phases[name] = _Phase(self.callbacks, name)
+        return self._phases[name]
+
+    def epoch_end(self, epoch, logs):
+        """Возвращает причину остановки, если её запросил какой-либо обработчик."""
+        for callback in self.callbacks:
+            reason = callback.on_epoch_end(epoch, logs)
+            if reason and self.stop_reason is None:
+                self.stop_reason = reason
+        return self.stop_reason
+
+    def train_end(self, logs):
+        for callback in self.callbacks:
+            callback.on_train_end(logs)
+
+    def restored_params(self):
+        """Веса от первого обработчика, который предлагает их вернуть (или None)."""
+        for callback in self.callbacks:
+            params = callback.restored_params()
+            if params is not None:
+                return params
+        return None
+
+
+NULL_HOOKS = _NullHooks()
+
+
+def make_hooks(callbacks):
+    """
+    Создаёт объект событий для тренера.
+
+    Параметры:
+        callbacks (Callback, list of Callback или None): Обработчики событий.
+
+    Возвращает:
+        Hooks или NULL_HOOKS (если обработчиков нет).
+    """
+    if not callbacks:
+        return NULL_HOOKS
+    if isinstance(callbacks, Callback):
+        callbacks = [callbacks]
+    return Hooks(callbacks)
+
+
+class EpochProfiler(Callback):
+    """
+    Профилировщик эпох обучения.
+
+    Для каждой эпохи записывает общее время, время по фазам (предсказание,
+    подсчёт ошибки, копирование истории, обновление весов), скорость
+    обработки примеров и, если включено, работу с памятью через tracemalloc.
+
+    Пример:
+        profiler = EpochProfiler(trace_memory=True)
+        perceptron_algorithm(features, labels, callbacks=[profiler])
+        profiler.summary()
+        profiler.to_csv('profile.csv')
+    """
+
+    def __init__(self, trace_memory=False, count_allocations=False):
+        """
+        Параметры:
+            trace_memory (bool): Записывать прирост и пик памяти за эпоху (tracemalloc).
+            count_allocations (bool): Записывать количество новых выделений памяти за эпоху
+                (снимки tracemalloc; заметно замедляет обучение).
+        """
+        self.trace_memory = trace_memory or count_allocations
+        self.count_allocations = count_allocations
+        self.records = []
+        self.info = {}
+        self._current = None
+        self._started = 0.0
+        self._started_tracing = False
+        self._memory_start = 0
+        self._snapshot = None
+
+    def on_train_start(self, info):
+        # Начальные веса не сохраняются: в отчёте нужны только гиперпараметры
+        self.info = {key: value for key, value in info.items() if key != 'params'}
+        self.records = []
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def on_epoch_start(self, epoch):
+        self._current = {'epoch': epoch, 'batches': 0}
+        if self.trace_memory:
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+        if self.count_allocations:
+            self._snapshot = tracemalloc.take_snapshot()
+        self._started = time.perf_counter()
+
+    def on_batch(self, epoch, batch_size):
+        self._current['batches'] += 1
+
+    def on_phase_end(self, name, seconds):
+        key = f'{name}_seconds'
+        self._current[key] = self._current.get(key, 0.0) + seconds
+
+    def on_epoch_end(self, epoch, logs):
+        seconds = time.perf_counter() - self._started
+        record = self._current
+        record['seconds'] = seconds
+        record['samples'] = logs.get('samples', 0)
+        record['samples_per_second'] = record['samples'] / seconds if seconds > 0 else 0.0
+        record['error'] = logs.get('error')
+
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            record['memory_delta_bytes'] = current - self._memory_start
+            record['memory_peak_bytes'] = peak - self._memory_start
+        if self.count_allocations:
+            stats = tracemalloc.take_snapshot().compare_to(self._snapshot, 'filename')
+            record['allocations'] = sum(max(stat.count_diff, 0) for stat in stats)
+
+        self.records.append(record)
+
+    def on_train_end(self, logs):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def summary(self):
+        """
+        Итоги по всем эпохам.
+
+        Возвращает:
+            dict: число эпох, общее время, время и доля каждой фазы,
+                  средняя скорость в примерах в секунду.
+        """
+        total = sum(r['seconds'] for r in self.records)
+        phases = sorted({k for r in self.records for k in r if k.endswith('_seconds')})
+        result = {
+            'trainer': self.info.get('trainer'),
+            'epochs': len(self.records),
+            'seconds': total,
+            'samples_per_second': (
+                sum(r['samples'] for r in self.records) / total if total > 0 else 0.0
+            )
+        }
+        for key in phases:
+            phase_total = sum(r.get(key, 0.0) for r in self.records)
+            result[key] = phase_total
+            result[key.replace('_seconds', '_share')] = phase_total / total if total > 0 else 0.0
+        return result
+
+    def _columns(self):
+        columns = []
+        for record in self.records:
+            for key in record:
+                if key not in columns:
+                    columns.append(key)
+        return columns
+
+    def to_csv(self, path):
+        """Сохраняет записи по эпохам в CSV."""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self._columns())
+            writer.writeheader()
+            writer.writerows(self.records)
+
+    def to_json(self, path):
+        """Сохраняет параметры обучения, итоги и записи по эпохам в JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'info': self.info,
+                'summary': self.summary(),
+                'epochs': self.records
+            }, f, ensure_ascii=False, indent=2, default=float)
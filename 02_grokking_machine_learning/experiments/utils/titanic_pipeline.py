@@ -0,0 +1,117 @@
+# chapter13/utils/titanic_pipeline.py
+
+
+import pandas as pd
+from sklearn.model_selection import train_test_split
+
+from .pipeline import Step, Pipeline, FeaturePlan
+
+
+# Столбцы «сырых» данных, которые нужны модели (кроме целевой переменной)
+RAW_COLUMNS = ['Pclass', 'Sex', 'Age', 'SibSp', 'Parch', 'Fare', 'Embarked']
+
+# Границы возрастных интервалов (как в тетрадке 13_end2end_project)
+AGE_BINS = [0, 10, 20, 30, 40, 50, 60, 70, 80]
+
+
+def load_csv(path):
+    """Шаг 1: загрузка сырых данных из CSV файла."""
+    return pd.read_csv(path)
+
+
+def fit_plan(raw):
+    """
+    Шаг 2: «обучение» предобработки на сырых данных.
+
+    Повторяет шаги тетрадки: Cabin не используется, пропуски в Age
+    заполняются медианой, в Embarked — категорией 'U', затем one-hot
+    кодирование пола, порта посадки, класса билета и возрастных интервалов.
+
+    Возвращает:
+        FeaturePlan: Скомпилированный план преобразования строк в признаки.
+    """
+    embarked = raw['Embarked'].fillna('U')
+
+    return FeaturePlan(
+        raw_columns=RAW_COLUMNS,
+        numeric=['SibSp', 'Parch', 'Fare'],
+        one_hot=[
+            ('Sex', sorted(raw['Sex'].dropna().unique())),
+            ('Embarked', sorted(embarked.unique())),
+            ('Pclass', sorted(raw['Pclass'].dropna().unique())),
+        ],
+        binned=[('Age', AGE_BINS, 'Categorized_age')],
+        fill_values={
+            'Age': raw['Age'].median(),
+            'Embarked': 'U',
+            'Fare': raw['Fare'].median(),
+            'SibSp': 0,
+            'Parch': 0
+        }
+    )
+
+
+def transform(raw, plan):
+    """
+    Шаг 3: применение плана ко всем строкам.
+
+    Возвращает:
+        tuple: (features, labels) — матрица признаков и вектор меток.
+    """
+    features = plan.transform(raw[plan.raw_columns].to_numpy(dtype=object))
+    labels = raw['Survived'].to_numpy()
+    return features, labels
+
+
+def split(features, labels, test_size=0.4, random_state=100):
+    """
+    Шаг 4: разделение на обучающую (60%), валидационную (20%) и тестовую (20%) выборки.
+
+    Возвращает:
+        tuple: (features_train, features_validation, features_test,
+                labels_train, labels_validation, labels_test)
+    """
+    features_train, features_vt, labels_train, labels_vt = train_test_split(
+        features, labels, test_size=test_size, random_state=random_state
+    )
+    features_validation, features_test, labels_validation, labels_test = train_test_split(
+        features_vt, labels_vt, test_size=0.5, random_state=random_state
+    )
+    return (features_train, features_validation, features_test,
+            labels_train, labels_validation, labels_test)
+
+
+def titanic_pipeline(cache_dir='.pipeline_cache', use_cache=True, random_state=100):
+    """
+    Собирает конвейер предобработки датасета Titanic.
+
+    Пример:
+        pipeline = titanic_pipeline()
+        data = pipeline.run(path='data/titanic.csv')
+        model.fit(data['features_train'], data['labels_train'])
+
+        # Быстрое применение к новым пассажирам без pandas
+        x = data['plan'].transform([{'Pclass': 3, 'Sex': 'male', 'Age': 22, 'SibSp': 1,
+                                     'Parch': 0, 'Fare': 7.25, 'Embarked': 'S'}])
+
+    Параметры:
+        cache_dir (str): Папка для кеша результатов шагов.
+        use_cache (bool): Использовать ли дисковый кеш.
+        random_state (int): Seed для разделения выборки.
+
+    Возвращает:
+        Pipeline: Конвейер (запуск — pipeline.run(path=...)).
+    """
+    steps = [
+        Step('load', load_csv, inputs=['path'], outputs=['raw']),
+        Step('fit_plan', fit_plan, inputs=['raw'], outputs=['plan']),
+        Step('transform', transform, inputs=['raw', 'plan'], outputs=['features', 'labels']),
+        Step(
+            'split', split,
+            inputs=['features', 'labels'],
+            outputs=['features_train', 'features_validation', 'features_test',
+                     'labels_train', 'labels_validation', 'labels_test'],
+            config={'random_state': random_state}
+        ),
+    ]
+    return Pipeline(steps, cache_dir=cache_dir, use_cache=use_cache)
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def binary_search(arr, item):
     """
     Осуществляет бинарный поиск элемента в отсортированном массиве.
@@ -43,3 +46,242 @@ def binary_search(arr, item):
 
     # Если элемент не найден, возвращаем специальное значение
     return -999
+
+
+def _merge_positions(arr, items):
+    """
+    Позиции вставки (как np.searchsorted с side='left') для отсортированных
+    запросов слиянием двух отсортированных массивов за O(n + q).
+
+    items должны быть того же типа, что arr: иначе np.concatenate привёл бы
+    их к общему типу (например, большие int64 — к неточным float64).
+
+    Запросы ставятся перед элементами массива, поэтому при устойчивой
+    сортировке (timsort находит два готовых отрезка и только сливает их)
+    каждый запрос оказывается перед равными ему элементами arr. Ранг j-го
+    запроса в слитом массиве минус j — количество элементов arr меньше него.
+    """
+    merged = np.concatenate([items, arr])
+    order = np.argsort(merged, kind='stable')
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(len(order))
+    return ranks[:len(items)] - np.arange(len(items))
+
+
+def binary_search_many(arr, items, method='auto'):
+    """
+    Осуществляет бинарный поиск сразу для массива искомых элементов.
+
+    Все запросы обрабатываются одним векторизованным вызовом вместо цикла
+    из binary_search на каждый элемент.
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный массив элементов, в котором выполняется поиск.
+        items (list или numpy.ndarray): Элементы, которые необходимо найти в массиве.
+        method (str): Способ поиска:
+            'searchsorted' — бинарный поиск для каждого запроса, O(q log n);
+            'merge' — слияние с массивом, O(n + q), только для отсортированных items
+                      (если items нельзя без потерь привести к типу arr — searchsorted);
+            'auto' — 'searchsorted'. Замеры (n = 1e3…1e6, q = 1e6…1e7, отсортированные
+                     запросы) не показали устойчивого выигрыша слияния: на отсортированных
+                     запросах searchsorted и так почти линеен, так как соседние запросы
+                     попадают в те же строки кэша.
+
+    Возвращает:
+        numpy.ndarray: Индексы найденных элементов (по одному на запрос)
+        или -999 для элементов, которых нет в массиве.
+
+    Примечание:
+        Массив должен быть отсортирован по возрастанию. Если элемент встречается
+        в массиве несколько раз, возвращается индекс его первого вхождения
+        (binary_search может вернуть любое из них).
+    """
+
+    if method not in {'auto', 'searchsorted', 'merge'}:
+        raise ValueError("method должен быть 'auto', 'searchsorted' или 'merge'")
+
+    arr = np.asarray(arr)
+    items = np.asarray(items)
+    if items.ndim != 1:
+        items = items.ravel()
+
+    if len(arr) == 0:
+        return np.full(len(items), -999, dtype=np.int64)
+
+    if method == 'merge' and len(items) > 1 and not np.all(items[1:] >= items[:-1]):
+        raise ValueError("Для method='merge' элементы items должны быть отсортированы")
+
+    # Слияние — только если items приводятся к типу arr без потерь;
+    # иначе (например, float-запросы в массиве int) — searchsorted
+    if method == 'merge' and np.can_cast(items.dtype, arr.dtype, 'safe'):
+        positions = _merge_positions(arr, items.astype(arr.dtype, copy=False))
+    else:
+        positions = np.searchsorted(arr, items, side='left')
+
+    # Позиция вставки указывает на найденный элемент, только если там стоит ровно он
+    found = positions < len(arr)
+    found[found] = arr[positions[found]] == items[found]
+    return np.where(found, positions, -999)
+
+
+def lower_bound(arr, item, low=0, high=None):
+    """
+    Находит первую позицию, в которую можно вставить item, не нарушив порядок.
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный массив элементов.
+        item: Искомый элемент.
+        low (int): Начало интервала поиска.
+        high (int, optional): Конец интервала поиска (не включается), по умолчанию len(arr).
+
+    Возвращает:
+        int: Индекс первого элемента, не меньшего item (len(arr), если такого нет).
+
+    Примечание:
+        Время O(log n). Для массивов NumPy поиск выполняется np.searchsorted.
+    """
+
+    if high is None:
+        high = len(arr)
+
+    if isinstance(arr, np.ndarray):
+        return low + int(np.searchsorted(arr[low:high], item, side='left'))
+
+    # Инвариант: все элементы левее low меньше item, все элементы с high и правее — не меньше
+    while low < high:
+        mid = (low + high) // 2
+        if arr[mid] < item:
+            low = mid + 1  # Средний элемент меньше искомого — ответ правее
+        else:
+            high = mid  # Средний элемент не меньше искомого — он может быть ответом
+    return low
+
+
+def upper_bound(arr, item, low=0, high=None):
+    """
+    Находит последнюю позицию, в которую можно вставить item, не нарушив порядок.
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный массив элементов.
+        item: Искомый элемент.
+        low (int): Начало интервала поиска.
+        high (int, optional): Конец интервала поиска (не включается), по умолчанию len(arr).
+
+    Возвращает:
+        int: Индекс первого элемента, большего item (len(arr), если такого нет).
+
+    Примечание:
+        Время O(log n). Для массивов NumPy поиск выполняется np.searchsorted.
+    """
+
+    if high is None:
+        high = len(arr)
+
+    if isinstance(arr, np.ndarray):
+        return low + int(np.searchsorted(arr[low:high], item, side='right'))
+
+    # Инвариант: все элементы левее low не больше item, все элементы с high и правее — больше
+    while low < high:
+        mid = (low + high) // 2
+        if arr[mid] <= item:
+            low = mid + 1  # Средний элемент не больше искомого — ответ правее
+        else:
+            high = mid  # Средний элемент больше искомого — он может быть ответом
+    return low
+
+
+def equal_range(arr, item):
+    """
+    Находит все вхождения элемента в отсортированный массив.
+
+    Возвращает:
+        tuple: (start, stop) — элементы arr[start:stop] равны item
+        (start == stop, если элемента нет; тогда это позиция для вставки).
+    """
+    start = lower_bound(arr, item)
+    # Все вхождения item лежат не левее start, поэтому второй поиск начинается оттуда
+    return start, upper_bound(arr, item, low=start)
+
+
+_INCLUSIVE = {'both', 'left', 'right', 'neither'}
+
+
+def count_in_range(arr, low, high, inclusive='both'):
+    """
+    Считает элементы отсортированного массива, попадающие в интервал [low, high].
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный массив элементов.
+        low: Нижняя граница интервала.
+        high: Верхняя граница интервала.
+        inclusive (str): Какие границы включаются (как в pandas.Series.between):
+            'both', 'left', 'right' или 'neither'.
+
+    Возвращает:
+        int: Количество элементов в интервале (0, если low > high).
+
+    Примечание:
+        Время O(log n): два бинарных поиска границ, без просмотра элементов.
+    """
+
+    if inclusive not in _INCLUSIVE:
+        raise ValueError("inclusive должен быть 'both', 'left', 'right' или 'neither'")
+
+    start = (lower_bound if inclusive in {'both', 'left'} else upper_bound)(arr, low)
+    stop = (upper_bound if inclusive in {'both', 'right'} else lower_bound)(arr, high)
+    return max(0, stop - start)
+
+
+def lower_bound_many(arr, items):
+    """
+    lower_bound сразу для массива элементов.
+
+    Возвращает:
+        numpy.ndarray: Для каждого элемента индекс первого элемента arr, не меньшего него.
+    """
+    return np.searchsorted(np.asarray(arr), np.asarray(items), side='left')
+
+
+def upper_bound_many(arr, items):
+    """
+    upper_bound сразу для массива элементов.
+
+    Возвращает:
+        numpy.ndarray: Для каждого элемента индекс первого элемента arr, большего него.
+    """
+    return np.searchsorted(np.asarray(arr), np.asarray(items), side='right')
+
+
+def equal_range_many(arr, items):
+    """
+    equal_range сразу для массива элементов.
+
+    Возвращает:
+        tuple of numpy.ndarray: (starts, stops) — вхождения items[i] занимают arr[starts[i]:stops[i]].
+    """
+    arr = np.asarray(arr)
+    items = np.asarray(items)
+    return np.searchsorted(arr, items, side='left'), np.searchsorted(arr, items, side='right')
+
+
+def count_in_range_many(arr, lows, highs, inclusive='both'):
+    """
+    count_in_range сразу для массивов границ (например, для окон по времени).
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный массив элементов.
+        lows (array-like): Нижние границы интервалов.
+        highs (array-like): Верхние границы интервалов (той же длины или число).
+        inclusive (str): 'both', 'left', 'right' или 'neither'.
+
+    Возвращает:
+        numpy.ndarray: Количество элементов в каждом интервале.
+    """
+
+    if inclusive not in _INCLUSIVE:
+        raise ValueError("inclusive должен быть 'both', 'left', 'right' или 'neither'")
+
+    arr = np.asarray(arr)
+    starts = np.searchsorted(arr, lows, side='left' if inclusive in {'both', 'left'} else 'right')
+    stops = np.searchsorted(arr, highs, side='right' if inclusive in {'both', 'right'} else 'left')
+    return np.maximum(0, stops - starts)
@@ -0,0 +1,190 @@
+import os
+import heapq
+import time
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .sorting import radix_argsort, _radix_keys
+
+
+DEFAULT_MEMORY_LIMIT = 256 << 20  # 256 МБ
+
+
+def _record_keys(records, key):
+    """Ключи сортировки: поле key структурированных записей или сами числа."""
+    return records if key is None else records[key]
+
+
+def _check_dtype(dtype, key):
+    dtype = np.dtype(dtype)
+    if key is None and dtype.names is not None:
+        raise ValueError("Для записей со многими полями нужно указать key — поле сортировки")
+    if key is not None and (dtype.names is None or key not in dtype.names):
+        raise ValueError(f"В записях нет поля {key!r}")
+    key_kind = (dtype if key is None else dtype[key]).kind
+    if key_kind not in 'biuf':
+        raise TypeError("Ключ сортировки должен быть целым числом или числом с плавающей точкой")
+    return dtype
+
+
+def _sort_chunk(records, key):
+    """Устойчивая сортировка блока записей поразрядной сортировкой по ключу."""
+    return records[radix_argsort(_record_keys(records, key))]
+
+
+def _write_run(task):
+    """
+    Сортирует один блок входного файла и сохраняет его как серию.
+
+    Выполняется в отдельном процессе, поэтому получает только путь и
+    границы блока — данные читаются из файла в самом процессе, а не
+    передаются через pickle.
+    """
+    input_path, dtype, key, start, count, run_path = task
+    records = np.fromfile(input_path, dtype=dtype, count=count, offset=start * dtype.itemsize)
+    _sort_chunk(records, key).tofile(run_path)
+    return run_path, len(records)
+
+
+class _RunReader:
+    """Чтение отсортированной серии блоками по block_size записей."""
+
+    def __init__(self, path, dtype, key, block_size):
+        self.file = open(path, 'rb')
+        self.dtype = dtype
+        self.key = key
+        self.block_size = block_size
+        self.buffer = None
+        self.refill()
+
+    def refill(self):
+        """Читает следующий блок; возвращает False, если серия закончилась."""
+        self.buffer = np.fromfile(self.file, dtype=self.dtype, count=self.block_size)
+        if len(self.buffer) == 0:
+            self.file.close()
+            return False
+        return True
+
+    @property
+    def last_key(self):
+        # Ключ в беззнаковом виде поразрядной сортировки: тот же порядок,
+        # и NaN сравнимы (иначе куча с NaN сломалась бы)
+        return int(_radix_keys(_record_keys(self.buffer[-1:], self.key))[0])
+
+
+def _merge_runs(run_paths, output_path, dtype, key, memory_limit):
+    """
+    k-путевое слияние отсортированных серий в выходной файл.
+
+    В куче лежат последние ключи текущих блоков серий. Блок серии first
+    с наименьшим последним ключом bound выводится целиком вместе со всеми
+    записями остальных блоков, которые должны идти раньше: с ключом меньше
+    bound, а для серий левее first — и равным bound (так равные ключи идут
+    в исходном порядке, и сортировка остаётся устойчивой). Собранные записи
+    упорядочиваются одной устойчивой сортировкой NumPy, а не по одной через
+    кучу; затем серия first дочитывает следующий блок.
+    """
+    # Половина памяти — на блоки серий, половина — на собираемый выходной блок
+    block_size = max(1, memory_limit // (2 * len(run_paths) * dtype.itemsize))
+    readers = [_RunReader(path, dtype, key, block_size) for path in run_paths]
+    heap = [(reader.last_key, i) for i, reader in enumerate(readers) if len(reader.buffer)]
+    heapq.heapify(heap)
+
+    with open(output_path, 'wb') as output:
+        while heap:
+            # При равных ключах в вершине кучи — серия с меньшим номером
+            _, first = heapq.heappop(heap)
+            bound = _record_keys(readers[first].buffer, key)[-1]
+
+            # Префиксы блоков в порядке серий: устойчивая сортировка сохраняет этот порядок
+            parts = []
+            for j, reader in enumerate(readers):
+                side = 'right' if j <= first else 'left'
+                stop = int(np.searchsorted(_record_keys(reader.buffer, key), bound, side=side))
+                if stop:
+                    parts.append(reader.buffer[:stop])
+                    reader.buffer = reader.buffer[stop:]
+            _sort_chunk(np.concatenate(parts), key).tofile(output)
+
+            if readers[first].refill():
+                heapq.heappush(heap, (readers[first].last_key, first))
+
+
+def external_sort(input_path, output_path, dtype='<i8', key=None, memory_limit=DEFAULT_MEMORY_LIMIT,
+                  workers=1, tmp_dir=None):
+    """
+    Внешняя сортировка файла, который не помещается в память.
+
+    Файл — это подряд записанные записи фиксированного размера (как у
+    numpy.ndarray.tofile): числа или структурированные записи NumPy,
+    сортируемые по полю key.
+
+    Этапы:
+        1. Файл читается блоками, каждый блок сортируется в памяти поразрядной
+           сортировкой (radix_argsort) и сохраняется во временный файл-серию
+           в том же двоичном формате. При workers > 1 серии создаются
+           параллельно в пуле процессов.
+        2. Серии сливаются k-путевым слиянием с кучей в выходной файл.
+
+    Сортировка устойчива: записи с равными ключами идут в исходном порядке.
+
+    Параметры:
+        input_path (str): Путь к входному файлу.
+        output_path (str): Путь к выходному файлу.
+        dtype: Тип записи NumPy (например, '<i8' или [('time', '<i8'), ('price', '<f8')]).
+        key (str, optional): Поле сортировки для структурированных записей.
+        memory_limit (int): Бюджет памяти в байтах на все процессы сразу.
+        workers (int): Количество процессов для создания серий.
+        tmp_dir (str, optional): Папка для временных файлов (по умолчанию системная).
+
+    Возвращает:
+        dict: Словарь со статистикой:
+            - records: Количество записей
+            - runs: Количество серий
+            - run_records: Записей в серии
+            - run_seconds: Время создания серий
+            - merge_seconds: Время слияния
+    """
+
+    dtype = _check_dtype(dtype, key)
+    size = os.path.getsize(input_path)
+    if size % dtype.itemsize:
+        raise ValueError("Размер файла не кратен размеру записи")
+    n_records = size // dtype.itemsize
+
+    # Каждому процессу — своя доля бюджета; сортировка блока требует
+    # примерно втрое больше памяти, чем сам блок (блок, индексы, результат)
+    run_records = max(1, memory_limit // (workers * 3 * max(dtype.itemsize, 8)))
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as tmp:
+        tasks = [
+            (input_path, dtype, key, start, min(run_records, n_records - start),
+             os.path.join(tmp, f'run_{i:06d}.bin'))
+            for i, start in enumerate(range(0, n_records, run_records))
+        ]
+
+        started = time.perf_counter()
+        if len(tasks) <= 1:
+            # Всё помещается в память: одна серия сразу в выходной файл
+            if tasks:
+                _write_run(tasks[0][:-1] + (output_path,))
+            else:
+                open(output_path, 'wb').close()
+            return {'records': n_records, 'runs': len(tasks), 'run_records': run_records,
+                    'run_seconds': time.perf_counter() - started, 'merge_seconds': 0.0}
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                run_paths = [path for path, _ in pool.map(_write_run, tasks)]
+        else:
+            run_paths = [_write_run(task)[0] for task in tasks]
+        run_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        _merge_runs(run_paths, output_path, dtype, key, memory_limit)
+        merge_seconds = time.perf_counter() - started
+
+    return {'records': n_records, 'runs': len(tasks), 'run_records': run_records,
+            'run_seconds': run_seconds, 'merge_seconds': merge_seconds}
@@ -0,0 +1,290 @@
+import numpy as np
+
+
+def _bisect(arr, item, low, high):
+    """
+    Бинарный поиск первой позиции в arr[low:high], не меньшей item.
+
+    Возвращает:
+        tuple: (позиция, количество проб — обращений к элементам массива)
+    """
+    probes = 0
+    while low < high:
+        mid = (low + high) // 2
+        probes += 1
+        if arr[mid] < item:
+            low = mid + 1
+        else:
+            high = mid
+    return low, probes
+
+
+def _interpolation_search(arr, item, max_probes=None):
+    """
+    Интерполяционный поиск с переходом на бинарный.
+
+    Возвращает:
+        tuple: (индекс или -999, количество проб, был ли переход на бинарный поиск)
+    """
+    low = 0
+    high = len(arr) - 1
+    if max_probes is None:
+        # 2·log2(log2(n)): на равномерных данных интерполяции хватает с запасом
+        max_probes = 2 * max(1, len(arr).bit_length()).bit_length()
+    probes = 0
+
+    # Пока искомый элемент может лежать в интервале [low, high]
+    while low <= high and arr[low] <= item <= arr[high]:
+
+        # Интерполяция не сошлась за отведённые пробы (данные распределены
+        # неравномерно) — оставшийся интервал ищется бинарным поиском
+        if probes >= max_probes:
+            position, extra = _bisect(arr, item, low, high + 1)
+            found = position <= high and arr[position] == item
+            return (position if found else -999), probes + extra, True
+
+        # Позиция, на которой стоял бы item, если бы значения росли линейно
+        # (сначала деление — так произведение не переполнит int64)
+        span = arr[high] - arr[low]
+        mid = low if span == 0 else low + int((high - low) * ((item - arr[low]) / span))
+        probes += 1
+
+        guess = arr[mid]
+        if guess == item:
+            return mid, probes, False
+        elif guess < item:
+            low = mid + 1
+        else:
+            high = mid - 1
+
+    return -999, probes, False
+
+
+def interpolation_search(arr, item, max_probes=None):
+    """
+    Осуществляет интерполяционный поиск элемента в отсортированном массиве.
+
+    Вместо середины интервала проверяется позиция, на которой элемент стоял бы
+    при равномерном распределении значений. На равномерных данных (метки
+    времени, идентификаторы) поиск делает O(log log n) проб вместо O(log n).
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный массив чисел.
+        item: Элемент, который необходимо найти в массиве.
+        max_probes (int, optional): После стольких проб интерполяции оставшийся
+            интервал ищется бинарным поиском (по умолчанию 2·log2(log2(n))),
+            поэтому на неравномерных данных поиск остаётся O(log n).
+
+    Возвращает:
+        int: Индекс найденного элемента в массиве или -999, если элемент не найден.
+    """
+    return _interpolation_search(arr, item, max_probes)[0]
+
+
+def build_learned_index(arr, segment_size=1024, max_error=64):
+    """
+    Строит обученный индекс: кусочно-линейную модель позиции элемента по его значению.
+
+    Массив делится на сегменты по segment_size элементов; в каждом сегменте
+    позиция приближается прямой через первый и последний элементы сегмента,
+    и запоминается наибольшая ошибка модели. Поиск вычисляет предсказанную
+    позицию и ищет только в окне ± ошибка вокруг неё.
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный по возрастанию массив чисел.
+        segment_size (int): Количество элементов в сегменте.
+        max_error (int): Наибольшая допустимая ошибка модели сегмента. В сегментах
+            с большей ошибкой (неравномерные данные) используется бинарный поиск
+            по всему сегменту.
+
+    Возвращает:
+        dict: Индекс:
+            - keys: Сам массив (numpy.ndarray)
+            - starts: Позиции начала сегментов
+            - first_keys: Первые значения сегментов
+            - slopes: Наклоны моделей сегментов (позиций на единицу значения)
+            - errors: Наибольшие ошибки моделей сегментов (в позициях)
+            - fallback: Сегменты, где ошибка больше max_error
+            - segment_size, max_error
+    """
+
+    keys = np.asarray(arr)
+    n = len(keys)
+    starts = np.arange(0, n, segment_size)
+    stops = np.minimum(starts + segment_size, n)
+    first_keys = keys[starts] if n else keys[:0]
+    last_keys = keys[stops - 1] if n else keys[:0]
+
+    # Прямая через (первое значение, начало) и (последнее значение, конец сегмента)
+    span = (last_keys - first_keys).astype(float)
+    slopes = np.divide(stops - 1 - starts, span, out=np.zeros(len(starts)), where=span > 0)
+
+    # Ошибка модели на каждом элементе и наибольшая ошибка по сегментам
+    segment = np.repeat(np.arange(len(starts)), stops - starts)
+    predicted = starts[segment] + (keys - first_keys[segment]) * slopes[segment]
+    deviation = np.abs(predicted - np.arange(n))
+    errors = np.maximum.reduceat(deviation, starts) if n else np.zeros(0)
+    errors = np.ceil(errors).astype(np.int64)
+
+    return {
+        'keys': keys,
+        'starts': starts,
+        'first_keys': first_keys,
+        'slopes': slopes,
+        'errors': errors,
+        'fallback': errors > max_error,
+        'segment_size': segment_size,
+        'max_error': max_error
+    }
+
+
+def _learned_window(index, segment, item):
+    """Окно [low, high] поиска первой позиции >= item в сегменте по предсказанию модели."""
+    start = int(index['starts'][segment])
+    stop = min(start + index['segment_size'], len(index['keys']))
+
+    # Ошибка больше допустимой — ищем по всему сегменту
+    if index['fallback'][segment]:
+        return start, stop
+
+    error = int(index['errors'][segment])
+    predicted = start + (item - index['first_keys'][segment]) * index['slopes'][segment]
+    predicted = min(max(predicted, start), stop)
+    # Модель монотонна, поэтому для значения между элементами массива ответ
+    # отстоит от предсказания не больше чем на ошибку плюс одну позицию
+    low = min(max(start, int(np.floor(predicted)) - error - 1), stop)
+    high = max(min(stop, int(np.ceil(predicted)) + error + 1), low)
+    return low, high
+
+
+def _learned_lower_bound(index, item):
+    """
+    Первая позиция, не меньшая item, по обученному индексу.
+
+    Возвращает:
+        tuple: (позиция, количество проб, был ли переход на бинарный поиск)
+    """
+    keys = index['keys']
+    n = len(keys)
+    if n == 0:
+        return 0, 0, False
+
+    # Сегмент — последний, первое значение которого меньше item (так повторяющиеся
+    # значения на границе сегментов находятся с первого вхождения)
+    segment = max(0, int(np.searchsorted(index['first_keys'], item, side='left')) - 1)
+    low, high = _learned_window(index, segment, item)
+    position, probes = _bisect(keys, item, low, high)
+    fell_back = bool(index['fallback'][segment])
+
+    # Проверка окна: слева от ответа значения меньше item, на ответе — не меньше.
+    # Если модель ошиблась сильнее оценки — бинарный поиск по всему массиву
+    if (low > 0 and keys[low - 1] >= item) or (high < n and keys[high] < item):
+        position, extra = _bisect(keys, item, 0, n)
+        probes += extra
+        fell_back = True
+    return position, probes, fell_back
+
+
+def learned_search(index, item):
+    """
+    Осуществляет поиск элемента по обученному индексу из build_learned_index.
+
+    Возвращает:
+        int: Индекс первого вхождения элемента или -999, если элемент не найден.
+    """
+    keys = index['keys']
+    position = _learned_lower_bound(index, item)[0]
+    return position if position < len(keys) and keys[position] == item else -999
+
+
+def learned_search_many(index, items):
+    """
+    Поиск массива элементов по обученному индексу одним векторизованным проходом.
+
+    Возвращает:
+        numpy.ndarray: Индексы первых вхождений или -999 для отсутствующих элементов.
+    """
+    keys = index['keys']
+    n = len(keys)
+    items = np.asarray(items).ravel()
+    if n == 0:
+        return np.full(len(items), -999, dtype=np.int64)
+
+    segments = np.maximum(0, np.searchsorted(index['first_keys'], items, side='left') - 1)
+    starts = index['starts'][segments]
+    stops = np.minimum(starts + index['segment_size'], n)
+    errors = index['errors'][segments]
+    predicted = starts + (items - index['first_keys'][segments]) * index['slopes'][segments]
+    predicted = np.clip(predicted, starts, stops)
+
+    low = np.minimum(np.maximum(starts, np.floor(predicted).astype(np.int64) - errors - 1), stops)
+    high = np.maximum(np.minimum(stops, np.ceil(predicted).astype(np.int64) + errors + 1), low)
+    fallback = index['fallback'][segments]
+    low = np.where(fallback, starts, low)
+    high = np.where(fallback, stops, high)
+
+    # Бинарный поиск сразу во всех окнах: число шагов — по самому широкому окну
+    window_low, window_high = low.copy(), high.copy()
+    for _ in range(int((high - low).max()).bit_length()):
+        active = low < high
+        mid = (low + high) // 2
+        less = keys[np.minimum(mid, n - 1)] < items
+        low = np.where(active & less, mid + 1, low)
+        high = np.where(active & ~less, mid, high)
+
+    # Запросы, для которых модель ошиблась сильнее оценки, ищутся по всему массиву
+    wrong = ((window_low > 0) & (keys[np.maximum(window_low - 1, 0)] >= items)) | (
+        (window_high < n) & (keys[np.minimum(window_high, n - 1)] < items)
+    )
+    if wrong.any():
+        low[wrong] = np.searchsorted(keys, items[wrong], side='left')
+
+    found = low < n
+    found[found] = keys[low[found]] == items[found]
+    return np.where(found, low, -999)
+
+
+def probe_statistics(arr, items, index=None):
+    """
+    Сравнивает количество проб (обращений к элементам массива) при поиске
+    бинарным, интерполяционным поиском и по обученному индексу.
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный массив чисел.
+        items (iterable): Искомые элементы.
+        index (dict, optional): Обученный индекс (по умолчанию строится build_learned_index).
+
+    Возвращает:
+        dict: Для каждого способа поиска словарь:
+            - mean_probes: Среднее количество проб на запрос
+            - max_probes: Наибольшее количество проб
+            - fallback_rate: Доля запросов, перешедших на бинарный поиск
+    """
+
+    keys = np.asarray(arr)
+    if index is None:
+        index = build_learned_index(keys)
+    # Поэлементный доступ к списку Python быстрее, чем к массиву NumPy
+    table = keys.tolist()
+
+    counts = {'binary_search': [], 'interpolation_search': [], 'learned_search': []}
+    fallbacks = {name: 0 for name in counts}
+    for item in np.asarray(items).tolist():
+        counts['binary_search'].append(_bisect(table, item, 0, len(table))[1])
+
+        _, probes, fell_back = _interpolation_search(table, item)
+        counts['interpolation_search'].append(probes)
+        fallbacks['interpolation_search'] += fell_back
+
+        _, probes, fell_back = _learned_lower_bound(index, item)
+        counts['learned_search'].append(probes)
+        fallbacks['learned_search'] += fell_back
+
+    return {
+        name: {
+            'mean_probes': float(np.mean(values)) if values else 0.0,
+            'max_probes': int(max(values, default=0)),
+            'fallback_rate': fallbacks[name] / len(values) if values else 0.0
+        }
+        for name, values in counts.items()
+    }
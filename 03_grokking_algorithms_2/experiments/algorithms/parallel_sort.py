@@ -0,0 +1,149 @@
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+
+PARALLEL_MIN = 1 << 20  # Меньшие массивы сортируются в одном процессе: запуск процессов дороже сортировки
+
+
+def _attach(name):
+    """
+    Подключается к разделяемой памяти, созданной главным процессом.
+
+    Памятью владеет главный процесс, он же её и удаляет. Воркеры пула
+    используют общий с ним resource_tracker, поэтому подключение до
+    Python 3.13 безопасно; в 3.13+ учёт в воркере просто отключается.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def _sort_chunk(task):
+    """
+    Этап 1 (в воркере): сортирует свой кусок входного массива на месте
+    и считает, сколько его элементов попадает в каждую корзину между разделителями.
+    """
+    name, dtype, n, start, stop, splitters, kind = task
+    shm = _attach(name)
+    try:
+        chunk = np.ndarray(n, dtype=dtype, buffer=shm.buf)[start:stop]
+        chunk.sort(kind=kind)
+        # Границы корзин внутри отсортированного куска
+        bounds = np.searchsorted(chunk, splitters, side='right')
+        del chunk
+    finally:
+        shm.close()
+    return np.diff(bounds, prepend=0, append=stop - start)
+
+
+def _merge_bucket(task):
+    """
+    Этап 2 (в воркере): собирает свою корзину из всех отсортированных кусков
+    и записывает её, отсортированную, в выходной массив по своему смещению.
+    """
+    source_name, target_name, dtype, n, pieces, offset, kind = task
+    source_shm, target_shm = _attach(source_name), _attach(target_name)
+    try:
+        source = np.ndarray(n, dtype=dtype, buffer=source_shm.buf)
+        target = np.ndarray(n, dtype=dtype, buffer=target_shm.buf)
+        bucket = np.concatenate([source[start:stop] for start, stop in pieces])
+        # Корзина состоит из нескольких отсортированных отрезков: устойчивая
+        # сортировка (timsort) находит их и только сливает
+        bucket.sort(kind='stable')
+        target[offset:offset + len(bucket)] = bucket
+        del source, target, bucket
+    finally:
+        source_shm.close()
+        target_shm.close()
+    return len(pieces)
+
+
+def _choose_splitters(arr, parts, oversampling, rng):
+    """parts - 1 разделителей по случайной выборке из parts * oversampling элементов."""
+    sample = np.sort(arr[rng.integers(0, len(arr), parts * oversampling)])
+    return sample[oversampling::oversampling][:parts - 1]
+
+
+def parallel_sort(arr, workers=None, oversampling=64, kind='quicksort', seed=0, pool=None):
+    """
+    Параллельная сортировка выборкой (sample sort) большого массива NumPy.
+
+    Этапы:
+        1. Массив копируется в разделяемую память и делится на куски по числу
+           процессов; по случайной выборке выбираются workers - 1 разделителей.
+        2. Каждый процесс сортирует свой кусок на месте и считает, сколько его
+           элементов попадает в каждую корзину между разделителями.
+        3. Каждый процесс собирает свою корзину из всех кусков, сливает
+           отсортированные отрезки и пишет результат в выходную разделяемую
+           память по смещению, вычисленному из размеров корзин.
+
+    Данные между процессами не копируются через pickle: воркеры получают
+    только имена блоков разделяемой памяти и границы.
+
+    Параметры:
+        arr (numpy.ndarray): Одномерный массив чисел.
+        workers (int, optional): Количество процессов (по умолчанию — число ядер).
+        oversampling (int): Элементов выборки на один разделитель: чем больше,
+            тем ровнее размеры корзин.
+        kind (str): Алгоритм сортировки кусков (как в numpy.sort).
+        seed (int): Seed выбора разделителей.
+        pool (ProcessPoolExecutor, optional): Готовый пул процессов (не меньше
+            workers) — чтобы не запускать процессы при каждом вызове.
+
+    Возвращает:
+        numpy.ndarray: Новый отсортированный массив.
+    """
+
+    arr = np.asarray(arr)
+    if arr.ndim != 1:
+        raise ValueError("Массив должен быть одномерным")
+    if arr.dtype.kind not in 'biuf':
+        raise TypeError("Параллельная сортировка поддерживает только числовые массивы")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    n = len(arr)
+    if workers <= 1 or n < max(PARALLEL_MIN, workers * oversampling):
+        return np.sort(arr, kind=kind)
+
+    source_shm = SharedMemory(create=True, size=arr.nbytes)
+    target_shm = SharedMemory(create=True, size=arr.nbytes)
+    own_pool = pool is None
+    if own_pool:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        source = np.ndarray(n, dtype=arr.dtype, buffer=source_shm.buf)
+        source[:] = arr
+
+        splitters = _choose_splitters(arr, workers, oversampling, np.random.default_rng(seed))
+        starts = np.linspace(0, n, workers + 1).astype(np.int64)
+        counts = np.array(list(pool.map(_sort_chunk, [
+            (source_shm.name, arr.dtype, n, int(starts[i]), int(starts[i + 1]), splitters, kind)
+            for i in range(workers)
+        ])))  # counts[i, j] — элементов куска i в корзине j
+
+        # Отрезки корзины j в кусках и её смещение в выходном массиве
+        piece_starts = starts[:-1, None] + np.cumsum(counts, axis=1) - counts
+        offsets = np.concatenate([[0], np.cumsum(counts.sum(axis=0))[:-1]])
+        tasks = []
+        for j in range(workers):
+            pieces = [(int(piece_starts[i, j]), int(piece_starts[i, j] + counts[i, j]))
+                      for i in range(workers) if counts[i, j]]
+            if pieces:
+                tasks.append((source_shm.name, target_shm.name, arr.dtype, n, pieces, int(offsets[j]), kind))
+        list(pool.map(_merge_bucket, tasks))
+
+        target = np.ndarray(n, dtype=arr.dtype, buffer=target_shm.buf)
+        result = target.copy()
+        del source, target
+        return result
+    finally:
+        if own_pool:
+            pool.shutdown()
+        for shm in (source_shm, target_shm):
+            shm.close()
+            shm.unlink()
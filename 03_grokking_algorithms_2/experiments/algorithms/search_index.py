@@ -0,0 +1,189 @@
+import numpy as np
+
+
+CACHE_LINE_BYTES = 64  # Размер строки кэша у x86-64 и большинства ARM
+
+
+def _eytzinger_order(n, chunk_size=1 << 22):
+    """
+    Порядок Эйцингера для n элементов.
+
+    Узел k (нумерация с 1) хранит детей в позициях 2k и 2k + 1, то есть дерево
+    лежит в массиве по уровням (как двоичная куча). Отсортированный массив
+    раскладывается обходом дерева в симметричном порядке: i-й по порядку узел
+    получает i-й по величине элемент.
+
+    Для полного дерева из 2^h - 1 узлов i-й (с 1) узел симметричного обхода —
+    это (2^h + i) >> (t + 1), где t — число младших нулевых битов i. Дерево
+    Эйцингера из n узлов — это такое полное дерево без узлов с номерами больше n.
+    Позиции обрабатываются блоками по chunk_size, чтобы не держать в памяти
+    несколько временных массивов размером с полное дерево.
+
+    Возвращает:
+        numpy.ndarray: Номера узлов (с 1) в порядке симметричного обхода, длина n.
+    """
+    if n == 0:
+        return np.empty(0, dtype=np.int64)
+
+    height = int(n).bit_length()
+    order = np.empty(n, dtype=np.int64)
+    filled = 0
+    for start in range(1, 1 << height, chunk_size):
+        positions = np.arange(start, min(start + chunk_size, 1 << height), dtype=np.int64)
+        trailing_zeros = np.log2(positions & -positions).astype(np.int64)
+        nodes = ((1 << height) + positions) >> (trailing_zeros + 1)
+        nodes = nodes[nodes <= n]
+        order[filled:filled + len(nodes)] = nodes
+        filled += len(nodes)
+    return order
+
+
+def _btree_node_size(dtype, node_bytes):
+    """Количество ключей в узле B+-дерева, помещающемся в node_bytes байт."""
+    return max(2, node_bytes // np.dtype(dtype).itemsize)
+
+
+def _max_value(dtype):
+    """Наибольшее значение типа — им дополняются неполные узлы B+-дерева."""
+    dtype = np.dtype(dtype)
+    if np.issubdtype(dtype, np.floating):
+        return np.inf
+    return np.iinfo(dtype).max
+
+
+def build_index(arr, layout='eytzinger', node_bytes=CACHE_LINE_BYTES):
+    """
+    Строит индекс для быстрого поиска по отсортированному массиву.
+
+    Бинарный поиск по обычному массиву на каждом шаге прыгает в далёкую
+    область памяти, и почти каждая проба — промах кэша. Индекс хранит те же
+    элементы в порядке, удобном для кэша:
+
+        'eytzinger' — дерево поиска по уровням (как двоичная куча): первые
+                      уровни, через которые проходит каждый поиск, лежат
+                      в нескольких соседних строках кэша, а следующая проба
+                      вычисляется без ветвлений: k = 2k + (keys[k] < item);
+        'btree'     — статическое B+-дерево: каждый узел — это node_bytes байт
+                      (одна строка кэша) ключей, за одно чтение узла поиск
+                      сужается в B раз, а не в 2, поэтому глубина
+                      log_B(n) вместо log_2(n).
+
+    Параметры:
+        arr (list или numpy.ndarray): Отсортированный по возрастанию массив чисел.
+        layout (str): Раскладка 'eytzinger' или 'btree'.
+        node_bytes (int): Размер узла B+-дерева в байтах.
+
+    Возвращает:
+        dict: Индекс:
+            - layout: Раскладка
+            - size: Количество элементов
+            - keys: Ключи в порядке Эйцингера (позиция 0 не используется) — для 'eytzinger'
+            - ranks: Индекс в исходном массиве для каждой позиции keys — для 'eytzinger'
+            - levels: Уровни B+-дерева от листьев к корню, массивы (узлы, B) — для 'btree'
+            - node_size: Количество ключей в узле — для 'btree'
+    """
+
+    if layout not in {'eytzinger', 'btree'}:
+        raise ValueError("layout должен быть 'eytzinger' или 'btree'")
+
+    arr = np.asarray(arr)
+    if arr.ndim != 1:
+        raise ValueError("Массив должен быть одномерным")
+    n = len(arr)
+
+    if layout == 'eytzinger':
+        order = _eytzinger_order(n)
+        keys = np.zeros(n + 1, dtype=arr.dtype)
+        ranks = np.full(n + 1, -999, dtype=np.int64)
+        keys[order] = arr
+        ranks[order] = np.arange(n)
+        return {'layout': layout, 'size': n, 'keys': keys, 'ranks': ranks}
+
+    # Листья — сам массив, дополненный наибольшим значением до целого числа узлов.
+    # Каждый следующий уровень хранит наибольший ключ каждого узла предыдущего
+    node_size = _btree_node_size(arr.dtype, node_bytes)
+    pad = _max_value(arr.dtype)
+    levels = []
+    keys = arr
+    while True:
+        n_nodes = max(1, -(-len(keys) // node_size))
+        level = np.full(n_nodes * node_size, pad, dtype=arr.dtype)
+        level[:len(keys)] = keys
+        levels.append(level.reshape(n_nodes, node_size))
+        if n_nodes == 1:
+            break
+        keys = levels[-1][:, -1]
+    return {'layout': layout, 'size': n, 'levels': levels, 'node_size': node_size}
+
+
+def _eytzinger_lower_bound(index, items):
+    """Позиции в keys первого элемента >= item (0 — такого элемента нет)."""
+    keys, n = index['keys'], index['size']
+    k = np.ones(len(items), dtype=np.int64)
+
+    # Все запросы спускаются на одинаковое число уровней; запросы, вышедшие
+    # за последний узел, стоят на месте. Спуск идёт уровень за уровнем сразу для
+    # всех запросов, поэтому верхние уровни читаются из кэша
+    for _ in range(int(n).bit_length()):
+        active = k <= n
+        k = np.where(active, 2 * k + (keys[np.minimum(k, n)] < items), k)
+
+    # Путь поиска: 1 — шаг вправо, 0 — влево. Ответ — узел, где был последний шаг
+    # влево: отбрасываем младшие единицы и ещё один бит
+    shift = np.log2(~k & (k + 1)).astype(np.int64) + 1
+    return k >> shift
+
+
+def _btree_lower_bound(index, items):
+    """Позиции в исходном массиве первого элемента >= item (size — такого элемента нет)."""
+    levels = index['levels']
+    node_size = index['node_size']
+    nodes = np.zeros(len(items), dtype=np.int64)
+    column = items[:, None]
+
+    # Спуск от корня: в узле считается, сколько ключей меньше item — это
+    # номер ребёнка, в котором продолжается поиск (сравнение всего узла без ветвлений)
+    for level in reversed(levels):
+        nodes = np.minimum(nodes, len(level) - 1)
+        child = np.count_nonzero(level[nodes] < column, axis=1)
+        nodes = nodes * node_size + child
+    return nodes
+
+
+def index_search_many(index, items):
+    """
+    Осуществляет поиск массива элементов по индексу из build_index.
+
+    Параметры:
+        index (dict): Индекс, построенный build_index.
+        items (list или numpy.ndarray): Элементы, которые необходимо найти.
+
+    Возвращает:
+        numpy.ndarray: Индексы найденных элементов в исходном массиве (первое
+        вхождение) или -999 для элементов, которых нет в массиве.
+    """
+
+    items = np.asarray(items).ravel()
+    if index['size'] == 0:
+        return np.full(len(items), -999, dtype=np.int64)
+
+    if index['layout'] == 'eytzinger':
+        k = _eytzinger_lower_bound(index, items)
+        found = (k != 0) & (index['keys'][k] == items)
+        return np.where(found, index['ranks'][k], -999)
+
+    positions = _btree_lower_bound(index, items)
+    leaves = index['levels'][0].ravel()
+    found = positions < index['size']
+    found[found] = leaves[positions[found]] == items[found]
+    return np.where(found, positions, -999)
+
+
+def index_search(index, item):
+    """
+    Осуществляет поиск элемента по индексу из build_index.
+
+    Возвращает:
+        int: Индекс найденного элемента в исходном массиве или -999, если элемент не найден.
+    """
+    return int(index_search_many(index, [item])[0])
@@ -0,0 +1,199 @@
+import heapq
+
+from .selection_sort import find_smallest
+from .sorting import INSERTION_MAX, insertion_sort, heapsort, _partition
+
+
+def nth_element(arr, n, low=0, high=None):
+    """
+    Переставляет элементы arr[low:high] на месте так, что arr[n] — тот элемент,
+    который стоял бы там после сортировки, слева от него — не большие, справа — не меньшие.
+
+    Интроспективный выбор (как std::nth_element в C++): быстрый выбор
+    (quickselect) с медианой трёх, который продолжает разбиение только
+    в той части, где лежит позиция n. Время O(n) в среднем; при глубине
+    больше 2·log2(n) (плохие опорные элементы) отрезок досортировывается
+    пирамидальной сортировкой, поэтому худший случай — O(n log n).
+
+    Параметры:
+        arr (list): Массив элементов (изменяется на месте).
+        n (int): Позиция, элемент для которой нужно найти.
+        low (int): Начало отрезка.
+        high (int, optional): Конец отрезка (не включается), по умолчанию len(arr).
+
+    Возвращает:
+        Элемент, оказавшийся в позиции n.
+    """
+
+    if high is None:
+        high = len(arr)
+    if not low <= n < high:
+        raise IndexError("Позиция n вне отрезка [low, high)")
+
+    depth = 2 * max(1, high - low).bit_length()
+    while high - low > INSERTION_MAX:
+        if depth == 0:
+            heapsort(arr, low, high)
+            return arr[n]
+        depth -= 1
+
+        # После разбиения все элементы левой части не больше элементов правой,
+        # поэтому n-й элемент находится в той части, куда попадает позиция n
+        p = _partition(arr, low, high)
+        if n < p:
+            high = p
+        else:
+            low = p
+
+    insertion_sort(arr, low, high)
+    return arr[n]
+
+
+class _Reversed:
+    """Обёртка, меняющая порядок сравнения на обратный (для поиска наибольших)."""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+
+class TopK:
+    """
+    k наименьших (или наибольших) элементов потока за один проход и O(k) памяти.
+
+    Элементы копятся в буфере до 2k штук; когда буфер заполнен, nth_element
+    за O(k) оставляет в нём k наименьших. Каждый такой шаг принимает k новых
+    элементов, поэтому весь поток обрабатывается за O(n), а итоговая
+    сортировка k элементов — за O(k log k). Элементы не меньше текущего k-го
+    отбрасываются одним сравнением, не попадая в буфер.
+
+    Из равных элементов остаются пришедшие раньше, как в sorted(...)[:k].
+
+    Пример:
+        leaders = TopK(10, key=lambda player: player['score'], largest=True)
+        for player in stream:
+            leaders.push(player)
+        leaders.result()
+    """
+
+    def __init__(self, k, key=None, largest=False):
+        """
+        Параметры:
+            k (int): Количество элементов.
+            key (callable, optional): Функция, по значению которой сравниваются элементы.
+            largest (bool): Искать наибольшие элементы вместо наименьших.
+        """
+        if k < 0:
+            raise ValueError("k не может быть отрицательным")
+        self.k = k
+        self.key = key
+        self.largest = largest
+        self.count = 0  # Сколько элементов просмотрено
+        self._buffer = []  # Тройки (ключ, номер, элемент): номер делает порядок устойчивым
+        self._threshold = None  # Ключ k-го элемента после последнего сжатия буфера
+
+    def push(self, item):
+        """Добавляет элемент потока."""
+        sort_key = item if self.key is None else self.key(item)
+        if self.largest:
+            sort_key = _Reversed(sort_key)
+        self.count += 1
+
+        # Равный k-му элементу тоже отбрасывается: он пришёл позже
+        if self._threshold is not None and not sort_key < self._threshold:
+            return
+
+        self._buffer.append((sort_key, self.count, item))
+        if len(self._buffer) >= 2 * self.k:
+            self._shrink()
+
+    def extend(self, items):
+        """Добавляет все элементы итерируемого объекта (то же, что push в цикле, но быстрее)."""
+        key, largest, buffer = self.key, self.largest, self._buffer
+        limit = 2 * self.k
+        threshold = self._threshold
+        count = self.count
+        for item in items:
+            sort_key = item if key is None else key(item)
+            if largest:
+                sort_key = _Reversed(sort_key)
+            count += 1
+            if threshold is not None and not sort_key < threshold:
+                continue
+            buffer.append((sort_key, count, item))
+            if len(buffer) >= limit:
+                self._shrink()
+                threshold = self._threshold
+        self.count = count
+
+    def _shrink(self):
+        if self.k == 0:
+            self._buffer.clear()
+            return
+        nth_element(self._buffer, self.k - 1)
+        del self._buffer[self.k:]
+        self._threshold = self._buffer[self.k - 1][0]
+
+    def result(self):
+        """
+        Возвращает:
+            list: k наименьших (наибольших) элементов в порядке возрастания (убывания).
+        """
+        if len(self._buffer) > self.k:
+            self._shrink()
+        return [item for _, _, item in sorted(self._buffer)]
+
+
+def find_k_smallest(items, k, key=None, method='select'):
+    """
+    Находит k наименьших элементов без сортировки всего массива.
+
+    Параметры:
+        items (iterable): Массив или любой итератор (читается один раз).
+        k (int): Количество элементов.
+        key (callable, optional): Функция, по значению которой сравниваются элементы.
+        method (str): Способ:
+            'select' — буфер из 2k элементов и nth_element (TopK): O(n + k log k)
+                       времени и O(k) памяти;
+            'heap'   — ограниченная куча heapq.nsmallest: O(n log k), быстрее
+                       при k намного меньше n.
+
+    Возвращает:
+        list: k наименьших элементов по возрастанию (из равных — пришедшие раньше).
+    """
+    return _find_k(items, k, key, method, largest=False)
+
+
+def find_k_largest(items, k, key=None, method='select'):
+    """
+    Находит k наибольших элементов без сортировки всего массива.
+
+    Параметры и сложность — как у find_k_smallest.
+
+    Возвращает:
+        list: k наибольших элементов по убыванию (из равных — пришедшие раньше).
+    """
+    return _find_k(items, k, key, method, largest=True)
+
+
+def _find_k(items, k, key, method, largest):
+    if method not in {'select', 'heap'}:
+        raise ValueError("method должен быть 'select' или 'heap'")
+
+    # Один наименьший элемент — это и есть find_smallest
+    if k == 1 and key is None and not largest and isinstance(items, list) and items:
+        return [items[find_smallest(items)]]
+
+    if method == 'heap':
+        return (heapq.nlargest if largest else heapq.nsmallest)(k, items, key=key)
+
+    top = TopK(k, key=key, largest=largest)
+    top.extend(items)
+    return top.result()
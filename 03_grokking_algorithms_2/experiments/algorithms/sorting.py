@@ -0,0 +1,358 @@
+import numpy as np
+
+from .selection_sort import selection_sort
+
+
+ALGORITHMS = ('selection', 'insertion', 'heap', 'intro', 'merge', 'radix', 'timsort')
+
+INSERTION_MAX = 16  # Отрезки не длиннее этого introsort и merge_sort досортировывают вставками
+RADIX_MIN = 4096  # С этого размера поразрядная сортировка списка чисел быстрее timsort (см. python -m benchmarks.sorting)
+
+
+def insertion_sort(arr, low=0, high=None):
+    """
+    Сортирует вставками на месте отрезок arr[low:high].
+
+    Время O(n²), но с очень маленькой константой: на коротких отрезках
+    быстрее всех остальных алгоритмов, поэтому ими досортировываются
+    короткие части в introsort и merge_sort. Сортировка устойчива.
+    """
+    if high is None:
+        high = len(arr)
+
+    for i in range(low + 1, high):
+        current = arr[i]
+        j = i - 1
+        # Сдвигаем вправо все элементы больше текущего
+        while j >= low and current < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = current
+
+
+def _sift_down(arr, low, root, size):
+    """Опускает элемент root кучи arr[low:low + size] на своё место."""
+    item = arr[low + root]
+    while True:
+        child = 2 * root + 1
+        if child >= size:
+            break
+        # Выбираем большего из двух детей
+        if child + 1 < size and arr[low + child] < arr[low + child + 1]:
+            child += 1
+        if not item < arr[low + child]:
+            break
+        arr[low + root] = arr[low + child]  # Поднимаем ребёнка вместо обмена
+        root = child
+    arr[low + root] = item
+
+
+def heapsort(arr, low=0, high=None):
+    """
+    Пирамидальная сортировка на месте отрезка arr[low:high].
+
+    Время O(n log n) в худшем случае, дополнительная память O(1).
+    Сортировка неустойчива.
+    """
+    if high is None:
+        high = len(arr)
+    size = high - low
+
+    # Построение max-кучи снизу вверх за O(n)
+    for root in range(size // 2 - 1, -1, -1):
+        _sift_down(arr, low, root, size)
+
+    # Наибольший элемент кучи переносится в конец, куча уменьшается на один
+    for end in range(size - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        _sift_down(arr, low, 0, end)
+
+
+def _partition(arr, low, high):
+    """
+    Разбиение Хоара отрезка arr[low:high] по медиане трёх.
+
+    Возвращает:
+        int: Граница p: все элементы arr[low:p] не больше опорного, arr[p:high] — не меньше.
+    """
+    last = high - 1
+    mid = (low + last) // 2
+
+    # Медиана первого, среднего и последнего элементов оказывается в середине
+    if arr[mid] < arr[low]:
+        arr[low], arr[mid] = arr[mid], arr[low]
+    if arr[last] < arr[low]:
+        arr[low], arr[last] = arr[last], arr[low]
+    if arr[last] < arr[mid]:
+        arr[mid], arr[last] = arr[last], arr[mid]
+    pivot = arr[mid]
+
+    i, j = low - 1, high
+    while True:
+        i += 1
+        while arr[i] < pivot:
+            i += 1
+        j -= 1
+        while pivot < arr[j]:
+            j -= 1
+        if i >= j:
+            return j + 1
+        arr[i], arr[j] = arr[j], arr[i]
+
+
+def _introsort(arr, low, high, depth):
+    while high - low > INSERTION_MAX:
+        # Слишком глубокая рекурсия — признак плохих опорных элементов:
+        # досортировываем отрезок пирамидальной сортировкой за гарантированные O(n log n)
+        if depth == 0:
+            heapsort(arr, low, high)
+            return
+        depth -= 1
+
+        p = _partition(arr, low, high)
+        # Рекурсия по меньшей части, цикл по большей — стек не глубже O(log n)
+        if p - low < high - p:
+            _introsort(arr, low, p, depth)
+            low = p
+        else:
+            _introsort(arr, p, high, depth)
+            high = p
+
+    insertion_sort(arr, low, high)
+
+
+def introsort(arr):
+    """
+    Интроспективная сортировка на месте (как std::sort в C++).
+
+    Быстрая сортировка с опорным элементом по медиане трёх; при глубине
+    рекурсии больше 2·log2(n) отрезок досортировывается пирамидальной
+    сортировкой, а короткие отрезки — вставками. Время O(n log n) в худшем
+    случае, дополнительная память O(log n). Сортировка неустойчива.
+    """
+    _introsort(arr, 0, len(arr), 2 * max(1, len(arr)).bit_length())
+
+
+def merge_sort(arr):
+    """
+    Сортирует массив слиянием (устойчиво: равные элементы сохраняют порядок).
+
+    Восходящая сортировка: отрезки по INSERTION_MAX элементов сортируются
+    вставками, затем сливаются попарно, удваиваясь на каждом проходе.
+    Слияние идёт между двумя заранее выделенными списками по очереди,
+    без срезов и выделения памяти на каждом шаге.
+
+    Параметры:
+        arr (list): Массив элементов для сортировки.
+
+    Возвращает:
+        list: Новый отсортированный массив.
+    """
+    source = list(arr)
+    n = len(source)
+    for start in range(0, n, INSERTION_MAX):
+        insertion_sort(source, start, min(start + INSERTION_MAX, n))
+
+    target = [None] * n
+    width = INSERTION_MAX
+    while width < n:
+        for low in range(0, n, 2 * width):
+            mid = min(low + width, n)
+            high = min(low + 2 * width, n)
+            i, j, k = low, mid, low
+            while i < mid and j < high:
+                # При равенстве берём элемент левой части — это и даёт устойчивость
+                if source[j] < source[i]:
+                    target[k] = source[j]
+                    j += 1
+                else:
+                    target[k] = source[i]
+                    i += 1
+                k += 1
+            # Остаток одной из частей переносится целиком
+            target[k:high] = source[i:mid] if i < mid else source[j:high]
+        source, target = target, source
+        width *= 2
+    return source
+
+
+def _radix_keys(values):
+    """
+    Беззнаковые целые ключи с тем же порядком, что и у чисел.
+
+    У знаковых целых инвертируется знаковый бит. У чисел с плавающей точкой
+    отрицательные числа инвертируются целиком, а у положительных
+    выставляется знаковый бит (порядок IEEE 754 совпадает с порядком целых).
+    """
+    kind = values.dtype.kind
+    if kind == 'b':
+        return values.view(np.uint8)
+    if kind == 'u':
+        return values
+
+    unsigned = np.dtype(f'u{values.dtype.itemsize}')
+    sign = unsigned.type(1 << (8 * values.dtype.itemsize - 1))
+    if kind == 'i':
+        return values.view(unsigned) ^ sign
+    if kind == 'f':
+        bits = values.view(unsigned)
+        return np.where(bits & sign, ~bits, bits | sign)
+    raise TypeError("Поразрядная сортировка поддерживает только целые числа и числа с плавающей точкой")
+
+
+def radix_argsort(values, digit_bits=16):
+    """
+    Устойчивая поразрядная сортировка (LSD): порядок индексов.
+
+    Ключи сдвигаются к нулю (вычитается наименьший), поэтому проходов
+    столько, сколько разрядов по digit_bits бит нужно на разброс значений,
+    а не на весь тип: числа до 10^9 — два прохода по 16 бит вместо восьми
+    по байту. На каждом проходе элементы устойчиво раскладываются по очередному
+    разряду (сортировка подсчётом, O(n)); проходы, где разряд у всех элементов
+    одинаков, пропускаются.
+
+    Параметры:
+        values (numpy.ndarray): Одномерный массив целых чисел или чисел с плавающей точкой.
+        digit_bits (int): Размер разряда: 8 или 16 бит.
+
+    Возвращает:
+        numpy.ndarray: Индексы, упорядочивающие values по возрастанию.
+    """
+    if digit_bits not in {8, 16}:
+        raise ValueError("digit_bits должен быть 8 или 16")
+
+    keys = _radix_keys(np.asarray(values).ravel())
+    order = np.arange(len(keys))
+    if len(keys) < 2:
+        return order
+
+    keys = (keys - keys.min()).astype(np.uint64, copy=False)
+    digit_type = np.uint8 if digit_bits == 8 else np.uint16
+    mask = keys.dtype.type((1 << digit_bits) - 1)
+    for shift in range(0, int(keys.max()).bit_length(), digit_bits):
+        digits = ((keys >> keys.dtype.type(shift)) & mask).astype(digit_type)
+        if digits.min() == digits.max():
+            continue
+        # Устойчивая сортировка 8- и 16-битных ключей в NumPy — сортировка подсчётом
+        order = order[np.argsort(digits[order], kind='stable')]
+    return order
+
+
+def radix_sort(arr):
+    """
+    Поразрядная сортировка целых чисел и чисел с плавающей точкой (устойчивая).
+
+    Параметры:
+        arr (list или numpy.ndarray): Массив чисел.
+
+    Возвращает:
+        list или numpy.ndarray: Новый отсортированный массив того же вида, что и arr.
+
+    Примечание:
+        Список переводится в массив NumPy, поэтому в смешанном списке целых
+        и дробных чисел целые вернутся как float.
+    """
+    values = np.asarray(arr)
+    result = values[radix_argsort(values)]
+    return result if isinstance(arr, np.ndarray) else result.tolist()
+
+
+def _is_numeric(values):
+    """
+    Можно ли сортировать values поразрядно, не меняя элементов.
+
+    Массив NumPy — если он одномерный и числовой. Список — только если все
+    элементы одного типа (все int, все float или все bool) и массив NumPy
+    из него возвращается tolist() к тем же значениям: целые должны
+    помещаться в int64/uint64, иначе NumPy сделал бы их float или object.
+    """
+    if isinstance(values, np.ndarray):
+        return values.ndim == 1 and values.dtype.kind in 'biuf'
+
+    types = set(map(type, values))
+    if len(types) != 1:
+        return False
+    item_type = types.pop()
+    if item_type not in (int, float, bool):
+        return False
+    try:
+        values = np.asarray(values)
+    except (OverflowError, TypeError, ValueError):
+        return False
+    kinds = {int: 'iu', float: 'f', bool: 'b'}[item_type]
+    return values.ndim == 1 and values.dtype.kind in kinds
+
+
+def _choose_algorithm(values):
+    """Алгоритм для algorithm='auto' по точкам пересечения из benchmarks.sorting."""
+    if len(values) >= RADIX_MIN and _is_numeric(values):
+        return 'radix'
+    return 'timsort'
+
+
+def sort(arr, algorithm='auto', key=None, in_place=False):
+    """
+    Сортирует массив выбранным алгоритмом.
+
+    Параметры:
+        arr (list или numpy.ndarray): Массив элементов для сортировки.
+        algorithm (str): Алгоритм:
+            'selection' — selection_sort, эталонная реализация, O(n²);
+            'insertion' — вставками, O(n²), быстрее всех на коротких массивах;
+            'heap'      — пирамидальная, O(n log n), неустойчивая;
+            'intro'     — интроспективная, O(n log n), неустойчивая;
+            'merge'     — слиянием, O(n log n), устойчивая;
+            'radix'     — поразрядная, O(n), только для чисел, устойчивая;
+            'timsort'   — встроенная sorted, O(n log n), устойчивая;
+            'auto'      — 'radix' для чисел от RADIX_MIN элементов, если перевод
+                          в массив NumPy не меняет ни значений, ни типов элементов
+                          (например, список из одних int в пределах int64), иначе 'timsort'.
+        key (callable, optional): Функция, по значению которой сравниваются элементы
+            (как в sorted). С key сортировка устойчива для всех алгоритмов.
+        in_place (bool): Отсортировать сам arr и вернуть его.
+
+    Возвращает:
+        list или numpy.ndarray: Отсортированный массив (новый, если не in_place).
+    """
+
+    if algorithm != 'auto' and algorithm not in ALGORITHMS:
+        raise ValueError(f"algorithm должен быть 'auto' или одним из: {', '.join(ALGORITHMS)}")
+
+    is_array = isinstance(arr, np.ndarray)
+    keys = arr if key is None else [key(item) for item in arr]
+    if algorithm == 'auto':
+        algorithm = _choose_algorithm(keys)
+
+    if algorithm == 'radix':
+        values = np.asarray(keys)
+        order = radix_argsort(values)
+        if is_array:
+            result = arr[order]
+        elif key is None:
+            # Обратно в список через массив: tolist быстрее, чем выборка
+            # элементов списка в случайном порядке
+            result = values[order].tolist()
+        else:
+            result = [arr[i] for i in order.tolist()]
+    elif algorithm == 'timsort':
+        result = sorted(arr, key=key)
+    elif key is not None:
+        # Сортируются пары (ключ, номер): номер делает сравнение устойчивым
+        # и не даёт сравнивать сами элементы
+        decorated = sort([(k, i) for i, k in enumerate(keys)], algorithm)
+        result = [arr[i] for _, i in decorated]
+    elif algorithm == 'selection':
+        result = selection_sort(arr)
+    elif algorithm == 'merge':
+        result = merge_sort(arr)
+    else:
+        result = list(arr)
+        {'insertion': insertion_sort, 'heap': heapsort, 'intro': introsort}[algorithm](result)
+
+    if is_array and not isinstance(result, np.ndarray):
+        result = np.asarray(result, dtype=arr.dtype)
+
+    if in_place:
+        arr[:] = result
+        return arr
+    return result
@@ -0,0 +1,66 @@
+# benchmarks/parallel_sort.py
+
+
+"""
+Масштабирование parallel_sort от 1 до N процессов.
+
+Запуск из папки experiments:
+
+    python -m benchmarks.parallel_sort
+    python -m benchmarks.parallel_sort --size 50000000 --workers 1 2 4 8
+
+Для каждого числа процессов пул запускается заранее, поэтому в замер
+не входит запуск процессов. Ускорение считается относительно numpy.sort
+в одном процессе, эффективность — это ускорение, делённое на число процессов
+(1.0 — идеальное масштабирование).
+"""
+
+import os
+import sys
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from algorithms.parallel_sort import parallel_sort
+from benchmarks.timing import time_call, format_seconds
+
+
+def main(argv=None):
+    cores = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="Масштабирование параллельной сортировки")
+    parser.add_argument('--size', type=int, default=20_000_000, help="Размер массива")
+    parser.add_argument('--workers', nargs='+', type=int,
+                        default=sorted({1, 2, 4, cores} | {w for w in (8, 16) if w <= cores}),
+                        help="Количество процессов")
+    parser.add_argument('--dtype', default='float64')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    arr = (rng.random(args.size) * 1e9).astype(args.dtype)
+    expected = np.sort(arr)
+
+    baseline = time_call(lambda: np.sort(arr), args.repeat, min_time=0)
+    rows = []
+    for workers in args.workers:
+        print(f"  процессов: {workers}…", file=sys.stderr)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            assert np.array_equal(parallel_sort(arr, workers, pool=pool), expected)
+            seconds = time_call(lambda: parallel_sort(arr, workers, pool=pool), args.repeat, min_time=0)
+        rows.append({
+            'Процессов': workers,
+            'Время': format_seconds(seconds),
+            'Ускорение': f"{baseline / seconds:.2f}x",
+            'Эффективность': f"{baseline / seconds / workers:.2f}"
+        })
+
+    print(f"Ядер: {cores}, размер: {args.size}, numpy.sort в одном процессе: {format_seconds(baseline)}")
+    print(pd.DataFrame(rows).to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
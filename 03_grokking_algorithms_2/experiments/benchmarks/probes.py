@@ -0,0 +1,86 @@
+# benchmarks/probes.py
+
+
+"""
+Количество проб и время поиска: бинарный, интерполяционный поиск и обученный индекс.
+
+Запуск из папки experiments:
+
+    python -m benchmarks.probes
+    python -m benchmarks.probes --size 10000000 --queries 5000
+
+Данные — равномерно распределённые числа (как метки времени и идентификаторы)
+и логнормальные (сильно неравномерные, на них интерполяция проигрывает
+и должна переходить на бинарный поиск).
+"""
+
+import sys
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from algorithms.binary_search import binary_search, binary_search_many
+from algorithms.learned_search import (
+    build_learned_index, interpolation_search, learned_search, learned_search_many, probe_statistics
+)
+from benchmarks.timing import time_call, format_seconds
+
+
+def make_datasets(size, seed=0):
+    """Отсортированные массивы с разным распределением значений."""
+    rng = np.random.default_rng(seed)
+    return {
+        'равномерное': np.sort(rng.integers(0, 1_000 * size, size)),
+        'логнормальное': np.sort(rng.lognormal(0, 2, size))
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Пробы и время поиска по отсортированному массиву")
+    parser.add_argument('--size', type=int, default=1_000_000, help="Размер массива")
+    parser.add_argument('--queries', type=int, default=2_000, help="Количество запросов для подсчёта проб")
+    parser.add_argument('--segment-size', type=int, default=1024, help="Размер сегмента обученного индекса")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    probe_rows, time_rows = [], []
+    for name, arr in make_datasets(args.size, args.seed).items():
+        queries = arr[rng.integers(0, len(arr), args.queries)]
+        index = build_learned_index(arr, segment_size=args.segment_size)
+
+        for method, stats in probe_statistics(arr, queries, index).items():
+            probe_rows.append({'Данные': name, 'Поиск': method, **stats})
+
+        table = arr.tolist()
+        loop_queries = queries.tolist()
+        many_queries = arr[rng.integers(0, len(arr), 100_000)]
+        time_rows.append({
+            'Данные': name,
+            'binary_search': time_call(lambda: [binary_search(table, x) for x in loop_queries], 3)
+            / len(loop_queries),
+            'interpolation_search': time_call(lambda: [interpolation_search(table, x) for x in loop_queries], 3)
+            / len(loop_queries),
+            'learned_search': time_call(lambda: [learned_search(index, x) for x in loop_queries], 3)
+            / len(loop_queries),
+            'binary_search_many': time_call(lambda: binary_search_many(arr, many_queries), 3)
+            / len(many_queries),
+            'learned_search_many': time_call(lambda: learned_search_many(index, many_queries), 3)
+            / len(many_queries),
+            'Сегменты с переходом на бинарный поиск': f"{int(index['fallback'].sum())} из {len(index['fallback'])}"
+        })
+
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print("Пробы на запрос:")
+        print(pd.DataFrame(probe_rows).to_string(index=False))
+        print("\nВремя на запрос:")
+        frame = pd.DataFrame(time_rows).set_index('Данные')
+        timed = frame.columns[:-1]
+        frame[timed] = frame[timed].map(format_seconds)
+        print(frame.to_string())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+# benchmarks/search.py
+
+
+"""
+Сравнение поиска по отсортированному массиву: binary_search, binary_search_many
+и индексы из algorithms.search_index (Эйцингер и статическое B+-дерево).
+
+Запуск из папки experiments:
+
+    python -m benchmarks.search                         # 1e3 … 1e7
+    python -m benchmarks.search --sizes 1000 100000000  # до 1e8 (нужно ~4 ГБ памяти)
+
+Для каждого размера массива ищутся одни и те же случайные запросы (половина
+есть в массиве); в таблице — время на один запрос. binary_search вызывается
+в цикле по списку Python; массивы больше --list-max не переводятся в список,
+и binary_search идёт по массиву NumPy.
+"""
+
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from algorithms.binary_search import binary_search, binary_search_many
+from algorithms.search_index import build_index, index_search_many
+from benchmarks.timing import time_call, format_seconds
+
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def make_data(size, n_queries, seed=0):
+    """Отсортированный массив уникальных чисел и запросы: половина попаданий, половина промахов."""
+    rng = np.random.default_rng(seed)
+    # Чётные числа со случайными пропусками: нечётные запросы гарантированно не найдутся
+    arr = 2 * np.cumsum(rng.integers(1, 4, size, dtype=np.int64))
+    hits = arr[rng.integers(0, size, n_queries // 2)]
+    misses = 2 * rng.integers(0, arr[-1] // 2, n_queries - len(hits)) + 1
+    return arr, rng.permutation(np.concatenate([hits, misses]))
+
+
+def bench_size(size, n_queries=100_000, n_loop_queries=10_000, list_max=10_000_000,
+               repeat=3, min_time=0.05, seed=0):
+    """
+    Замеры для одного размера массива.
+
+    Возвращает:
+        dict: Время на запрос для каждого способа поиска и время построения индексов.
+    """
+    arr, queries = make_data(size, n_queries, seed)
+    table = arr.tolist() if size <= list_max else arr
+    loop_queries = queries[:n_loop_queries].tolist()
+
+    row = {'Размер': size}
+    row['binary_search'] = time_call(
+        lambda: [binary_search(table, item) for item in loop_queries], repeat, min_time
+    ) / len(loop_queries)
+    row['binary_search_many'] = time_call(
+        lambda: binary_search_many(arr, queries), repeat, min_time
+    ) / n_queries
+
+    for layout in ('eytzinger', 'btree'):
+        started = time.perf_counter()
+        index = build_index(arr, layout)
+        row[f'Построение {layout}'] = time.perf_counter() - started
+        row[layout] = time_call(lambda: index_search_many(index, queries), repeat, min_time) / n_queries
+
+        # Проверка: все способы дают одинаковый ответ
+        assert np.array_equal(index_search_many(index, queries), binary_search_many(arr, queries))
+        del index
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры поиска по отсортированному массиву")
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES, help="Размеры массива")
+    parser.add_argument('--queries', type=int, default=100_000, help="Количество запросов")
+    parser.add_argument('--loop-queries', type=int, default=10_000,
+                        help="Количество запросов для binary_search в цикле")
+    parser.add_argument('--list-max', type=int, default=10_000_000,
+                        help="Наибольший размер, для которого binary_search идёт по списку")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rows = []
+    for size in args.sizes:
+        print(f"  размер {size}…", file=sys.stderr)
+        rows.append(bench_size(size, args.queries, args.loop_queries, args.list_max,
+                               args.repeat, seed=args.seed))
+
+    frame = pd.DataFrame(rows).set_index('Размер')
+    print("Время на запрос:")
+    print(frame[['binary_search', 'binary_search_many', 'eytzinger', 'btree']].map(format_seconds).to_string())
+    print("\nУскорение относительно binary_search:")
+    speedup = frame[['binary_search_many', 'eytzinger', 'btree']].rdiv(frame['binary_search'], axis=0)
+    print(speedup.map(lambda x: f"{x:.1f}x").to_string())
+    print("\nПостроение индекса:")
+    print(frame[['Построение eytzinger', 'Построение btree']].map(format_seconds).to_string())
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+# benchmarks/sorting.py
+
+
+"""
+Сравнение алгоритмов сортировки из algorithms.sorting и точки пересечения:
+с какого размера массива один алгоритм становится быстрее другого.
+
+Запуск из папки experiments:
+
+    python -m benchmarks.sorting
+    python -m benchmarks.sorting --data floats --max-size 100000
+
+Данные — список Python случайных чисел. Квадратичные алгоритмы замеряются
+только до QUADRATIC_MAX элементов, алгоритмы на чистом Python — до PYTHON_MAX.
+"""
+
+import sys
+import argparse
+
+import numpy as np
+import pandas as pd
+
+from algorithms.sorting import ALGORITHMS, sort
+from benchmarks.timing import time_call, format_seconds
+
+
+SIZES = (8, 16, 32, 64, 128, 256, 512, 1_024, 4_096, 16_384, 65_536, 262_144, 1_048_576)
+
+QUADRATIC_MAX = 4_096
+PYTHON_MAX = 262_144
+LIMITS = {'selection': QUADRATIC_MAX, 'insertion': QUADRATIC_MAX,
+          'heap': PYTHON_MAX, 'intro': PYTHON_MAX, 'merge': PYTHON_MAX}
+
+# Пары (медленный на больших массивах, быстрый на больших массивах)
+PAIRS = (('insertion', 'intro'), ('selection', 'intro'), ('insertion', 'merge'),
+         ('heap', 'intro'), ('timsort', 'radix'), ('insertion', 'timsort'))
+
+
+def make_data(size, data='ints', seed=0):
+    rng = np.random.default_rng(seed)
+    if data == 'floats':
+        return rng.normal(0, 1, size).tolist()
+    if data == 'sorted':
+        return list(range(size))
+    return rng.integers(-10 ** 9, 10 ** 9, size).tolist()
+
+
+def crossover(times, slow, fast):
+    """
+    Наименьший размер, начиная с которого fast быстрее slow на всех замеренных размерах.
+
+    Возвращает:
+        int или None: Размер или None, если fast так и не обогнал slow.
+    """
+    both = times[[slow, fast]].dropna()
+    faster = both[fast] < both[slow]
+    if not faster.any() or not faster.iloc[-1]:
+        return None
+    # Последний размер, где fast ещё не быстрее, и следующий за ним
+    slower = faster[~faster]
+    return int(faster.index[0] if slower.empty else faster.index[faster.index > slower.index[-1]][0])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Замеры алгоритмов сортировки")
+    parser.add_argument('--sizes', nargs='+', type=int, default=SIZES)
+    parser.add_argument('--max-size', type=int, help="Пропускать размеры больше этого")
+    parser.add_argument('--data', choices=('ints', 'floats', 'sorted'), default='ints')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in args.sizes if args.max_size is None or size <= args.max_size]
+    rows = []
+    for size in sizes:
+        print(f"  размер {size}…", file=sys.stderr)
+        data = make_data(size, args.data, args.seed)
+        expected = sorted(data)
+        row = {'Размер': size}
+        for algorithm in ALGORITHMS:
+            if size > LIMITS.get(algorithm, size):
+                continue
+            assert sort(data, algorithm) == expected, algorithm
+            row[algorithm] = time_call(lambda: sort(data, algorithm), args.repeat, min_time=0.02)
+        rows.append(row)
+
+    times = pd.DataFrame(rows).set_index('Размер')
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print("Время сортировки:")
+        print(times.map(lambda x: format_seconds(x) if pd.notna(x) else '—').to_string())
+
+    print("\nТочки пересечения (с какого размера второй алгоритм быстрее первого):")
+    for slow, fast in PAIRS:
+        size = crossover(times, slow, fast)
+        print(f"  {slow} → {fast}: {size if size is not None else 'не обгоняет'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,43 @@
+# benchmarks/timing.py
+
+
+import time
+
+
+def time_call(func, repeat=5, min_time=0.05):
+    """
+    Замеряет время одного вызова функции.
+
+    Количество вызовов в серии подбирается так, чтобы серия шла не меньше
+    min_time секунд; результат — лучшая из repeat серий (наименее зашумлённая).
+
+    Возвращает:
+        float: Время одного вызова в секундах.
+    """
+    func()  # Прогрев: импорты, кеши, выделение памяти
+
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 10 if elapsed < min_time / 10 else 2
+
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - started) / loops)
+    return best
+
+
+def format_seconds(seconds):
+    """Время в удобных единицах: нс, мкс, мс или с."""
+    for unit, scale in (('с', 1), ('мс', 1e-3), ('мкс', 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} нс"